@@ -0,0 +1,104 @@
+"""
+Load benchmark: blocking vs non-blocking category repository under concurrency.
+
+Runs CategoryReadUseCase.get_category concurrently against two stand-ins that
+simulate the same Mongo round-trip latency:
+
+* ``blocking``  - the previous behaviour, a synchronous driver call (time.sleep)
+  made from inside a coroutine, which stalls the whole event loop;
+* ``async``     - MongoCategoryRepository (Motor based) wired to an in-memory
+  collection whose calls await asyncio.sleep.
+
+Usage:
+    python benchmarks/bench_async_repository.py [--latency-ms 5] [--requests 200]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from application.use_cases.category_read_use_case import CategoryReadUseCase  # noqa: E402
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import (  # noqa: E402
+    MongoCategoryRepository,
+)
+
+DOCUMENT = {"_id": "bench-id", "name": "Benchmark", "description": "Stand-in document"}
+
+
+class AsyncCollectionStandIn:
+    """Minimal Motor collection stand-in with a simulated network round-trip"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def find_one(self, query):
+        await asyncio.sleep(self.latency)
+        return dict(DOCUMENT)
+
+
+class BlockingRepositoryStandIn:
+    """Repository that performs a blocking driver call, like the old pymongo adapter"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def find_by_id(self, category_id: CategoryId):
+        time.sleep(self.latency)
+        return Category(id=CategoryId(DOCUMENT["_id"]), name=DOCUMENT["name"],
+                        description=DOCUMENT["description"])
+
+
+async def run(use_case: CategoryReadUseCase, requests: int, concurrency: int):
+    """Send ``requests`` in waves of ``concurrency`` simultaneous arrivals.
+
+    Latency is measured from the moment a wave arrives, so time spent waiting
+    for a stalled event loop is included, as it would be for a real client.
+    """
+    latencies = []
+
+    async def one_request(arrived: float):
+        await use_case.get_category(CategoryId(DOCUMENT["_id"]))
+        latencies.append(time.perf_counter() - arrived)
+
+    await use_case.get_category(CategoryId(DOCUMENT["_id"]))  # warm-up, not measured
+    started = time.perf_counter()
+    for _ in range(max(1, requests // concurrency)):
+        arrived = time.perf_counter()
+        await asyncio.gather(*(one_request(arrived) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+    return len(latencies) / elapsed, statistics.median(latencies), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    async_repository = MongoCategoryRepository("mongodb://localhost:27017", "benchmark")
+    async_repository.collection = AsyncCollectionStandIn(latency)
+    repositories = {
+        "blocking": BlockingRepositoryStandIn(latency),
+        "async": async_repository,
+    }
+
+    print(f"{'repository':<10} {'concurrency':>11} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for concurrency in (1, 10, 50, 100):
+        for name, repository in repositories.items():
+            throughput, p50, p99 = asyncio.run(run(CategoryReadUseCase(repository), args.requests, concurrency))
+            print(f"{name:<10} {concurrency:>11} {throughput:>10.0f} {p50 * 1000:>8.1f} {p99 * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
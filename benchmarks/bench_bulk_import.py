@@ -0,0 +1,129 @@
+"""
+Throughput benchmark: importing categories one by one vs through the bulk path.
+
+Runs CategoryWriteUseCase + CachedCategoryRepository against stand-ins that
+charge a fixed round-trip latency per call plus a small per-item cost:
+MongoDB (insert_one vs insert_many), Redis (one write-through script per
+item vs one per batch) and the event publisher (one publish per item vs
+one batch per request).
+
+Usage:
+    python benchmarks/bench_bulk_import.py [--items 10000] [--batch 1000] [--mongo-ms 0.5] [--redis-ms 0.2]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.value_objects.bulk_item_result import BulkItemResult, BulkItemStatus  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from application.dtos.create_category_dto import CreateCategoryDTO  # noqa: E402
+from application.use_cases.category_write_use_case import CategoryWriteUseCase  # noqa: E402
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository  # noqa: E402
+
+# Server-side cost of one extra document/key inside a batched call
+PER_ITEM_COST = 2e-6
+
+
+class MongoStandIn:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+
+    async def create(self, category):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        category.id = CategoryId.new()
+        return category
+
+    async def create_many(self, categories):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency + PER_ITEM_COST * len(categories))
+        return [
+            BulkItemResult(index, CategoryId.new(), BulkItemStatus.CREATED)
+            for index in range(len(categories))
+        ]
+
+
+class RedisStandIn:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+
+    async def write_through(self, key, version_key, field, value, item_key, expire=3600):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        return self.round_trips
+
+    async def write_through_many(self, key, version_key, items, expire=3600):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency + PER_ITEM_COST * len(items))
+        return self.round_trips
+
+
+class PublisherStandIn:
+    """Event publisher: a fixed cost per call plus a small per-event cost"""
+
+    def __init__(self, call_cost: float):
+        self.call_cost = call_cost
+        self.calls = 0
+
+    async def publish_category_created(self, category):
+        self.calls += 1
+        await asyncio.sleep(self.call_cost)
+
+    async def publish_categories_created(self, categories):
+        self.calls += 1
+        await asyncio.sleep(self.call_cost + PER_ITEM_COST * len(categories))
+
+
+def build(mongo_latency: float, redis_latency: float, publish_cost: float):
+    mongo = MongoStandIn(mongo_latency)
+    redis = RedisStandIn(redis_latency)
+    publisher = PublisherStandIn(publish_cost)
+    use_case = CategoryWriteUseCase(CachedCategoryRepository(mongo, redis), publisher)
+    return use_case, mongo, redis, publisher
+
+
+async def run(items: int, batch: int, mongo_latency: float, redis_latency: float, publish_cost: float):
+    names = [f"Imported {index}" for index in range(items)]
+
+    use_case, mongo, redis, publisher = build(mongo_latency, redis_latency, publish_cost)
+    started = time.perf_counter()
+    for name in names:
+        await use_case.create_category(name)
+    single_time = time.perf_counter() - started
+    single = (mongo.round_trips, redis.round_trips, publisher.calls)
+
+    use_case, mongo, redis, publisher = build(mongo_latency, redis_latency, publish_cost)
+    started = time.perf_counter()
+    for offset in range(0, items, batch):
+        await use_case.create_categories([CreateCategoryDTO(name=name) for name in names[offset:offset + batch]])
+    bulk_time = time.perf_counter() - started
+    bulk = (mongo.round_trips, redis.round_trips, publisher.calls)
+
+    print(f"{items} categories, batch of {batch}")
+    print(f"{'path':<10} {'items/s':>10} {'mongo':>7} {'redis':>7} {'publish':>8}")
+    print(f"{'single':<10} {items / single_time:>10.0f} {single[0]:>7} {single[1]:>7} {single[2]:>8}")
+    print(f"{'bulk':<10} {items / bulk_time:>10.0f} {bulk[0]:>7} {bulk[1]:>7} {bulk[2]:>8}")
+    print(f"speed-up: {single_time / bulk_time:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--mongo-ms", type=float, default=0.5)
+    parser.add_argument("--redis-ms", type=float, default=0.2)
+    parser.add_argument("--publish-us", type=float, default=100.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.batch, args.mongo_ms / 1000, args.redis_ms / 1000, args.publish_us / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Load benchmark: a burst of concurrent misses on one hot cache key.
+
+Simulates several workers (each with its own CachedCategoryRepository and
+StampedeGuard) sharing one Redis stand-in, fires N concurrent find_all()
+calls at an empty cache and counts how many full scans reach the backend:
+without protection every miss recomputes, with StampedeGuard one worker
+recomputes and the rest wait for its snapshot.
+
+Usage:
+    python benchmarks/bench_cache_stampede.py [--requests 1000] [--workers 4] [--scan-ms 50]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository  # noqa: E402
+from infrastructure.adapters.outbound.cache.stampede_guard import StampedeGuard  # noqa: E402
+
+
+class SharedCacheStandIn:
+    """Redis stand-in shared by all simulated workers (snapshots, versions and SET NX locks)"""
+
+    def __init__(self):
+        self.snapshots = {}
+        self.versions = {}
+        self.locks = {}
+
+    async def get_snapshot_with_ttl(self, key):
+        await asyncio.sleep(0)
+        snapshot = self.snapshots.get(key)
+        return (dict(snapshot), 300.0) if snapshot is not None else (None, None)
+
+    async def get_snapshot(self, key):
+        snapshot, _ = await self.get_snapshot_with_ttl(key)
+        return snapshot
+
+    async def put_snapshot(self, key, version_key, entries, expected_version, expire=3600):
+        if self.versions.get(version_key, 0) != expected_version:
+            return False
+        self.snapshots[key] = dict(entries)
+        return True
+
+    async def get_version(self, version_key):
+        return self.versions.get(version_key, 0)
+
+    async def acquire_lock(self, key, ttl):
+        if key in self.locks:
+            return None
+        token = uuid.uuid4().hex
+        self.locks[key] = token
+        return token
+
+    async def release_lock(self, key, token):
+        if self.locks.get(key) != token:
+            return False
+        del self.locks[key]
+        return True
+
+
+class SlowRepository:
+    """CategoryRepository stand-in whose full scan takes a fixed time"""
+
+    def __init__(self, scan_time: float, size: int = 100):
+        self.scan_time = scan_time
+        self.calls = 0
+        self.categories = [
+            Category(id=CategoryId(f"id-{i:04d}"), name=f"Category {i}", description=None)
+            for i in range(size)
+        ]
+
+    async def find_all(self):
+        self.calls += 1
+        await asyncio.sleep(self.scan_time)
+        return list(self.categories)
+
+
+class UnguardedStampedeGuard(StampedeGuard):
+    """Baseline without protection: every miss goes to the backend"""
+
+    async def load(self, key, compute, read_cached=None):
+        return await compute()
+
+    async def refresh_early(self, key, compute):
+        return None
+
+
+async def run_burst(guard_class, requests: int, workers: int, scan_time: float):
+    cache = SharedCacheStandIn()
+    backend = SlowRepository(scan_time)
+    repositories = [
+        CachedCategoryRepository(backend, cache, guard_class(cache, lock_ttl=5.0, poll_interval=0.005))
+        for _ in range(workers)
+    ]
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        repositories[i % workers].find_all() for i in range(requests)
+    ))
+    elapsed = time.perf_counter() - started
+    assert all(len(result) == len(backend.categories) for result in results)
+    return backend.calls, elapsed
+
+
+async def run(requests: int, workers: int, scan_time: float):
+    print(f"{requests} concurrent misses, {workers} workers, {scan_time * 1000:.0f} ms per full scan")
+    print(f"{'mode':<12} {'backend calls':>14} {'wall ms':>10}")
+    for label, guard_class in (("naive", UnguardedStampedeGuard), ("guarded", StampedeGuard)):
+        calls, elapsed = await run_burst(guard_class, requests, workers, scan_time)
+        print(f"{label:<12} {calls:>14} {elapsed * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--scan-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.workers, args.scan_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
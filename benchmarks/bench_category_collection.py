@@ -0,0 +1,101 @@
+"""
+Benchmark: find_all result as a list of Category objects vs CategoryCollection.
+
+Rows are generated one at a time as fresh MongoDB-shaped documents, like a
+cursor delivers them, and turned into:
+
+* ``list``       - one Category (and CategoryId) per row, the former find_all result;
+* ``collection`` - CategoryCollection packed by CategoryCollectionBuilder.
+
+For each it reports the memory retained by the result (tracemalloc), the
+build time, the number of garbage collector runs during the build, and the
+time of the in-memory statistics (CategoryStatisticsEngine) and of the list
+endpoint items (category_items) over the result.
+
+Usage:
+    python benchmarks/bench_category_collection.py [--sizes 100000 1000000]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from domain.value_objects.category_collection import CategoryCollection, CategoryCollectionBuilder  # noqa: E402
+from domain.services.category_statistics_engine import CategoryStatisticsEngine  # noqa: E402
+from infrastructure.adapters.inbound.rest.responses import category_items  # noqa: E402
+
+
+def documents(size: int):
+    for index in range(size):
+        yield {"_id": f"{index:08d}-5f0c-4a7e-9b1d-2c3e4f5a6b7c", "name": f"Category {index}",
+               "description": f"Description of category {index}" if index % 4 else None}
+
+
+def build_list(size: int):
+    return [
+        Category.trusted(CategoryId.trusted(doc["_id"]), doc["name"], doc.get("description"))
+        for doc in documents(size)
+    ]
+
+
+def build_collection(size: int):
+    builder = CategoryCollectionBuilder()
+    for doc in documents(size):
+        builder.append(doc["_id"], doc["name"], doc.get("description"))
+    return builder.build()
+
+
+def statistics_of(categories):
+    engine = CategoryStatisticsEngine()
+    if isinstance(categories, CategoryCollection):
+        return engine.calculate_statistics(categories.names, categories.name_lengths)
+    return engine.calculate_category_statistics(categories)
+
+
+def gc_runs() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'result':>11} {'memory MB':>10} {'build ms':>9} {'gc runs':>8} "
+          f"{'stats ms':>9} {'items ms':>9}")
+    for size in args.sizes:
+        for name, build in (("list", build_list), ("collection", build_collection)):
+            gc.collect()
+            tracemalloc.start()
+            result = build(size)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del result
+
+            gc.collect()
+            runs = gc_runs()
+            result, build_time = timed(build, size)
+            runs = gc_runs() - runs
+            _, stats_time = timed(statistics_of, result)
+            _, items_time = timed(category_items, result)
+            print(f"{size:>9} {name:>11} {memory / 2 ** 20:>10.1f} {build_time * 1000:>9.0f} {runs:>8} "
+                  f"{stats_time * 1000:>9.1f} {items_time * 1000:>9.0f}")
+            del result
+
+
+if __name__ == "__main__":
+    main()
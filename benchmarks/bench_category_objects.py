@@ -0,0 +1,104 @@
+"""
+Benchmark: memory and construction cost of Category/CategoryId objects.
+
+Builds categories from MongoDB-shaped rows ({"_id", "name", "description"}):
+
+* ``dataclass`` - the previous representation: plain dataclasses with a
+  per-instance __dict__, validated in __post_init__ (copied below);
+* ``slotted``   - the current slotted Category/CategoryId, through the
+  validating constructors (untrusted input);
+* ``trusted``   - the current types through Category.trusted and
+  CategoryId.trusted, as the repositories build rows read from storage.
+
+Memory is what tracemalloc sees allocated for the objects of --count rows
+(the row dicts and strings are shared and not counted).
+
+Usage:
+    python benchmarks/bench_category_objects.py [--count 100000] [--repeats 5]
+"""
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+
+
+@dataclass(frozen=True)
+class DataclassCategoryId:
+    value: str
+
+    def __post_init__(self):
+        if not self.value:
+            raise ValueError("Category ID cannot be empty")
+
+
+@dataclass
+class DataclassCategory:
+    id: Optional[DataclassCategoryId]
+    name: str
+    description: Optional[str] = None
+
+    def __post_init__(self):
+        if not self.name:
+            raise ValueError("Category name cannot be empty")
+
+
+BUILDERS = {
+    "dataclass": lambda doc: DataclassCategory(DataclassCategoryId(doc["_id"]), doc["name"], doc.get("description")),
+    "slotted": lambda doc: Category(CategoryId(doc["_id"]), doc["name"], doc.get("description")),
+    "trusted": lambda doc: Category.trusted(CategoryId.trusted(doc["_id"]), doc["name"], doc.get("description")),
+}
+
+
+def measure_memory(build, docs) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(doc) for doc in docs]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def measure_time(build, docs, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        objects = [build(doc) for doc in docs]
+        timings.append(time.perf_counter() - started)
+        del objects
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    docs = [
+        {"_id": f"id-{index:08d}", "name": f"Category {index}", "description": f"Description {index}"}
+        for index in range(args.count)
+    ]
+    print(f"{args.count} categories, construction time is the median of {args.repeats} runs")
+    print(f"{'variant':>10} {'memory MB':>10} {'bytes/obj':>10} {'ms':>8} {'rows/s':>12}")
+    for name, build in BUILDERS.items():
+        memory = measure_memory(build, docs)
+        elapsed = measure_time(build, docs, args.repeats)
+        print(f"{name:>10} {memory / 2 ** 20:>10.1f} {memory / args.count:>10.0f} "
+              f"{elapsed * 1000:>8.1f} {args.count / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: encode/decode cost and payload size of the cache codecs.
+
+The payload is an all_categories snapshot of N categories, in two layouts:
+- "list": the whole list as one value.
+- "hash": one value per category, which is how the snapshot hash is stored in Redis.
+
+Usage:
+    python benchmarks/bench_codecs.py [--categories 50000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from infrastructure.serialization.codecs import CODECS, decode_value  # noqa: E402
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    snapshot = [
+        {"id": f"00000000-0000-4000-8000-{index:012d}", "name": f"Category {index}",
+         "description": f"Description of category {index}" if index % 3 else None}
+        for index in range(args.categories)
+    ]
+
+    print(f"all_categories snapshot of {args.categories} categories, best of {args.repeat}")
+    print(f"{'codec':<8} {'layout':<6} {'encode ms':>10} {'decode ms':>10} {'size KiB':>10}")
+    for name, codec_class in CODECS.items():
+        codec = codec_class()
+
+        encoded = codec.encode(snapshot)
+        encode = best_of(args.repeat, lambda: codec.encode(snapshot))
+        decode = best_of(args.repeat, lambda: decode_value(encoded))
+        print(f"{name:<8} {'list':<6} {encode * 1000:>10.1f} {decode * 1000:>10.1f} {len(encoded) / 1024:>10.0f}")
+
+        entries = [codec.encode(item) for item in snapshot]
+        encode = best_of(args.repeat, lambda: [codec.encode(item) for item in snapshot])
+        decode = best_of(args.repeat, lambda: [decode_value(entry) for entry in entries])
+        size = sum(len(entry) for entry in entries)
+        print(f"{name:<8} {'hash':<6} {encode * 1000:>10.1f} {decode * 1000:>10.1f} {size / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
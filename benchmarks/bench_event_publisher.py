@@ -0,0 +1,109 @@
+"""
+Benchmark: event publishing latency seen by writers, and publisher throughput.
+
+Concurrent writers publish events against a local stub broker that takes a
+fixed time to answer every message. "blocking" is the former pika-based
+publisher: every publish blocks the event loop for a broker round-trip.
+"queued" is RabbitMQCategoryEventPublisher, which hands events to its
+background task and confirms them in batches.
+
+Usage:
+    python benchmarks/bench_event_publisher.py [--events 5000] [--writers 100] [--broker-ms 1]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher  # noqa: E402
+
+
+class StubBroker:
+    """Confirms every message after a fixed latency; confirms of one batch overlap"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.confirmed = 0
+
+    async def connect(self, url, **options):
+        return self
+
+    async def channel(self, publisher_confirms=False):
+        return self
+
+    async def declare_exchange(self, name, exchange_type, durable=False):
+        return self
+
+    async def publish(self, message, routing_key, timeout=None):
+        await asyncio.sleep(self.latency)
+        self.confirmed += 1
+
+    async def close(self):
+        pass
+
+
+class BlockingPublisher:
+    """The former publisher: a synchronous broker round-trip per event, on the event loop"""
+
+    def __init__(self, broker_latency: float):
+        self.broker_latency = broker_latency
+
+    async def publish_category_created(self, category):
+        json.dumps({"event_type": "category_created", "category_id": str(category.id), "name": category.name})
+        time.sleep(self.broker_latency)
+
+
+async def drive(publisher, events: int, writers: int):
+    latencies = []
+    category = Category(id=CategoryId("bench-id"), name="Bench")
+
+    async def writer(count: int):
+        for _ in range(count):
+            started = time.perf_counter()
+            await publisher.publish_category_created(category)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(events // writers) for _ in range(writers)))
+    if isinstance(publisher, RabbitMQCategoryEventPublisher):
+        await publisher.flush()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.99)]
+
+
+async def run(events: int, writers: int, broker_latency: float):
+    print(f"{events} events, {writers} concurrent writers, broker confirm {broker_latency * 1000:.1f} ms")
+    print(f"{'publisher':<10} {'events/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+
+    elapsed, p50, p99 = await drive(BlockingPublisher(broker_latency), events, writers)
+    print(f"{'blocking':<10} {events / elapsed:>10.0f} {p50 * 1000:>8.3f} {p99 * 1000:>8.3f}")
+
+    broker = StubBroker(broker_latency)
+    publisher = RabbitMQCategoryEventPublisher("amqp://stub", batch_size=500, connect=broker.connect)
+    elapsed, p50, p99 = await drive(publisher, events, writers)
+    print(f"{'queued':<10} {events / elapsed:>10.0f} {p50 * 1000:>8.3f} {p99 * 1000:>8.3f}")
+    print(f"publisher stats: {publisher.stats()}")
+    await publisher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--writers", type=int, default=100)
+    parser.add_argument("--broker-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.writers, args.broker_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Memory benchmark: exporting the full category set.
+
+Compares the old approach (find_all() into a list, one CategoryResponse per
+row, one big JSON array) with the streaming NDJSON encoder behind
+GET /categories/export, fed by a generator standing in for the Mongo cursor.
+Reports the tracemalloc peak for growing collection sizes: the list-based
+peak grows with the collection, the streaming peak stays flat.
+
+Usage:
+    python benchmarks/bench_export_streaming.py [--sizes 10000 50000 100000]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from infrastructure.adapters.inbound.rest.category_controller import _encode_ndjson  # noqa: E402
+from infrastructure.adapters.inbound.rest.schemas.category_schemas import CategoryResponse  # noqa: E402
+
+
+async def cursor_stand_in(size: int):
+    """Yields categories one by one, like a Motor cursor with a bounded batch"""
+    for i in range(size):
+        yield Category(id=CategoryId(f"id-{i:08d}"), name=f"Category {i}", description="Benchmark category")
+
+
+async def export_as_list(size: int) -> int:
+    categories = [category async for category in cursor_stand_in(size)]
+    responses = [
+        CategoryResponse(id=str(category.id), name=category.name, description=category.description)
+        for category in categories
+    ]
+    body = json.dumps([response.model_dump() for response in responses])
+    return len(body)
+
+
+async def export_streaming(size: int) -> int:
+    written = 0
+    async for chunk in _encode_ndjson(cursor_stand_in(size)):
+        written += len(chunk)  # the chunk is handed to the socket and dropped
+    return written
+
+
+async def measure(export, size: int):
+    tracemalloc.start()
+    await export(size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+async def run(sizes):
+    print(f"{'rows':>8} {'list peak MiB':>14} {'stream peak MiB':>16}")
+    for size in sizes:
+        list_peak = await measure(export_as_list, size)
+        stream_peak = await measure(export_streaming, size)
+        print(f"{size:>8} {list_peak / 2**20:>14.1f} {stream_peak / 2**20:>16.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: top-k prefix queries, linear scan vs NamePrefixIndex.
+
+"scan" filters the cached collection (what find_all offers without an index)
+and sorts the matches; "index" is NamePrefixIndex.search, a binary search
+over the sorted (casefolded name, id) entries followed by reading at most k
+neighbours. Also reports the time of a full rebuild of the index, paid once
+per collection version change made by another worker, and of applying one
+local write in place.
+
+Usage:
+    python benchmarks/bench_name_prefix_index.py [--sizes 10000 100000 1000000] [--limit 10] [--queries 1000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.entities.category import Category  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from domain.value_objects.category_collection import CategoryCollection  # noqa: E402
+from infrastructure.adapters.outbound.cache.name_prefix_index import NamePrefixIndex  # noqa: E402
+
+WORDS = ["Books", "Bikes", "Cars", "Garden", "Music", "Sports", "Toys", "Tools", "Kitchen", "Office"]
+
+
+def collection(size: int) -> CategoryCollection:
+    return CategoryCollection.from_rows(
+        (f"id-{index:08d}", f"{WORDS[index % len(WORDS)]} {index}", None) for index in range(size)
+    )
+
+
+def scan(categories: CategoryCollection, prefix: str, limit: int):
+    prefix = prefix.casefold()
+    matches = sorted(
+        (name.casefold(), category_id) for category_id, name, _ in categories.rows()
+        if name.casefold().startswith(prefix)
+    )
+    return [category_id for _, category_id in matches[:limit]]
+
+
+def per_query(search, prefixes) -> float:
+    started = time.perf_counter()
+    for prefix in prefixes:
+        search(prefix)
+    return (time.perf_counter() - started) / len(prefixes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"top-{args.limit} prefix queries, time per query")
+    print(f"{'categories':>10} {'scan ms':>9} {'index us':>9} {'speedup':>9} {'rebuild ms':>11} {'put us':>7}")
+    for size in args.sizes:
+        categories = collection(size)
+        # Half short prefixes (many matches), half longer ones (few matches)
+        prefixes = [
+            random.choice(WORDS)[:random.randint(1, 4)].lower() if number % 2
+            else f"{random.choice(WORDS)} {random.randrange(size)}"[:random.randint(3, 9)]
+            for number in range(args.queries)
+        ]
+        index = NamePrefixIndex()
+        started = time.perf_counter()
+        index.rebuild(categories, version=1)
+        rebuild_time = time.perf_counter() - started
+        for prefix in prefixes[:20]:
+            assert [str(category.id) for category in index.search(prefix, args.limit)] == scan(
+                categories, prefix, args.limit
+            )
+
+        # The scan reads the whole collection per query: a few queries are enough
+        scan_time = per_query(lambda prefix: scan(categories, prefix, args.limit), prefixes[:20])
+        index_time = per_query(lambda prefix: index.search(prefix, args.limit), prefixes)
+        puts = [Category(id=CategoryId(f"id-new-{number}"), name=f"Books new {number}") for number in range(100)]
+        put_time = statistics.median(per_query(index.put, [category]) for category in puts)
+        print(f"{size:>10} {scan_time * 1000:>9.1f} {index_time * 1e6:>9.1f} {scan_time / index_time:>8.0f}x "
+              f"{rebuild_time * 1000:>11.0f} {put_time * 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: outbox relay throughput by relay batch size.
+
+The outbox is pre-filled with category events. OutboxRelay drains it into
+RabbitMQCategoryEventPublisher over a stub broker. Every outbox call
+(read, checkpoint, delete) costs a simulated MongoDB round-trip, and every
+message takes a simulated broker confirm time. Larger relay batches spread
+those fixed costs over more events.
+
+Usage:
+    python benchmarks/bench_outbox_relay.py [--events 20000] [--mongo-ms 1] [--broker-ms 1]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.events.category_events import CategoryCreated  # noqa: E402
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from infrastructure.adapters.outbound.database.mongodb.outbox_store import OutboxRecord  # noqa: E402
+from infrastructure.adapters.outbound.message_bus.outbox_relay import OutboxRelay  # noqa: E402
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher  # noqa: E402
+
+
+class StubBroker:
+    """Confirms every message after a fixed latency; confirms of one batch overlap"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def connect(self, url, **options):
+        return self
+
+    async def channel(self, publisher_confirms=False):
+        return self
+
+    async def declare_exchange(self, name, exchange_type, durable=False):
+        return self
+
+    async def publish(self, message, routing_key, timeout=None):
+        await asyncio.sleep(self.latency)
+
+    async def close(self):
+        pass
+
+
+class InMemoryOutboxStore:
+    """MongoOutboxStore stand-in: records in insertion order, one simulated round-trip per call"""
+
+    def __init__(self, events, latency: float):
+        self.records = {index: OutboxRecord(index, event) for index, event in enumerate(events)}
+        self.latency = latency
+
+    async def fetch_pending(self, limit):
+        await asyncio.sleep(self.latency)
+        return [record for _, record in zip(range(limit), self.records.values())]
+
+    async def acknowledge(self, record_ids):
+        await asyncio.sleep(self.latency)
+        for record_id in record_ids:
+            del self.records[record_id]
+
+    async def save_checkpoint(self, event_ids):
+        await asyncio.sleep(self.latency)
+
+
+async def drain(events: int, batch_size: int, mongo_latency: float, broker_latency: float) -> float:
+    store = InMemoryOutboxStore(
+        [CategoryCreated(CategoryId(f"id-{index}"), f"Category {index}", None) for index in range(events)],
+        mongo_latency
+    )
+    publisher = RabbitMQCategoryEventPublisher(
+        "amqp://stub", batch_size=batch_size, flush_interval=0.0, connect=StubBroker(broker_latency).connect
+    )
+    relay = OutboxRelay(store, publisher, batch_size=batch_size)
+
+    started = time.perf_counter()
+    while await relay.relay_once():
+        pass
+    elapsed = time.perf_counter() - started
+    await publisher.close()
+    return elapsed
+
+
+async def run(events: int, mongo_latency: float, broker_latency: float):
+    print(f"{events} outbox events, MongoDB round-trip {mongo_latency * 1000:.1f} ms, "
+          f"broker confirm {broker_latency * 1000:.1f} ms")
+    print(f"{'batch size':>10} {'events/s':>10} {'seconds':>8}")
+    for batch_size in (10, 100, 500, 2000):
+        elapsed = await drain(events, batch_size, mongo_latency, broker_latency)
+        print(f"{batch_size:>10} {events / elapsed:>10.0f} {elapsed:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--mongo-ms", type=float, default=1.0)
+    parser.add_argument("--broker-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.mongo_ms / 1000, args.broker_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: category statistics computed in memory vs by a MongoDB aggregation.
+
+"scan" is the in-memory fallback: MongoCategoryRepository.find_all() loads
+every document and CategoryService.calculate_category_statistics runs over
+the list. "aggregation" is MongoCategoryStatisticsRepository: one $group
+pipeline runs on the server and a single result document is returned.
+
+Unlike the other benchmarks this one needs a running MongoDB. It fills a
+scratch database (dropped afterwards) with --documents categories.
+
+Usage:
+    python benchmarks/bench_statistics_aggregation.py [--uri mongodb://localhost:27017]
+        [--documents 100000] [--repeats 5]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+import bson  # noqa: E402
+from domain.services.category_service import CategoryService  # noqa: E402
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import (  # noqa: E402
+    MongoCategoryRepository,
+)
+from infrastructure.adapters.outbound.database.mongodb.category_statistics_repository_impl import (  # noqa: E402
+    MongoCategoryStatisticsRepository,
+)
+
+DATABASE_NAME = "category_service_bench_statistics"
+
+
+async def seed(repository: MongoCategoryRepository, documents: int) -> int:
+    """Insert the documents and return their total BSON size (what a full scan transfers)"""
+    await repository.collection.delete_many({})
+    docs = [
+        {"_id": f"id-{index:08d}", "name": f"Category {index}" + "x" * (index % 37),
+         "description": f"Description {index}"}
+        for index in range(documents)
+    ]
+    for start in range(0, documents, 10000):
+        await repository.collection.insert_many(docs[start:start + 10000], ordered=False)
+    return sum(len(bson.encode(doc)) for doc in docs)
+
+
+async def measure(compute, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await compute()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def run(uri: str, documents: int, repeats: int) -> None:
+    repository = MongoCategoryRepository(uri, DATABASE_NAME)
+    statistics_repository = MongoCategoryStatisticsRepository(repository.db)
+    service = CategoryService()
+
+    async def scan():
+        return service.calculate_category_statistics(await repository.find_all())
+
+    try:
+        scanned_bytes = await seed(repository, documents)
+        in_memory = await scan()
+        aggregated = await statistics_repository.compute_statistics()
+        assert in_memory == aggregated, (in_memory, aggregated)
+
+        scan_time = await measure(scan, repeats)
+        aggregation_time = await measure(statistics_repository.compute_statistics, repeats)
+        result_bytes = len(bson.encode(aggregated))
+
+        print(f"{documents} categories, median of {repeats} runs")
+        print(f"{'path':>12} {'ms':>10} {'transferred':>14}")
+        print(f"{'scan':>12} {scan_time * 1000:>10.1f} {scanned_bytes:>12} B")
+        print(f"{'aggregation':>12} {aggregation_time * 1000:>10.1f} {result_bytes:>12} B")
+        print(f"speedup: {scan_time / aggregation_time:.1f}x")
+    finally:
+        await repository.client.drop_database(DATABASE_NAME)
+        repository.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.uri, args.documents, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
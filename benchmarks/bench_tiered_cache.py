@@ -0,0 +1,110 @@
+"""
+Micro-benchmark: hot reads through CachedCategoryRepository with the two-tier cache.
+
+Compares a read served by Redis alone (simulated round-trip + json.loads) with
+a read served by the in-process L1 tier of TieredCacheAdapter.
+
+Usage:
+    python benchmarks/bench_tiered_cache.py [--latency-us 200] [--reads 20000]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Same import layout as tests/conftest.py: project root and src/ on sys.path
+project_root = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(project_root / "src"), str(project_root)]
+
+from domain.value_objects.category_id import CategoryId  # noqa: E402
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository  # noqa: E402
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache  # noqa: E402
+from infrastructure.adapters.outbound.cache.tiered_cache_adapter import TieredCacheAdapter  # noqa: E402
+
+
+class RedisStandIn:
+    """RedisCacheAdapter stand-in: JSON round-trip plus a simulated network hop"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.data = {}
+
+    async def get(self, key):
+        value, _ = await self.get_with_ttl(key)
+        return value
+
+    async def get_with_ttl(self, key):
+        await asyncio.sleep(self.latency)
+        value = self.data.get(key)
+        return (json.loads(value), 300.0) if value is not None else (None, None)
+
+    async def set(self, key, value, expire=3600):
+        self.data[key] = json.dumps(value)
+        return True
+
+    async def delete_many(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def acquire_lock(self, key, ttl):
+        return "token"
+
+    async def release_lock(self, key, token):
+        return True
+
+    async def publish(self, channel, message):
+        return 0
+
+    def pubsub(self):
+        return IdlePubSub()
+
+
+class IdlePubSub:
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        await asyncio.Event().wait()
+        yield
+
+    async def aclose(self):
+        pass
+
+
+async def measure(repository: CachedCategoryRepository, reads: int) -> float:
+    category_id = CategoryId("bench-id")
+    await repository.find_by_id(category_id)  # populate caches
+    started = time.perf_counter()
+    for _ in range(reads):
+        await repository.find_by_id(category_id)
+    return (time.perf_counter() - started) / reads
+
+
+async def run(latency: float, reads: int):
+    redis_only = RedisStandIn(latency)
+    redis_only.data["category_bench-id"] = json.dumps({"id": "bench-id", "name": "Bench", "description": None})
+    tiered_redis = RedisStandIn(latency)
+    tiered_redis.data.update(redis_only.data)
+    tiered = TieredCacheAdapter(tiered_redis, LocalCache(), "bench")
+
+    redis_time = await measure(CachedCategoryRepository(None, redis_only), max(1, reads // 20))
+    tiered_time = await measure(CachedCategoryRepository(None, tiered), reads)
+    await tiered.close()
+
+    print(f"{'tier':<12} {'us/read':>10}")
+    print(f"{'redis only':<12} {redis_time * 1e6:>10.1f}")
+    print(f"{'L1 hit':<12} {tiered_time * 1e6:>10.1f}")
+    print(f"L1 stats: {tiered.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-us", type=float, default=200.0)
+    parser.add_argument("--reads", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.latency_us / 1e6, args.reads))
+
+
+if __name__ == "__main__":
+    main()
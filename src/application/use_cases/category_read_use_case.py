@@ -1,8 +1,19 @@
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection
 from domain.ports.outbound.category_repository import CategoryRepository
-from domain.exceptions.category_exceptions import CategoryNotFoundError
-from typing import List, Optional
+from domain.exceptions.category_exceptions import CategoryNotFoundError, InvalidCategoryError
+from typing import AsyncIterator, List, Optional, Sequence
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Upper bound for one batched lookup by ids
+MAX_LOOKUP_SIZE = 500
+# Search and autocomplete return a short list of suggestions
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
 
 
 class CategoryReadUseCase:
@@ -11,13 +22,44 @@ class CategoryReadUseCase:
     def __init__(self, repository: CategoryRepository):
         self.repository = repository
     
-    def get_category(self, category_id: CategoryId) -> Category:
-        category = self.repository.find_by_id(category_id)
+    async def get_category(self, category_id: CategoryId) -> Category:
+        category = await self.repository.find_by_id(category_id)
         if not category:
             raise CategoryNotFoundError(f"Category with id {category_id} not found")
         
         return category
     
-    def get_all_categories(self) -> List[Category]:
-        categories = self.repository.find_all()
+    async def get_categories(self, category_ids: List[CategoryId]) -> List[Category]:
+        """Resolve many ids at once; unknown ids are skipped"""
+        if len(category_ids) > MAX_LOOKUP_SIZE:
+            raise InvalidCategoryError(f"A lookup accepts at most {MAX_LOOKUP_SIZE} ids")
+        if not category_ids:
+            return []
+        return await self.repository.find_by_ids(category_ids)
+    
+    async def get_all_categories(self) -> CategoryCollection:
+        categories = await self.repository.find_all()
         return categories
+    
+    def export_categories(self) -> AsyncIterator[Category]:
+        return self.repository.iter_all()
+    
+    async def get_categories_page(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[CategoryId] = None,
+                                  fields: Optional[Sequence[str]] = None) -> CategoryPage:
+        # Bound the page size so a single request cannot pull the whole collection
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        return await self.repository.find_page(limit, after, fields)
+    
+    async def autocomplete_categories(self, prefix: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Category]:
+        """Categories whose name starts with the prefix (case-insensitively)"""
+        prefix = prefix.strip()
+        if not prefix:
+            raise InvalidCategoryError("Search query cannot be empty")
+        return await self.repository.find_by_name_prefix(prefix, max(1, min(limit, MAX_SEARCH_LIMIT)))
+    
+    async def search_categories(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Category]:
+        """Categories whose name contains any of the query words, best matches first"""
+        query = query.strip()
+        if not query:
+            raise InvalidCategoryError("Search query cannot be empty")
+        return await self.repository.search_by_name(query, max(1, min(limit, MAX_SEARCH_LIMIT)))
\ No newline at end of file
@@ -1,20 +1,57 @@
-from domain.entities.category import Category
+from domain.value_objects.category_collection import CategoryCollection
 from domain.services.category_service import CategoryService
+from domain.services.category_statistics_engine import CategoryStatisticsEngine
+from domain.ports.outbound.category_statistics_store import CategoryStatisticsStore
+from domain.ports.outbound.category_statistics_repository import CategoryStatisticsRepository
 from application.use_cases.category_read_use_case import CategoryReadUseCase
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class CategoryStatisticsUseCase:
-    """Application layer use case for category statistics"""
+    """Application layer use case for category statistics.
     
-    def __init__(self, read_use_case: CategoryReadUseCase):
+    With a statistics store the statistics are read from its incrementally
+    maintained state; the full collection is only loaded to (re)build it.
+    Otherwise a statistics repository computes them where the data lives.
+    Without either, all categories are loaded and CategoryService computes
+    them in memory (vectorized by CategoryStatisticsEngine). The extended statistics (length percentiles and
+    histogram) are always computed in memory from all categories.
+    """
+    
+    def __init__(self, read_use_case: CategoryReadUseCase, statistics_store: Optional[CategoryStatisticsStore] = None,
+                 statistics_repository: Optional[CategoryStatisticsRepository] = None):
         self.read_use_case = read_use_case
-        self.category_service = CategoryService()
+        self.statistics_store = statistics_store
+        self.statistics_repository = statistics_repository
+        self.statistics_engine = CategoryStatisticsEngine()
+        self.category_service = CategoryService(self.statistics_engine)
     
-    def get_category_statistics(self) -> Dict[str, Any]:
+    async def get_category_statistics(self) -> Dict[str, Any]:
         """Get statistics for all categories"""
-        # Get all categories using read use case
-        categories = self.read_use_case.get_all_categories()
+        if self.statistics_store is not None:
+            statistics = await self.statistics_store.get_statistics()
+            if statistics is not None:
+                return statistics
+            # No state yet: load everything once and build it
+            categories = await self.statistics_store.rebuild(self.read_use_case.get_all_categories)
+        elif self.statistics_repository is not None:
+            # Only the aggregated result is transferred, not the collection
+            return await self.statistics_repository.compute_statistics()
+        else:
+            # Get all categories using read use case
+            categories = await self.read_use_case.get_all_categories()
         
         # Calculate statistics using domain service
-        return self.category_service.calculate_category_statistics(categories)
\ No newline at end of file
+        return self.category_service.calculate_category_statistics(categories)
+    
+    async def get_statistics_revision(self) -> Optional[int]:
+        """Revision of the statistics store, which the statistics depend on besides the
+        collection (0 without a store); None if it cannot be read"""
+        if self.statistics_store is None:
+            return 0
+        return await self.statistics_store.get_revision()
+    
+    async def get_extended_category_statistics(self) -> Dict[str, Any]:
+        """Get statistics for all categories with the distribution of the name lengths"""
+        categories = CategoryCollection.of(await self.read_use_case.get_all_categories())
+        return self.statistics_engine.calculate_extended_statistics(categories.names, categories.name_lengths)
@@ -2,18 +2,36 @@ from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
 from domain.ports.outbound.category_repository import CategoryRepository
 from domain.ports.outbound.category_event_publisher import CategoryEventPublisher
+from domain.ports.outbound.category_statistics_store import CategoryStatisticsStore
+from domain.value_objects.bulk_item_result import BulkItemResult, BulkItemStatus
 from domain.exceptions.category_exceptions import CategoryNotFoundError, InvalidCategoryError
-from typing import List, Optional
+from application.dtos.create_category_dto import CreateCategoryDTO
+from application.dtos.update_category_dto import UpdateCategoryDTO
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+
+# Upper bound for one bulk request: keeps a single bulk_write and cache script bounded
+MAX_BULK_SIZE = 1000
 
 
 class CategoryWriteUseCase:
-    """Application layer use case for writing category data"""
+    """Application layer use case for writing category data.
+    
+    Without an event publisher the repository is expected to record the
+    domain events itself (transactional outbox) and nothing is published inline.
+    A statistics store, if given, is kept up to date with every successful write;
+    it is updated after the repository, so it may briefly disagree with it
+    (see RedisCategoryStatisticsStore for the bound).
+    """
     
-    def __init__(self, repository: CategoryRepository, event_publisher: CategoryEventPublisher):
+    def __init__(self, repository: CategoryRepository, event_publisher: Optional[CategoryEventPublisher] = None,
+                 statistics_store: Optional[CategoryStatisticsStore] = None):
         self.repository = repository
         self.event_publisher = event_publisher
+        self.statistics_store = statistics_store
     
-    def create_category(self, name: str, description: Optional[str] = None) -> Category:
+    async def create_category(self, name: str, description: Optional[str] = None) -> Category:
         # Validate category
         if not name or len(name.strip()) == 0:
             raise InvalidCategoryError("Category name cannot be empty")
@@ -22,43 +40,137 @@ class CategoryWriteUseCase:
         category = Category(id=None, name=name, description=description)
         
         # Save category
-        saved_category = self.repository.create(category)
+        saved_category = await self.repository.create(category)
+        await self._record_saved([saved_category])
         
         # Publish event
-        self.event_publisher.publish_category_created(saved_category)
+        if self.event_publisher is not None:
+            await self.event_publisher.publish_category_created(saved_category)
         
         return saved_category
     
-    def update_category(self, category_id: CategoryId, name: str, description: Optional[str] = None) -> Category:
-        # Find existing category
-        existing_category = self.repository.find_by_id(category_id)
-        if not existing_category:
-            raise CategoryNotFoundError(f"Category with id {category_id} not found")
-        
+    async def update_category(self, category_id: CategoryId, name: str, description: Optional[str] = None) -> Category:
         # Validate category
         if not name or len(name.strip()) == 0:
             raise InvalidCategoryError("Category name cannot be empty")
         
-        # Update category
+        # Update category; the repository raises CategoryNotFoundError if it does not exist
         updated_category = Category(id=category_id, name=name, description=description)
-        saved_category = self.repository.update(updated_category)
+        saved_category = await self.repository.update(updated_category)
+        await self._record_saved([saved_category])
         
         # Publish event
-        self.event_publisher.publish_category_updated(saved_category)
+        if self.event_publisher is not None:
+            await self.event_publisher.publish_category_updated(saved_category)
         
         return saved_category
     
-    def delete_category(self, category_id: CategoryId) -> bool:
-        # Check if category exists
-        existing_category = self.repository.find_by_id(category_id)
-        if not existing_category:
+    async def delete_category(self, category_id: CategoryId) -> bool:
+        # Delete category; nothing deleted means it did not exist
+        result = await self.repository.delete(category_id)
+        if not result:
             raise CategoryNotFoundError(f"Category with id {category_id} not found")
+        await self._record_deleted([category_id])
         
-        # Delete category
-        result = self.repository.delete(category_id)
+        # Publish event
+        if self.event_publisher is not None:
+            await self.event_publisher.publish_category_deleted(category_id)
+        
+        return result
+    
+    async def create_categories(self, items: List[CreateCategoryDTO]) -> List[BulkItemResult]:
+        self._check_batch_size(items)
+        results, categories, positions = self._validate_batch(
+            [(None, item.name, item.description) for item in items]
+        )
+        
+        # One insert for the whole batch, then one batch of events
+        stored = await self.repository.create_many(categories) if categories else []
+        self._merge_results(results, positions, stored)
+        created = [self._stored_category(categories, result) for result in stored if result.succeeded]
+        await self._record_saved(created)
+        if created and self.event_publisher is not None:
+            await self.event_publisher.publish_categories_created(created)
+        
+        return results
+    
+    async def upsert_categories(self, items: List[UpdateCategoryDTO]) -> List[BulkItemResult]:
+        self._check_batch_size(items)
+        results, categories, positions = self._validate_batch(
+            [(item.id, item.name, item.description) for item in items]
+        )
         
-        # Publish event if deletion was successful
-        if result:
-            self.event_publisher.publish_category_deleted(category_id)
+        stored = await self.repository.upsert_many(categories) if categories else []
+        self._merge_results(results, positions, stored)
+        created = [
+            self._stored_category(categories, result) for result in stored if result.status == BulkItemStatus.CREATED
+        ]
+        updated = [
+            self._stored_category(categories, result) for result in stored if result.status == BulkItemStatus.UPDATED
+        ]
+        await self._record_saved(created + updated)
+        if created and self.event_publisher is not None:
+            await self.event_publisher.publish_categories_created(created)
+        if updated and self.event_publisher is not None:
+            await self.event_publisher.publish_categories_updated(updated)
         
-        return result
\ No newline at end of file
+        return results
+    
+    async def delete_categories(self, category_ids: List[CategoryId]) -> List[BulkItemResult]:
+        self._check_batch_size(category_ids)
+        results = await self.repository.delete_many(category_ids) if category_ids else []
+        
+        # One event per deleted category, even if the request repeated its id
+        deleted = list(dict.fromkeys(result.category_id for result in results if result.succeeded))
+        await self._record_deleted(deleted)
+        if deleted and self.event_publisher is not None:
+            await self.event_publisher.publish_categories_deleted(deleted)
+        
+        return results
+    
+    async def _record_saved(self, categories: List[Category]) -> None:
+        if categories and self.statistics_store is not None:
+            await self.statistics_store.record_saved(categories)
+    
+    async def _record_deleted(self, category_ids: List[CategoryId]) -> None:
+        if category_ids and self.statistics_store is not None:
+            await self.statistics_store.record_deleted(category_ids)
+    
+    @staticmethod
+    def _check_batch_size(items: list) -> None:
+        if len(items) > MAX_BULK_SIZE:
+            raise InvalidCategoryError(f"A bulk request accepts at most {MAX_BULK_SIZE} items")
+    
+    @staticmethod
+    def _validate_batch(
+        items: List[Tuple[Optional[CategoryId], str, Optional[str]]]
+    ) -> Tuple[List[Optional[BulkItemResult]], List[Category], List[int]]:
+        """Split a batch into per-item validation failures and the categories to store.
+        
+        Returns the result list (filled for invalid items only), the valid
+        categories and, for each of them, its position in the request.
+        """
+        results: List[Optional[BulkItemResult]] = [None] * len(items)
+        categories = []
+        positions = []
+        for index, (category_id, name, description) in enumerate(items):
+            if not name or len(name.strip()) == 0:
+                results[index] = BulkItemResult(
+                    index, category_id, BulkItemStatus.INVALID, "Category name cannot be empty"
+                )
+                continue
+            categories.append(Category(id=category_id, name=name, description=description))
+            positions.append(index)
+        return results, categories, positions
+    
+    @staticmethod
+    def _stored_category(categories: List[Category], result: BulkItemResult) -> Category:
+        # The repository reports the id it stored the category under (new ids are generated there)
+        return replace(categories[result.index], id=result.category_id)
+    
+    @staticmethod
+    def _merge_results(results: List[Optional[BulkItemResult]], positions: List[int],
+                       stored: List[BulkItemResult]) -> None:
+        # Repository results are indexed within the valid subset: map them back to request positions
+        for result in stored:
+            results[positions[result.index]] = replace(result, index=positions[result.index])
\ No newline at end of file
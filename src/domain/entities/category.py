@@ -5,7 +5,7 @@ from src.domain.value_objects.category_id import CategoryId
 from src.domain.exceptions.category_exceptions import InvalidCategoryError
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     id: Optional[CategoryId]
     name: str
@@ -13,4 +13,17 @@ class Category:
 
     def __post_init__(self):
         if not self.name:
-            raise InvalidCategoryError("Category name cannot be empty")
\ No newline at end of file
+            raise InvalidCategoryError("Category name cannot be empty")
+
+    @classmethod
+    def trusted(cls, id: Optional[CategoryId], name: str, description: Optional[str] = None) -> "Category":
+        """Build a category read back from our own storage, without validating it again"""
+        category = _new(cls)
+        category.id = id
+        category.name = name
+        category.description = description
+        return category
+
+
+# Allocates without running __init__/__post_init__
+_new = object.__new__
\ No newline at end of file
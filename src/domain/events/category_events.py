@@ -1,25 +1,38 @@
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional, Union
 from domain.value_objects.category_id import CategoryId
 
 
+def _new_event_id() -> str:
+    return str(uuid.uuid4())
+
+
 @dataclass
 class CategoryCreated:
     category_id: CategoryId
     name: str
-    description: str
-    timestamp: datetime
+    description: Optional[str]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Unique per event: consumers and the outbox relay deduplicate by it
+    event_id: str = field(default_factory=_new_event_id)
 
 
 @dataclass
 class CategoryUpdated:
     category_id: CategoryId
     name: str
-    description: str
-    timestamp: datetime
+    description: Optional[str]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    event_id: str = field(default_factory=_new_event_id)
 
 
 @dataclass
 class CategoryDeleted:
     category_id: CategoryId
-    timestamp: datetime
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    event_id: str = field(default_factory=_new_event_id)
+
+
+CategoryEvent = Union[CategoryCreated, CategoryUpdated, CategoryDeleted]
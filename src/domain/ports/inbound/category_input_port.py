@@ -1,33 +1,56 @@
 from abc import ABC, abstractmethod
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
-from typing import List, Optional, Dict, Any
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
 
 
 class CategoryInputPort(ABC):
     """Inbound port for category operations"""
     
     @abstractmethod
-    def create_category(self, name: str, description: Optional[str] = None) -> Category:
+    async def create_category(self, name: str, description: Optional[str] = None) -> Category:
         pass
     
     @abstractmethod
-    def get_category(self, category_id: CategoryId) -> Category:
+    async def get_category(self, category_id: CategoryId) -> Category:
         pass
     
     @abstractmethod
-    def get_all_categories(self) -> List[Category]:
+    async def get_categories(self, category_ids: List[CategoryId]) -> List[Category]:
         pass
     
     @abstractmethod
-    def update_category(self, category_id: CategoryId, name: str, description: Optional[str] = None) -> Category:
+    async def get_all_categories(self) -> CategoryCollection:
         pass
     
     @abstractmethod
-    def delete_category(self, category_id: CategoryId) -> bool:
+    def export_categories(self) -> AsyncIterator[Category]:
         pass
     
     @abstractmethod
-    def get_category_statistics(self) -> Dict[str, Any]:
+    async def get_categories_page(self, limit: int, after: Optional[CategoryId] = None,
+                                  fields: Optional[Sequence[str]] = None) -> CategoryPage:
+        pass
+    
+    @abstractmethod
+    async def autocomplete_categories(self, prefix: str, limit: int) -> List[Category]:
+        pass
+    
+    @abstractmethod
+    async def search_categories(self, query: str, limit: int) -> List[Category]:
+        pass
+    
+    @abstractmethod
+    async def update_category(self, category_id: CategoryId, name: str, description: Optional[str] = None) -> Category:
+        pass
+    
+    @abstractmethod
+    async def delete_category(self, category_id: CategoryId) -> bool:
+        pass
+    
+    @abstractmethod
+    async def get_category_statistics(self) -> Dict[str, Any]:
         """Get statistics for all categories"""
         pass
\ No newline at end of file
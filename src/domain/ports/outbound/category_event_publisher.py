@@ -1,19 +1,50 @@
 from abc import ABC, abstractmethod
 from domain.entities.category import Category
+from domain.events.category_events import CategoryEvent
 from domain.value_objects.category_id import CategoryId
+from typing import List
 
 
 class CategoryEventPublisher(ABC):
-    """Outbound port for category event publishing"""
+    """Outbound port for category event publishing.
+    
+    Implementations must not make the caller wait for the broker beyond
+    handing the events over (they may wait when their buffer is full).
+    """
     
     @abstractmethod
-    def publish_category_created(self, category: Category) -> None:
+    async def publish_category_created(self, category: Category) -> None:
         pass
     
     @abstractmethod
-    def publish_category_updated(self, category: Category) -> None:
+    async def publish_category_updated(self, category: Category) -> None:
         pass
     
     @abstractmethod
-    def publish_category_deleted(self, category_id: CategoryId) -> None:
-        pass
\ No newline at end of file
+    async def publish_category_deleted(self, category_id: CategoryId) -> None:
+        pass
+    
+    @abstractmethod
+    async def publish_categories_created(self, categories: List[Category]) -> None:
+        """Publish one created event per category as a single batch"""
+        pass
+    
+    @abstractmethod
+    async def publish_categories_updated(self, categories: List[Category]) -> None:
+        """Publish one updated event per category as a single batch"""
+        pass
+    
+    @abstractmethod
+    async def publish_categories_deleted(self, category_ids: List[CategoryId]) -> None:
+        """Publish one deleted event per category as a single batch"""
+        pass
+    
+    @abstractmethod
+    async def publish_events(self, events: List[CategoryEvent]) -> None:
+        """Publish already built domain events (keeping their event ids) as a single batch"""
+        pass
+    
+    @abstractmethod
+    async def flush(self) -> None:
+        """Wait until every event handed over so far has been delivered"""
+        pass
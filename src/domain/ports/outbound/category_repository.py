@@ -1,76 +1,189 @@
 from abc import ABC, abstractmethod
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
-from typing import List, Optional
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection
+from domain.value_objects.bulk_item_result import BulkItemResult
+from typing import AsyncIterator, List, Optional, Sequence
 
 
 class CategoryRepository(ABC):
     """Outbound port for category persistence"""
     
     @abstractmethod
-    def create(self, category: Category) -> Category:
+    async def create(self, category: Category) -> Category:
         """
         Create a new category.
         
         Args:
             category: Category to create. If category.id is None, a new ID will be generated.
-            
+        
         Returns:
             The created category with its ID.
-            
+        
         Raises:
-            ValueError: If a category with the same ID already exists.
+            CategoryAlreadyExistsError: If a category with the same ID already exists.
         """
         pass
     
     @abstractmethod
-    def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
+    async def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
         """
         Find a category by its ID.
         
         Args:
             category_id: The ID of the category to find.
-            
+        
         Returns:
             The category if found, None otherwise.
         """
         pass
     
     @abstractmethod
-    def find_all(self) -> List[Category]:
+    async def find_by_ids(self, category_ids: List[CategoryId]) -> List[Category]:
+        """
+        Find several categories by their IDs in one round-trip.
+        
+        Args:
+            category_ids: IDs of the categories to find. Duplicates are ignored.
+        
+        Returns:
+            The categories found, in the order their IDs were first given.
+            Unknown IDs are skipped.
+        """
+        pass
+    
+    @abstractmethod
+    async def find_all(self) -> CategoryCollection:
         """
         Find all categories.
         
         Returns:
-            A list of all categories.
+            All categories ordered by ID, packed column by column.
+        """
+        pass
+    
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[Category]:
+        """
+        Stream all categories ordered by ID without loading the whole collection.
+        
+        Returns:
+            An async iterator over every category.
+        """
+        pass
+    
+    @abstractmethod
+    async def find_page(self, limit: int, after: Optional[CategoryId] = None,
+                        fields: Optional[Sequence[str]] = None) -> CategoryPage:
+        """
+        Find one page of categories ordered by ID (keyset pagination).
+        
+        Args:
+            limit: Maximum number of categories in the page.
+            after: ID of the last category of the previous page; None for the first page.
+            fields: Category fields to load (see CATEGORY_FIELDS). ID and name are
+                always loaded; other fields left out are None. None loads every field.
+        
+        Returns:
+            The page with its next cursor (None if this is the last page).
+        """
+        pass
+    
+    @abstractmethod
+    async def find_by_name_prefix(self, prefix: str, limit: int) -> List[Category]:
+        """
+        Find categories whose name starts with a prefix (autocomplete).
+        
+        Args:
+            prefix: Start of the name, compared case-insensitively.
+            limit: Maximum number of categories to return.
+        
+        Returns:
+            Matching categories ordered by name (case-insensitively), then by ID.
+        """
+        pass
+    
+    @abstractmethod
+    async def search_by_name(self, query: str, limit: int) -> List[Category]:
+        """
+        Full-text search of category names.
+        
+        Args:
+            query: Words to look for; a category matches if its name contains any of them.
+            limit: Maximum number of categories to return.
+        
+        Returns:
+            Matching categories, best matches first.
         """
         pass
     
     @abstractmethod
-    def update(self, category: Category) -> Category:
+    async def update(self, category: Category) -> Category:
         """
         Update an existing category.
         
         Args:
             category: Category to update. Must have a valid ID.
-            
+        
         Returns:
             The updated category.
-            
+        
         Raises:
-            ValueError: If category ID is None or if no category with the given ID exists.
+            ValueError: If category ID is None.
+            CategoryNotFoundError: If no category with the given ID exists.
         """
         pass
     
     @abstractmethod
-    def delete(self, category_id: CategoryId) -> bool:
+    async def delete(self, category_id: CategoryId) -> bool:
         """
         Delete a category by its ID.
         
         Args:
             category_id: The ID of the category to delete.
-            
+        
         Returns:
             True if the category was deleted, False if it didn't exist.
         """
+        pass
+    
+    @abstractmethod
+    async def create_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        """
+        Create several categories in one round-trip. Items are independent:
+        one failing item does not stop the others.
+        
+        Args:
+            categories: Categories to create. Categories without an ID get a new one.
+        
+        Returns:
+            One result per category, in input order (CREATED or CONFLICT/FAILED).
+        """
+        pass
+    
+    @abstractmethod
+    async def upsert_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        """
+        Create or replace several categories in one round-trip.
+        
+        Args:
+            categories: Categories to write. Categories without an ID get a new one.
+        
+        Returns:
+            One result per category, in input order (CREATED, UPDATED or FAILED).
+        """
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, category_ids: List[CategoryId]) -> List[BulkItemResult]:
+        """
+        Delete several categories.
+        
+        Args:
+            category_ids: IDs of the categories to delete.
+        
+        Returns:
+            One result per ID, in input order (DELETED or NOT_FOUND).
+        """
         pass
\ No newline at end of file
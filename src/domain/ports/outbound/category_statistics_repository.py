@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class CategoryStatisticsRepository(ABC):
+    """Outbound port for statistics computed by the storage itself.
+    
+    Implementations aggregate where the data lives, so only the result
+    crosses the wire instead of the whole collection.
+    """
+    
+    @abstractmethod
+    async def compute_statistics(self) -> Dict[str, Any]:
+        """
+        Statistics over all categories.
+        
+        Returns:
+            The CategoryService.calculate_category_statistics format: total_count,
+            average_name_length, longest_name and shortest_name (ties go to the lowest id).
+        """
+        pass
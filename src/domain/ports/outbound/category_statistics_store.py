@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class CategoryStatisticsStore(ABC):
+    """Outbound port for incrementally maintained category statistics.
+    
+    Writes are applied as they happen, so reading the statistics does not
+    depend on the collection size. Applying a change is idempotent (it sets
+    the state of the given categories), so a change may be applied twice.
+    """
+    
+    @abstractmethod
+    async def get_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        Current statistics in the CategoryService.calculate_category_statistics format.
+        
+        Returns:
+            None when the store has no state yet (or dropped it): the caller should rebuild it.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_revision(self) -> Optional[int]:
+        """
+        Revision of the state: changes with every recorded write and rebuild.
+        
+        A write reaches the store only after the collection version has
+        changed, so anything derived from the statistics is keyed by both.
+        
+        Returns:
+            None if it cannot be read: nothing derived should be cached then.
+        """
+        pass
+    
+    @abstractmethod
+    async def record_saved(self, categories: List[Category]) -> None:
+        """Apply created or updated categories"""
+        pass
+    
+    @abstractmethod
+    async def record_deleted(self, category_ids: List[CategoryId]) -> None:
+        """Apply deleted categories; unknown ids are ignored"""
+        pass
+    
+    @abstractmethod
+    async def rebuild(self, load_categories: Callable[[], Awaitable[CategoryCollection]]) -> CategoryCollection:
+        """
+        Replace the state with the full collection.
+        
+        Args:
+            load_categories: Loads every category.
+        
+        Returns:
+            The loaded categories. The new state is kept only if no write
+            happened while they were loading; otherwise the next read rebuilds again.
+        """
+        pass
@@ -1,11 +1,16 @@
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
-from typing import List
+from domain.value_objects.category_collection import CategoryCollection
+from domain.services.category_statistics_engine import CategoryStatisticsEngine
+from typing import Iterable, Optional
 
 
 class CategoryService:
     """Domain service for category business logic"""
     
+    def __init__(self, statistics_engine: Optional[CategoryStatisticsEngine] = None):
+        self.statistics_engine = statistics_engine or CategoryStatisticsEngine()
+    
     def validate_category(self, category: Category) -> bool:
         """Validate category business rules"""
         if not category.name or len(category.name.strip()) == 0:
@@ -18,30 +23,9 @@ class CategoryService:
         # A category with associated products cannot be deleted
         return not has_products
     
-    def calculate_category_statistics(self, categories: List[Category]) -> dict:
-        """Calculate statistics for categories"""
-        if not categories:
-            return {
-                "total_count": 0,
-                "average_name_length": 0,
-                "longest_name": "",
-                "shortest_name": ""
-            }
-        
-        names = [cat.name for cat in categories if cat.name]
-        if not names:
-            return {
-                "total_count": len(categories),
-                "average_name_length": 0,
-                "longest_name": "",
-                "shortest_name": ""
-            }
-        
-        name_lengths = [len(name) for name in names]
-        
-        return {
-            "total_count": len(categories),
-            "average_name_length": sum(name_lengths) / len(name_lengths),
-            "longest_name": max(names, key=len),
-            "shortest_name": min(names, key=len)
-        }
\ No newline at end of file
+    def calculate_category_statistics(self, categories: Iterable[Category]) -> dict:
+        """Calculate statistics for categories (in memory, the fallback when they are not
+        maintained or aggregated elsewhere)"""
+        # Vectorized over the name columns: no per-name Python loop
+        categories = CategoryCollection.of(categories)
+        return self.statistics_engine.calculate_statistics(categories.names, categories.name_lengths)
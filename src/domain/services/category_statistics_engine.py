@@ -0,0 +1,106 @@
+from domain.entities.category import Category
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+
+class CategoryStatisticsEngine:
+    """Vectorized (NumPy) statistics over category name lengths.
+    
+    CategoryService computes the in-memory statistics with it: the name
+    lengths are one contiguous int64 array and every figure is computed by
+    NumPy over it, instead of by Python loops over the names.
+    The extended statistics add the length range, percentiles and a histogram.
+    """
+    
+    def __init__(self, percentiles: Sequence[float] = (50, 90, 99), histogram_buckets: int = 10):
+        self.percentiles = tuple(percentiles)
+        self.histogram_buckets = histogram_buckets
+    
+    @staticmethod
+    def name_lengths(names: Sequence[str]) -> np.ndarray:
+        """Lengths of the names (in characters) as a contiguous array"""
+        return np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+    
+    def calculate_category_statistics(self, categories: List[Category]) -> Dict[str, Any]:
+        """calculate_statistics over Category objects (reading their names is most of the time)"""
+        return self.calculate_statistics([category.name for category in categories])
+    
+    def calculate_statistics(self, names: Sequence[str], lengths: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Statistics over the names of all categories.
+        
+        Args:
+            names: Category names
+            lengths: Their lengths, when the caller already has them (see name_lengths)
+        
+        Returns:
+            total_count, average_name_length, longest_name and shortest_name; ties go to
+            the first name, like max()/min()
+        """
+        if lengths is None:
+            lengths = self.name_lengths(names)
+        if lengths.size == 0:
+            return {
+                "total_count": 0,
+                "average_name_length": 0,
+                "longest_name": "",
+                "shortest_name": ""
+            }
+        
+        return {
+            "total_count": int(lengths.size),
+            "average_name_length": float(lengths.mean()),
+            "longest_name": names[int(lengths.argmax())],
+            "shortest_name": names[int(lengths.argmin())]
+        }
+    
+    def calculate_extended_statistics(self, names: Sequence[str],
+                                      lengths: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        calculate_statistics plus the distribution of the name lengths.
+        
+        Returns:
+            The calculate_statistics fields and min_name_length, max_name_length,
+            name_length_percentiles ({"p50": ...}, linearly interpolated) and
+            name_length_histogram (buckets of equal width covering min..max)
+        """
+        if lengths is None:
+            lengths = self.name_lengths(names)
+        statistics = self.calculate_statistics(names, lengths)
+        if lengths.size == 0:
+            statistics.update({
+                "min_name_length": 0,
+                "max_name_length": 0,
+                "name_length_percentiles": {self._percentile_key(p): 0.0 for p in self.percentiles},
+                "name_length_histogram": []
+            })
+            return statistics
+        
+        min_length, max_length = int(lengths.min()), int(lengths.max())
+        values = np.percentile(lengths, self.percentiles)
+        statistics.update({
+            "min_name_length": min_length,
+            "max_name_length": max_length,
+            "name_length_percentiles": {
+                self._percentile_key(p): float(value) for p, value in zip(self.percentiles, values)
+            },
+            "name_length_histogram": self._histogram(lengths, min_length, max_length)
+        })
+        return statistics
+    
+    def _histogram(self, lengths: np.ndarray, min_length: int, max_length: int) -> List[Dict[str, int]]:
+        # Integer bucket bounds; the last bucket may be cut short at max_length
+        width = -(-(max_length - min_length + 1) // self.histogram_buckets)
+        counts = np.bincount((lengths - min_length) // width)
+        return [
+            {
+                "min_length": min_length + index * width,
+                "max_length": min(min_length + (index + 1) * width - 1, max_length),
+                "count": int(count)
+            }
+            for index, count in enumerate(counts)
+        ]
+    
+    @staticmethod
+    def _percentile_key(percentile: float) -> str:
+        return f"p{percentile:g}"
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+from domain.value_objects.category_id import CategoryId
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    CONFLICT = "conflict"
+    INVALID = "invalid"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class BulkItemResult:
+    """Outcome of one item of a bulk operation; index is its position in the request"""
+    index: int
+    category_id: Optional[CategoryId]
+    status: BulkItemStatus
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.status in (BulkItemStatus.CREATED, BulkItemStatus.UPDATED, BulkItemStatus.DELETED)
@@ -0,0 +1,190 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+class StringColumn(Sequence):
+    """Immutable column of strings packed into one UTF-8 buffer with an offset array.
+    
+    Row i is buffer[offsets[i]:offsets[i + 1]]; rows are decoded only when read.
+    A validity mask marks None values (stored as empty strings).
+    """
+    
+    __slots__ = ("buffer", "offsets", "valid")
+    
+    def __init__(self, buffer: bytes, offsets: np.ndarray, valid: Optional[np.ndarray] = None):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.valid = valid
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        if self.valid is not None and not self.valid[index]:
+            return None
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]].decode()
+    
+    def __iter__(self) -> Iterator[Optional[str]]:
+        # Plain int bounds instead of indexing row by row
+        bounds = self.offsets.tolist()
+        if self.buffer.isascii():
+            # Byte offsets are character offsets here: decode once and slice the text
+            text = self.buffer.decode("ascii")
+            values = (text[start:end] for start, end in zip(bounds, bounds[1:]))
+        else:
+            buffer = self.buffer
+            values = (buffer[start:end].decode() for start, end in zip(bounds, bounds[1:]))
+        if self.valid is None:
+            return values
+        return (value if valid else None for value, valid in zip(values, self.valid.tolist()))
+    
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes + (self.valid.nbytes if self.valid is not None else 0)
+
+
+class CategoryCollection(Sequence):
+    """Column-oriented, immutable list of categories for bulk reads.
+    
+    Ids, names and descriptions are each one StringColumn, and the name lengths
+    (in characters) one int32 array, so a large result holds a handful of
+    buffers instead of five Python objects per row. Indexing and iteration
+    build Category objects lazily; rows(), to_dicts() and the columns read
+    the data without them, and name_lengths feeds CategoryStatisticsEngine.
+    """
+    
+    __slots__ = ("ids", "names", "descriptions", "name_lengths")
+    
+    def __init__(self, ids: StringColumn, names: StringColumn, descriptions: StringColumn, name_lengths: np.ndarray):
+        self.ids = ids
+        self.names = names
+        self.descriptions = descriptions
+        self.name_lengths = name_lengths
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, str, Optional[str]]]) -> "CategoryCollection":
+        """Pack (id, name, description) rows; the rows are consumed one by one"""
+        builder = CategoryCollectionBuilder()
+        for category_id, name, description in rows:
+            builder.append(category_id, name, description)
+        return builder.build()
+    
+    @classmethod
+    def of(cls, categories: Iterable[Category]) -> "CategoryCollection":
+        """The categories as a collection (returned as is if they already are one)"""
+        if isinstance(categories, cls):
+            return categories
+        return cls.from_rows(
+            (str(category.id), category.name, category.description) for category in categories
+        )
+    
+    def __len__(self) -> int:
+        return len(self.name_lengths)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Category.trusted(CategoryId.trusted(self.ids[index]), self.names[index], self.descriptions[index])
+    
+    def __iter__(self) -> Iterator[Category]:
+        for category_id, name, description in self.rows():
+            yield Category.trusted(CategoryId.trusted(category_id), name, description)
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"CategoryCollection({len(self)} categories)"
+    
+    def rows(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """(id, name, description) tuples, without building Category objects"""
+        return zip(self.ids, self.names, self.descriptions)
+    
+    def to_dicts(self, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """One dict per row with the given fields (id, name, description; all by default)"""
+        if fields is None or {"id", "name", "description"} <= set(fields):
+            return [
+                {"id": category_id, "name": name, "description": description}
+                for category_id, name, description in self.rows()
+            ]
+        fields = set(fields)
+        columns = [(field, getattr(self, column)) for field, column in (
+            ("id", "ids"), ("name", "names"), ("description", "descriptions")
+        ) if field in fields]
+        keys = [field for field, _ in columns]
+        return [dict(zip(keys, values)) for values in zip(*(column for _, column in columns))]
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed data"""
+        return self.ids.nbytes + self.names.nbytes + self.descriptions.nbytes + self.name_lengths.nbytes
+
+
+class CategoryCollectionBuilder:
+    """Packs rows into a CategoryCollection as they arrive (e.g. from a database cursor)"""
+    
+    __slots__ = ("ids", "names", "descriptions", "name_lengths")
+    
+    def __init__(self):
+        self.ids = _ColumnBuilder()
+        self.names = _ColumnBuilder()
+        self.descriptions = _ColumnBuilder()
+        self.name_lengths = array("i")
+    
+    def append(self, category_id: str, name: str, description: Optional[str] = None) -> None:
+        self.ids.append(category_id)
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.name_lengths.append(len(name))
+    
+    def build(self) -> CategoryCollection:
+        return CategoryCollection(
+            self.ids.build(),
+            self.names.build(),
+            self.descriptions.build(),
+            np.frombuffer(self.name_lengths, dtype=np.int32)
+        )
+
+
+class _ColumnBuilder:
+    """Appends strings to a growing UTF-8 buffer and offset array"""
+    
+    __slots__ = ("buffer", "offsets", "valid", "has_none")
+    
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets = array("q", [0])
+        self.valid = bytearray()
+        self.has_none = False
+    
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.has_none = True
+            self.valid.append(0)
+        else:
+            self.buffer += value.encode()
+            self.valid.append(1)
+        self.offsets.append(len(self.buffer))
+    
+    def build(self) -> StringColumn:
+        valid = np.frombuffer(self.valid, dtype=np.bool_) if self.has_none else None
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        # 32-bit offsets (as in Arrow) while the buffer is below 2 GiB
+        if offsets[-1] <= _INT32_MAX:
+            offsets = offsets.astype(np.int32)
+        return StringColumn(bytes(self.buffer), offsets, valid)
@@ -2,7 +2,7 @@ import uuid
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryId:
     value: str
 
@@ -12,7 +12,19 @@ class CategoryId:
 
     @classmethod
     def new(cls):
-        return cls(str(uuid.uuid4()))
+        return cls.trusted(str(uuid.uuid4()))
+
+    @classmethod
+    def trusted(cls, value: str) -> "CategoryId":
+        """Build an id read back from our own storage, without validating it again"""
+        category_id = _new(cls)
+        _set_value(category_id, value)
+        return category_id
 
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+# Bypass __init__/__post_init__ and the frozen __setattr__ (writes the slot directly)
+_new = object.__new__
+_set_value = CategoryId.value.__set__
\ No newline at end of file
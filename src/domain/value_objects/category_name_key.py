@@ -0,0 +1,10 @@
+def category_name_key(name: str) -> str:
+    """The form of a category name that prefix search matches and orders by.
+    
+    Unicode case folding makes it case-insensitive ("Straße" and "STRASSE"
+    both become "strasse"); keys are compared by code point. The in-process
+    name index and the stored name_key field of MongoDB documents both use
+    it, so either answers a prefix query with the same categories in the
+    same order.
+    """
+    return name.casefold()
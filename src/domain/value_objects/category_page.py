@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+
+
+# Category fields a page can be projected to; id and name are always loaded
+CATEGORY_FIELDS = ("id", "name", "description")
+
+
+@dataclass(frozen=True)
+class CategoryPage:
+    """One page of categories ordered by id (keyset pagination)"""
+    items: List[Category] = field(default_factory=list)
+    # Id of the last item, to pass as `after` for the next page; None on the last page
+    next_cursor: Optional[CategoryId] = None
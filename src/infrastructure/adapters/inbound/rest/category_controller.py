@@ -1,47 +1,157 @@
 from domain.entities.category import Category
 
 
-from fastapi import APIRouter, HTTPException
+import json
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_page import CATEGORY_FIELDS
+from domain.value_objects.bulk_item_result import BulkItemResult
 from domain.exceptions.category_exceptions import CategoryNotFoundError, InvalidCategoryError
 from infrastructure.adapters.inbound.rest.schemas.category_schemas import (
     CategoryCreateRequest,
     CategoryUpdateRequest,
+    CategoryBulkCreateRequest,
+    CategoryBulkUpsertRequest,
+    CategoryBulkDeleteRequest,
+    CategoryBulkResponse,
+    BulkItemResultResponse,
     CategoryResponse,
-    CategoryStatisticsResponse
+    CategoryListItemResponse,
+    CategoryBatchResponse,
+    CategoryStatisticsResponse,
+    CategoryExtendedStatisticsResponse
+)
+from infrastructure.adapters.inbound.rest.responses import (
+    CATEGORY_BATCH_ADAPTER,
+    CATEGORY_LIST_ADAPTER,
+    category_items,
+    json_response,
+    model_response
+)
+from infrastructure.adapters.inbound.rest.http_cache import ResponseCache
+from application.use_cases.category_read_use_case import (
+    CategoryReadUseCase,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT
 )
-from application.use_cases.category_read_use_case import CategoryReadUseCase
 from application.use_cases.category_write_use_case import CategoryWriteUseCase
+from application.dtos.create_category_dto import CreateCategoryDTO
+from application.dtos.update_category_dto import UpdateCategoryDTO
 from application.use_cases.category_statistics_use_case import CategoryStatisticsUseCase
-from typing import List
+from typing import AsyncIterator, List, Literal, Optional
 from dishka.integrations.fastapi import FromDishka, inject
 
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
+# Rows per chunk written to the socket while streaming an export
+EXPORT_CHUNK_SIZE = 500
+
 @router.get("/statistics", response_model=CategoryStatisticsResponse)
 @inject
 async def get_category_statistics(
-    use_case: FromDishka[CategoryStatisticsUseCase]
+    request: Request,
+    use_case: FromDishka[CategoryStatisticsUseCase],
+    response_cache: FromDishka[ResponseCache]
 ):
     """Get statistics for all categories"""
-    statistics = use_case.get_category_statistics()
-    return CategoryStatisticsResponse(**statistics)
+    async def render():
+        statistics = await use_case.get_category_statistics()
+        return model_response(CategoryStatisticsResponse(**statistics))
     
-@router.get("/", response_model=List[CategoryResponse])
+    # The statistics store is updated after the collection version: key by both
+    return await response_cache.respond(request, render, use_case.get_statistics_revision)
+
+@router.get("/statistics/extended", response_model=CategoryExtendedStatisticsResponse)
+@inject
+async def get_extended_category_statistics(
+    request: Request,
+    use_case: FromDishka[CategoryStatisticsUseCase],
+    response_cache: FromDishka[ResponseCache]
+):
+    """Get statistics for all categories with name length percentiles and histogram"""
+    async def render():
+        statistics = await use_case.get_extended_category_statistics()
+        return model_response(CategoryExtendedStatisticsResponse(**statistics))
+    
+    return await response_cache.respond(request, render)
+
+@router.get("/export", response_class=StreamingResponse)
+@inject
+async def export_categories(
+    use_case: FromDishka[CategoryReadUseCase],
+    export_format: Literal["ndjson", "json"] = Query("ndjson", alias="format")
+):
+    """Stream every category as NDJSON (one object per line) or as one JSON array"""
+    categories = use_case.export_categories()
+    if export_format == "json":
+        return StreamingResponse(_encode_json_array(categories), media_type="application/json")
+    return StreamingResponse(_encode_ndjson(categories), media_type="application/x-ndjson")
+
+
+async def _encode_ndjson(categories: AsyncIterator[Category]) -> AsyncIterator[str]:
+    lines = []
+    async for category in categories:
+        lines.append(_dump_category(category) + "\n")
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+async def _encode_json_array(categories: AsyncIterator[Category]) -> AsyncIterator[str]:
+    # The opening bracket goes out before the first document is read
+    yield "["
+    separator = ""
+    items = []
+    async for category in categories:
+        items.append(separator + _dump_category(category))
+        separator = ","
+        if len(items) >= EXPORT_CHUNK_SIZE:
+            yield "".join(items)
+            items = []
+    items.append("]")
+    yield "".join(items)
+
+
+def _dump_category(category: Category) -> str:
+    # Rows are encoded directly, without building a response model per row
+    return json.dumps({
+        "id": str(category.id),
+        "name": category.name,
+        "description": category.description
+    }, ensure_ascii=False)
+
+
+@router.get("/", response_model=List[CategoryListItemResponse], response_model_exclude_unset=True)
 @inject
 async def get_all_categories(
-    use_case: FromDishka[CategoryReadUseCase]
+    request: Request,
+    use_case: FromDishka[CategoryReadUseCase],
+    response_cache: FromDishka[ResponseCache],
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor: id of the last category of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. `name`")
 ):
-    categories = use_case.get_all_categories()
-    return [
-        CategoryResponse(
-            id=str(category.id),
-            name=str(category.name),
-            description=category.description
-        )
-        for category in categories
-    ]
+    projection = None
+    if fields is not None:
+        projection = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = set(projection) - set(CATEGORY_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    
+    async def render():
+        page = await use_case.get_categories_page(limit, CategoryId(after) if after else None, projection)
+        headers = {"X-Next-Cursor": str(page.next_cursor)} if page.next_cursor is not None else None
+        
+        # response_model documents the schema; the body is serialized once, without per-item models
+        return json_response(CATEGORY_LIST_ADAPTER, category_items(page.items, projection), headers)
+    
+    return await response_cache.respond(request, render)
 
 
 @router.post("/", response_model=CategoryResponse)
@@ -51,7 +161,7 @@ async def create_category(
     use_case: FromDishka[CategoryWriteUseCase]
 ):
     try:
-        category: Category = use_case.create_category(request.name, request.description)
+        category: Category = await use_case.create_category(request.name, request.description)
         return CategoryResponse(
             id=str(category.id),
             name=str(category.name),
@@ -61,21 +171,136 @@ async def create_category(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/batch", response_model=CategoryBatchResponse)
+@inject
+async def get_categories(
+    use_case: FromDishka[CategoryReadUseCase],
+    ids: List[str] = Query(..., description="Category ids; repeat the parameter: ?ids=a&ids=b")
+):
+    """Resolve many categories in one request: cache first, only the misses go to MongoDB"""
+    try:
+        categories = await use_case.get_categories([CategoryId(category_id) for category_id in ids])
+    except (InvalidCategoryError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    found = {str(category.id) for category in categories}
+    return json_response(CATEGORY_BATCH_ADAPTER, {
+        "items": category_items(categories),
+        "missing": [category_id for category_id in dict.fromkeys(ids) if category_id not in found]
+    })
+
+
+@router.get("/search", response_model=List[CategoryListItemResponse])
+@inject
+async def search_categories(
+    request: Request,
+    use_case: FromDishka[CategoryReadUseCase],
+    response_cache: FromDishka[ResponseCache],
+    q: str = Query(..., description="Name prefix (mode=prefix) or words to look for (mode=text)"),
+    mode: Literal["prefix", "text"] = Query("prefix"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT)
+):
+    """Autocomplete by name prefix, or full-text search of category names"""
+    try:
+        if mode == "prefix":
+            # Answered in microseconds from the in-process name index, which may trail another
+            # worker's write by its refresh interval: not cached under the current version
+            categories = await use_case.autocomplete_categories(q, limit)
+            return json_response(CATEGORY_LIST_ADAPTER, category_items(categories))
+        
+        async def render():
+            categories = await use_case.search_categories(q, limit)
+            return json_response(CATEGORY_LIST_ADAPTER, category_items(categories))
+        
+        return await response_cache.respond(request, render)
+    except InvalidCategoryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/bulk", response_model=CategoryBulkResponse)
+@inject
+async def create_categories(
+    request: CategoryBulkCreateRequest,
+    use_case: FromDishka[CategoryWriteUseCase]
+):
+    """Create many categories in one request; every item gets its own result"""
+    try:
+        results = await use_case.create_categories([
+            CreateCategoryDTO(name=item.name, description=item.description) for item in request.items
+        ])
+        return _bulk_response(results)
+    except InvalidCategoryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.put("/bulk", response_model=CategoryBulkResponse)
+@inject
+async def upsert_categories(
+    request: CategoryBulkUpsertRequest,
+    use_case: FromDishka[CategoryWriteUseCase]
+):
+    """Create or replace many categories by id in one request"""
+    try:
+        results = await use_case.upsert_categories([
+            UpdateCategoryDTO(id=CategoryId(item.id), name=item.name, description=item.description)
+            for item in request.items
+        ])
+        return _bulk_response(results)
+    except (InvalidCategoryError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/bulk-delete", response_model=CategoryBulkResponse)
+@inject
+async def delete_categories(
+    request: CategoryBulkDeleteRequest,
+    use_case: FromDishka[CategoryWriteUseCase]
+):
+    """Delete many categories by id in one request"""
+    try:
+        results = await use_case.delete_categories([CategoryId(category_id) for category_id in request.ids])
+        return _bulk_response(results)
+    except (InvalidCategoryError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _bulk_response(results: List[BulkItemResult]) -> CategoryBulkResponse:
+    succeeded = sum(1 for result in results if result.succeeded)
+    return CategoryBulkResponse(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=[
+            BulkItemResultResponse(
+                index=result.index,
+                id=str(result.category_id) if result.category_id is not None else None,
+                status=result.status.value,
+                error=result.error
+            )
+            for result in results
+        ]
+    )
+
+
 @router.get("/{category_id}", response_model=CategoryResponse)
 @inject
 async def get_category(
+    request: Request,
     category_id: str,
-    use_case: FromDishka[CategoryReadUseCase]
+    use_case: FromDishka[CategoryReadUseCase],
+    response_cache: FromDishka[ResponseCache]
 ):
-    try:
-        category = use_case.get_category(CategoryId(category_id))
-        return CategoryResponse(
+    async def render():
+        try:
+            category = await use_case.get_category(CategoryId(category_id))
+        except CategoryNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return model_response(CategoryResponse(
             id=str(category.id),
             name=str(category.name),
             description=category.description
-        )
-    except CategoryNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        ))
+    
+    return await response_cache.respond(request, render)
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
@@ -86,7 +311,7 @@ async def update_category(
     use_case: FromDishka[CategoryWriteUseCase]
 ):
     try:
-        category = use_case.update_category(
+        category = await use_case.update_category(
             CategoryId(category_id),
             request.name,
             request.description
@@ -109,7 +334,7 @@ async def delete_category(
     use_case: FromDishka[CategoryWriteUseCase]
 ):
     try:
-        result = use_case.delete_category(CategoryId(category_id))
+        result = await use_case.delete_category(CategoryId(category_id))
         if result:
             return {"message": "Category deleted successfully"}
         else:
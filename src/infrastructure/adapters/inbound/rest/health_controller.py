@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Response
+from infrastructure.adapters.inbound.rest.schemas.health_schemas import (
+    BackendCheckResponse,
+    LivenessResponse,
+    ReadinessResponse
+)
+from infrastructure.lifecycle.readiness import ReadinessProbe
+from dishka.integrations.fastapi import FromDishka, inject
+
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live", response_model=LivenessResponse)
+async def liveness():
+    """The process is running and serving requests; backends are not checked (a restart would not fix them)"""
+    return LivenessResponse(status="alive")
+
+
+@router.get("/ready", response_model=ReadinessResponse, responses={503: {"model": ReadinessResponse}})
+@inject
+async def readiness(
+    response: Response,
+    probe: FromDishka[ReadinessProbe]
+):
+    """Whether this worker should receive traffic: warm-up finished and the required backends answer"""
+    ready, backends = await probe.check()
+    if not ready:
+        response.status_code = 503
+    return ReadinessResponse(
+        status="ready" if ready else "not_ready",
+        backends={
+            name: BackendCheckResponse(
+                ok=check.ok, required=name in probe.required, latency_ms=check.latency_ms, error=check.error
+            )
+            for name, check in backends.items()
+        }
+    )
@@ -0,0 +1,72 @@
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from fastapi import Request, Response
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache
+
+
+# Response headers kept with a cached body (ETag and Cache-Control are added on every reply)
+_CACHED_HEADERS = ("X-Next-Cursor",)
+
+
+class ResponseCache:
+    """Encoded GET responses keyed by collection version and URL.
+    
+    A write bumps the collection version, which makes every cached body
+    unreachable - no invalidation needed. A repeat request costs one
+    version lookup and a dictionary hit; a request whose If-None-Match
+    matches the strong ETag (hash of the body) gets an empty 304. When the
+    version source returns None (the version cannot be read) responses are
+    rendered without caching. A response derived from more than the
+    collection also passes a revision source for its other input; the
+    revision becomes part of the key in the same way.
+    """
+    
+    def __init__(self, local_cache: LocalCache, version_source: Callable[[], Awaitable[Optional[int]]],
+                 max_age: int = 0):
+        self.local_cache = local_cache
+        self.version_source = version_source
+        self.cache_control = f"public, max-age={max_age}, must-revalidate"
+    
+    async def respond(self, request: Request, render: Callable[[], Awaitable[Response]],
+                      revision_source: Optional[Callable[[], Awaitable[Optional[int]]]] = None) -> Response:
+        """Serve ``request`` from the cache, or render it once for the current version.
+        
+        Only 200 responses are cached; errors raised by ``render`` propagate.
+        """
+        if revision_source is None:
+            version = await self.version_source()
+        else:
+            version, revision = await asyncio.gather(self.version_source(), revision_source())
+            version = None if version is None or revision is None else f"{version}.{revision}"
+        if version is None:
+            return await render()
+        key = f"{version}:{request.url.path}?{request.url.query}"
+        entry: Optional[Tuple[bytes, str, str, Dict[str, str]]] = self.local_cache.get(key)
+        if entry is None:
+            response = await render()
+            if response.status_code != 200:
+                return response
+            headers = {name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers}
+            entry = (bytes(response.body), self._etag(response.body), response.media_type, headers)
+            self.local_cache.set(key, entry)
+        
+        body, etag, media_type, headers = entry
+        headers = {**headers, "ETag": etag, "Cache-Control": self.cache_control}
+        if self._matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type=media_type, headers=headers)
+    
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        # Strong validator: equal ETags mean byte-identical bodies
+        return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    
+    @staticmethod
+    def _matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses weak comparison: a W/ prefix does not prevent a match
+        return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
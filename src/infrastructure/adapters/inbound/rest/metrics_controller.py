@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+from infrastructure.adapters.inbound.rest.schemas.metrics_schemas import CacheStatsResponse, PoolStatsResponse
+from infrastructure.adapters.outbound.cache.tiered_cache_adapter import TieredCacheAdapter
+from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.adapters.outbound.database.mongodb.pool_metrics import MongoPoolMetrics
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher
+from dishka.integrations.fastapi import FromDishka, inject
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+@inject
+async def get_cache_stats(
+    cache_adapter: FromDishka[TieredCacheAdapter]
+):
+    """Hit/miss/eviction counters of the in-process cache of this worker"""
+    return CacheStatsResponse(**cache_adapter.stats())
+
+
+
+@router.get("/pools", response_model=PoolStatsResponse)
+@inject
+async def get_pool_stats(
+    mongo_pool_metrics: FromDishka[MongoPoolMetrics],
+    redis_adapter: FromDishka[RedisCacheAdapter],
+    event_publisher: FromDishka[RabbitMQCategoryEventPublisher]
+):
+    """Connection pool utilization of this worker: MongoDB, Redis and the RabbitMQ publisher"""
+    publisher_stats = event_publisher.stats()
+    return PoolStatsResponse(
+        mongodb=mongo_pool_metrics.stats(),
+        redis=redis_adapter.pool_stats(),
+        rabbitmq={
+            "connected": publisher_stats["connected"],
+            "queued": publisher_stats["queued"],
+            "reconnects": publisher_stats["reconnects"]
+        }
+    )
@@ -0,0 +1,55 @@
+from typing import Any, Dict, List, Mapping, Optional
+from typing_extensions import NotRequired, TypedDict
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from domain.value_objects.category_page import CATEGORY_FIELDS
+from domain.value_objects.category_collection import CategoryCollection
+
+
+class CategoryItem(TypedDict):
+    """Wire shape of CategoryListItemResponse; fields left out by a projection are absent"""
+    id: str
+    name: NotRequired[Optional[str]]
+    description: NotRequired[Optional[str]]
+
+
+class CategoryBatch(TypedDict):
+    """Wire shape of CategoryBatchResponse"""
+    items: List[CategoryItem]
+    missing: List[str]
+
+
+# Serializers compiled once. dump_json writes plain dicts straight to JSON bytes in
+# pydantic-core: no model per item, and no second validation pass by FastAPI.
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[CategoryItem])
+CATEGORY_BATCH_ADAPTER = TypeAdapter(CategoryBatch)
+
+
+def json_response(adapter: TypeAdapter, content: Any, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """Serialized response for a route whose response_model only documents the schema.
+    
+    Returning a Response makes FastAPI skip response_model validation; the
+    content must already have the documented shape (it is built from domain
+    objects, not from user input).
+    """
+    return Response(content=adapter.dump_json(content), media_type="application/json", headers=headers)
+
+
+def model_response(model: BaseModel) -> Response:
+    """Already validated response model as an encoded JSON response"""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def category_items(categories, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Category dicts for the list endpoints; ``fields`` restricts them to a projection (id always included)"""
+    if isinstance(categories, CategoryCollection):
+        # Read straight from the columns, without a Category per row
+        return categories.to_dicts(["id", *fields] if fields is not None else None)
+    items = [
+        {"id": str(category.id), "name": category.name, "description": category.description}
+        for category in categories
+    ]
+    if fields is not None:
+        returned = [field for field in CATEGORY_FIELDS if field == "id" or field in fields]
+        items = [{field: item[field] for field in returned} for item in items]
+    return items
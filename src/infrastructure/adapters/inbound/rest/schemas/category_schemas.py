@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class CategoryCreateRequest(BaseModel):
@@ -12,6 +12,24 @@ class CategoryUpdateRequest(BaseModel):
     description: Optional[str] = None
 
 
+class CategoryUpsertRequest(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+
+
+class CategoryBulkCreateRequest(BaseModel):
+    items: List[CategoryCreateRequest]
+
+
+class CategoryBulkUpsertRequest(BaseModel):
+    items: List[CategoryUpsertRequest]
+
+
+class CategoryBulkDeleteRequest(BaseModel):
+    ids: List[str]
+
+
 class CategoryResponse(BaseModel):
     id: str
     name: str
@@ -21,6 +39,32 @@ class CategoryResponse(BaseModel):
         from_attributes = True
 
 
+class CategoryBatchResponse(BaseModel):
+    items: List[CategoryResponse]
+    # Requested ids that do not exist
+    missing: List[str]
+
+
+class CategoryListItemResponse(BaseModel):
+    """Item of the paginated list; fields left out by the `fields` projection are omitted"""
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+
+class BulkItemResultResponse(BaseModel):
+    index: int
+    id: Optional[str] = None
+    status: str
+    error: Optional[str] = None
+
+
+class CategoryBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResultResponse]
+
+
 class CategoryStatisticsResponse(BaseModel):
     total_count: int
     average_name_length: float
@@ -28,4 +72,18 @@ class CategoryStatisticsResponse(BaseModel):
     shortest_name: str
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class NameLengthBucketResponse(BaseModel):
+    """Histogram bucket: categories whose name length is within min_length..max_length"""
+    min_length: int
+    max_length: int
+    count: int
+
+
+class CategoryExtendedStatisticsResponse(CategoryStatisticsResponse):
+    min_name_length: int
+    max_name_length: int
+    # "p50", "p90", "p99" -> name length
+    name_length_percentiles: Dict[str, float]
+    name_length_histogram: List[NameLengthBucketResponse]
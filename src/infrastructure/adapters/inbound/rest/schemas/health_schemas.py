@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class LivenessResponse(BaseModel):
+    status: str
+
+
+class BackendCheckResponse(BaseModel):
+    ok: bool
+    required: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    backends: Dict[str, BackendCheckResponse]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+
+class ConnectionPoolStatsResponse(BaseModel):
+    max_size: int
+    open: int
+    in_use: int
+
+
+class MongoPoolStatsResponse(ConnectionPoolStatsResponse):
+    waiting: int
+    checkouts: int
+    checkout_timeouts: int
+    checkout_failures: int
+    pool_clears: int
+
+
+class PublisherConnectionStatsResponse(BaseModel):
+    connected: int
+    queued: int
+    reconnects: int
+
+
+class PoolStatsResponse(BaseModel):
+    mongodb: MongoPoolStatsResponse
+    redis: ConnectionPoolStatsResponse
+    rabbitmq: PublisherConnectionStatsResponse
@@ -1,104 +1,461 @@
+import asyncio
+import time
+from dataclasses import replace
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection, CategoryCollectionBuilder
+from domain.value_objects.bulk_item_result import BulkItemResult
 from domain.ports.outbound.category_repository import CategoryRepository
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 from .redis_adapter import RedisCacheAdapter
+from .tiered_cache_adapter import TieredCacheAdapter
+from .stampede_guard import StampedeGuard
+from .name_prefix_index import NamePrefixIndex
+
+
+# Full category list as a Redis hash (id -> category), updated in place on every write
+SNAPSHOT_KEY = "categories_snapshot"
+# Monotonic collection version, incremented atomically with every write
+VERSION_KEY = "categories_version"
+# Pages are keyed by collection version: a write makes every cached page unreachable
+PAGE_KEY_PREFIX = "categories_page"
+CACHE_TTL = 300  # 5 minutes cache
 
 
 class CachedCategoryRepository(CategoryRepository):
-    """Cached decorator for CategoryRepository"""
+    """Cached decorator for CategoryRepository.
+    
+    Prefix queries are answered from an in-process NamePrefixIndex. Writes
+    are applied to it in version order: local ones directly, other workers'
+    as their invalidation messages arrive (TieredCacheAdapter.on_change).
+    The collection version is checked every name_index_refresh_interval
+    seconds, and the index is rebuilt from find_all only if it is still
+    behind the version seen at the previous check, i.e. a change was lost.
+    name_index_max_age forces a rebuild even without a version change,
+    bounding how long the index can keep a snapshot served by a not yet
+    invalidated local cache. A rebuild sorts the whole collection (about
+    3 s per million names) on a worker thread, so it slows the event loop
+    down instead of blocking it, and holds two copies of the index meanwhile.
+    """
     
-    def __init__(self, repository: CategoryRepository, cache_adapter: RedisCacheAdapter):
+    def __init__(self, repository: CategoryRepository, cache_adapter: Union[TieredCacheAdapter, RedisCacheAdapter],
+                 stampede_guard: Optional[StampedeGuard] = None, name_index_refresh_interval: float = 1.0,
+                 name_index_max_age: float = 30.0):
         self.repository = repository
         self.cache_adapter = cache_adapter
+        self.stampede_guard = stampede_guard or StampedeGuard(cache_adapter)
+        self.name_index = NamePrefixIndex()
+        self.name_index_refresh_interval = name_index_refresh_interval
+        self.name_index_max_age = name_index_max_age
+        self._name_index_checked_at = 0.0
+        self._name_index_built_at = 0.0
+        self._name_index_lock = asyncio.Lock()
+        # Writes not yet applied to the index, by the version they produced
+        self._name_index_pending: Dict[int, Tuple[List[Category], List[str]]] = {}
+        # Collection version seen at the last check: the index should have caught up by the next one
+        self._name_index_target: Optional[int] = None
+        self._name_index_rebuilding = False
+        self._name_index_outdated = False
+        if isinstance(cache_adapter, TieredCacheAdapter):
+            cache_adapter.on_change(self._apply_change)
+        # The collection built from the last snapshot read, with that snapshot
+        self._snapshot_collection: Optional[Tuple[dict, CategoryCollection]] = None
     
-    def create(self, category: Category) -> Category:
+    async def create(self, category: Category) -> Category:
         # Create in the underlying repository
-        result = self.repository.create(category)
+        result = await self.repository.create(category)
         
-        # Invalidate cache for all categories since we added a new one
+        # Write the new category through to the cached list instead of dropping it
         if self.cache_adapter:
-            self.cache_adapter.delete("all_categories")
+            await self._write_through(result)
         
         return result
     
-    def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
-        # Try to get from cache first
+    async def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
         cache_key = f"category_{category_id}"
-        if self.cache_adapter:
-            cached_category = self.cache_adapter.get(cache_key)
-            # Check if cached_category is not None and is a dict (not a Mock object)
+        if not self.cache_adapter:
+            return await self.repository.find_by_id(category_id)
+        
+        # Try to get from cache first
+        cached_category, ttl = await self.cache_adapter.get_with_ttl(cache_key)
+        # Check if cached_category is not None and is a dict (not a Mock object)
+        if cached_category and isinstance(cached_category, dict):
+            # XFetch: occasionally rebuild a hot entry shortly before it expires
+            if self.stampede_guard.should_refresh_early(cache_key, ttl):
+                fresh = await self.stampede_guard.refresh_early(cache_key, lambda: self._load_category(category_id))
+                if fresh is not None:
+                    return fresh
+            return self._deserialize(cached_category)
+        
+        # Miss: one backend call for all concurrent callers
+        return await self.stampede_guard.load(
+            cache_key,
+            lambda: self._load_category(category_id),
+            read_cached=lambda: self._read_cached_category(cache_key)
+        )
+    
+    async def find_by_ids(self, category_ids: List[CategoryId]) -> List[Category]:
+        if not self.cache_adapter:
+            return await self.repository.find_by_ids(category_ids)
+        
+        unique_ids = list(dict.fromkeys(category_ids))
+        cached = await self.cache_adapter.get_many(*(f"category_{category_id}" for category_id in unique_ids))
+        found = {}
+        missing = []
+        for category_id in unique_ids:
+            cached_category = cached.get(f"category_{category_id}")
             if cached_category and isinstance(cached_category, dict):
-                return Category(
-                    id=CategoryId(cached_category['id']),
-                    name=cached_category['name'],
-                    description=cached_category['description']
+                found[category_id] = self._deserialize(cached_category)
+            else:
+                missing.append(category_id)
+        
+        # Only the cache misses go to the repository, in one query
+        if missing:
+            loaded = await self.repository.find_by_ids(missing)
+            if loaded:
+                await self.cache_adapter.set_many(
+                    {f"category_{category.id}": self._serialize(category) for category in loaded},
+                    expire=CACHE_TTL
                 )
+            found.update((category.id, category) for category in loaded)
         
-        # Get from underlying repository
-        category = self.repository.find_by_id(category_id)
-        if not category:
-            return None
+        return [found[category_id] for category_id in unique_ids if category_id in found]
+    
+    async def find_all(self) -> CategoryCollection:
+        if not self.cache_adapter:
+            return await self.repository.find_all()
         
-        # Save to cache
-        if self.cache_adapter:
-            self.cache_adapter.set(cache_key, {
-                'id': str(category.id),
-                'name': category.name,
-                'description': category.description
-            }, expire=300)  # 5 minutes cache
+        # Try to get from cache first
+        snapshot, ttl = await self.cache_adapter.get_snapshot_with_ttl(SNAPSHOT_KEY)
+        # Check if snapshot is not None and is a dict (not a Mock object)
+        if snapshot is not None and isinstance(snapshot, dict):
+            if self.stampede_guard.should_refresh_early(SNAPSHOT_KEY, ttl):
+                fresh = await self.stampede_guard.refresh_early(SNAPSHOT_KEY, self._load_all)
+                if fresh is not None:
+                    return fresh
+            return self._from_snapshot(snapshot)
         
-        return category
+        # Miss: one full scan for all concurrent callers
+        return await self.stampede_guard.load(SNAPSHOT_KEY, self._load_all, read_cached=self._read_cached_all)
     
-    def find_all(self) -> List[Category]:
-        # Try to get from cache first
-        if self.cache_adapter:
-            cached_categories = self.cache_adapter.get("all_categories")
-            # Check if cached_categories is not None and is a list (not a Mock object)
-            if cached_categories and isinstance(cached_categories, list):
-                return [
-                    Category(
-                        id=CategoryId(cat['id']),
-                        name=cat['name'],
-                        description=cat['description']
-                    ) for cat in cached_categories
-                    if isinstance(cat, dict)  # Additional check for each item
-                ]
+    def iter_all(self) -> AsyncIterator[Category]:
+        # Exports stream straight from the source: caching them would only evict hot entries
+        return self.repository.iter_all()
+    
+    async def find_page(self, limit: int, after: Optional[CategoryId] = None,
+                        fields: Optional[Sequence[str]] = None) -> CategoryPage:
+        if not self.cache_adapter:
+            return await self.repository.find_page(limit, after, fields)
         
-        # Get from underlying repository
-        categories = self.repository.find_all()
+        # The version read before the load goes into the key, so a page loaded
+        # concurrently with a write is stored under the already outdated version
+        version = await self.cache_adapter.get_version(VERSION_KEY)
+        if version is None:
+            # Without a version a cached page could not be told from a stale one
+            return await self.repository.find_page(limit, after, fields)
+        cache_key = self._page_key(version, limit, after, fields)
+        cached_page = await self.cache_adapter.get(cache_key)
+        if cached_page and isinstance(cached_page, dict):
+            return self._deserialize_page(cached_page)
         
-        # Save to cache
-        if self.cache_adapter:
-            serialized_categories = [
-                {
-                    'id': str(category.id),
-                    'name': category.name,
-                    'description': category.description
-                } for category in categories
-            ]
-            self.cache_adapter.set("all_categories", serialized_categories, expire=300)  # 5 minutes cache
+        return await self.stampede_guard.load(
+            cache_key,
+            lambda: self._load_page(cache_key, limit, after, fields),
+            read_cached=lambda: self._read_cached_page(cache_key)
+        )
+    
+    async def find_by_name_prefix(self, prefix: str, limit: int) -> List[Category]:
+        if not self.cache_adapter:
+            return await self.repository.find_by_name_prefix(prefix, limit)
         
-        return categories
+        await self._refresh_name_index()
+        return self.name_index.search(prefix, limit)
     
-    def update(self, category: Category) -> Category:
+    async def search_by_name(self, query: str, limit: int) -> List[Category]:
+        # Word matching and ranking need the text index: always answered by the repository
+        return await self.repository.search_by_name(query, limit)
+    
+    async def warm_up(self) -> None:
+        """Load the hot data before the first request: the collection snapshot (into Redis and
+        the local cache) and the name index built from it"""
+        if self.cache_adapter:
+            await self._refresh_name_index()
+    
+    async def get_version(self) -> Optional[int]:
+        """Collection version: incremented atomically with every write, so anything
+        derived from the collection (pages, HTTP responses) can be keyed by it.
+        None if the cache cannot be reached: nothing derived should be cached then"""
+        return await self.cache_adapter.get_version(VERSION_KEY)
+    
+    async def update(self, category: Category) -> Category:
         # Update in the underlying repository
-        result = self.repository.update(category)
+        result = await self.repository.update(category)
         
-        # Invalidate cache for this category and all categories
+        # Write the new state through to this category's key and the cached list in one round-trip
         if self.cache_adapter:
-            self.cache_adapter.delete(f"category_{category.id}")
-            self.cache_adapter.delete("all_categories")
+            await self._write_through(result)
         
         return result
     
-    def delete(self, category_id: CategoryId) -> bool:
+    async def delete(self, category_id: CategoryId) -> bool:
         # Delete from the underlying repository
-        result = self.repository.delete(category_id)
+        result = await self.repository.delete(category_id)
         
-        # If deletion was successful, invalidate cache
+        # If deletion was successful, remove it from the cache in one round-trip
         if result and self.cache_adapter:
-            self.cache_adapter.delete(f"category_{category_id}")
-            self.cache_adapter.delete("all_categories")
+            version = await self.cache_adapter.remove_through(
+                SNAPSHOT_KEY, VERSION_KEY, str(category_id), f"category_{category_id}"
+            )
+            self._apply_to_name_index(version, removed=[str(category_id)])
         
-        return result
\ No newline at end of file
+        return result
+    
+    async def create_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        results = await self.repository.create_many(categories)
+        if self.cache_adapter:
+            await self._write_through_many(categories, results)
+        return results
+    
+    async def upsert_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        results = await self.repository.upsert_many(categories)
+        if self.cache_adapter:
+            await self._write_through_many(categories, results)
+        return results
+    
+    async def delete_many(self, category_ids: List[CategoryId]) -> List[BulkItemResult]:
+        results = await self.repository.delete_many(category_ids)
+        
+        # One script call removes the whole batch from the cache
+        deleted = [result.category_id for result in results if result.succeeded]
+        if deleted and self.cache_adapter:
+            version = await self.cache_adapter.remove_through_many(
+                SNAPSHOT_KEY,
+                VERSION_KEY,
+                [(str(category_id), f"category_{category_id}") for category_id in deleted]
+            )
+            self._apply_to_name_index(version, removed=[str(category_id) for category_id in deleted])
+        return results
+    
+    async def _load_category(self, category_id: CategoryId) -> Optional[Category]:
+        # Get from underlying repository
+        category = await self.repository.find_by_id(category_id)
+        if not category:
+            return None
+        
+        # Save to cache
+        await self.cache_adapter.set(f"category_{category_id}", self._serialize(category), expire=CACHE_TTL)
+        return category
+    
+    async def _read_cached_category(self, cache_key: str) -> Optional[Category]:
+        cached_category = await self.cache_adapter.get(cache_key)
+        if cached_category and isinstance(cached_category, dict):
+            return self._deserialize(cached_category)
+        return None
+    
+    async def _load_all(self) -> CategoryCollection:
+        # Remember the version before loading: a write during the load makes the snapshot stale
+        version = await self.cache_adapter.get_version(VERSION_KEY)
+        
+        # Get from underlying repository
+        categories = CategoryCollection.of(await self.repository.find_all())
+        
+        if version is None:
+            return categories
+        
+        # Save to cache unless a write happened meanwhile
+        await self.cache_adapter.put_snapshot(
+            SNAPSHOT_KEY,
+            VERSION_KEY,
+            {
+                category_id: {'id': category_id, 'name': name, 'description': description}
+                for category_id, name, description in categories.rows()
+            },
+            expected_version=version,
+            expire=CACHE_TTL
+        )
+        return categories
+    
+    async def _read_cached_all(self) -> Optional[CategoryCollection]:
+        snapshot = await self.cache_adapter.get_snapshot(SNAPSHOT_KEY)
+        if snapshot is not None and isinstance(snapshot, dict):
+            return self._from_snapshot(snapshot)
+        return None
+    
+    async def _load_page(self, cache_key: str, limit: int, after: Optional[CategoryId],
+                         fields: Optional[Sequence[str]]) -> CategoryPage:
+        page = await self.repository.find_page(limit, after, fields)
+        await self.cache_adapter.set(cache_key, self._serialize_page(page), expire=CACHE_TTL)
+        return page
+    
+    async def _read_cached_page(self, cache_key: str) -> Optional[CategoryPage]:
+        cached_page = await self.cache_adapter.get(cache_key)
+        if cached_page and isinstance(cached_page, dict):
+            return self._deserialize_page(cached_page)
+        return None
+    
+    async def _write_through(self, category: Category) -> None:
+        version = await self.cache_adapter.write_through(
+            SNAPSHOT_KEY,
+            VERSION_KEY,
+            str(category.id),
+            self._serialize(category),
+            f"category_{category.id}",
+            expire=CACHE_TTL
+        )
+        self._apply_to_name_index(version, written=[category])
+    
+    async def _refresh_name_index(self) -> None:
+        """Rebuild the prefix index if it fell behind the collection version, or is too old.
+        
+        The version is read at most once per refresh interval. Changes still
+        on their way over the invalidation channel get one interval to arrive
+        before the index counts as behind. Concurrent callers wait for one
+        rebuild instead of each loading the collection.
+        """
+        if not self._name_index_needs_check():
+            return
+        async with self._name_index_lock:
+            if not self._name_index_needs_check():
+                return
+            version = await self.cache_adapter.get_version(VERSION_KEY)
+            now = time.monotonic()
+            indexed = self.name_index.version
+            if self._name_index_built_at == 0.0 or now - self._name_index_built_at >= self.name_index_max_age:
+                rebuild = True
+            elif version is None:
+                # Cache unreachable: keep serving the index, its age alone bounds staleness
+                rebuild = False
+            else:
+                target = self._name_index_target
+                rebuild = indexed is None or indexed > version or (target is not None and indexed < target)
+            self._name_index_target = version
+            if rebuild:
+                await self._rebuild_name_index(version)
+                self._name_index_built_at = now
+            self._name_index_checked_at = now
+    
+    async def _rebuild_name_index(self, version: Optional[int]) -> None:
+        # Writes arriving meanwhile are kept and applied on top of the new index
+        self._name_index_rebuilding = True
+        self._name_index_outdated = False
+        try:
+            categories = await self.find_all()
+            index = NamePrefixIndex()
+            # Sorting a large collection takes seconds: done off the event loop, then swapped in
+            await asyncio.to_thread(index.rebuild, categories, version)
+            if self._name_index_outdated:
+                index.version = None
+            self.name_index = index
+        finally:
+            self._name_index_rebuilding = False
+        self._drain_name_index()
+    
+    def _name_index_needs_check(self) -> bool:
+        return time.monotonic() - self._name_index_checked_at >= self.name_index_refresh_interval
+    
+    def _apply_change(self, key: str, version: Optional[int], written: Dict[str, Any], removed: List[str]) -> None:
+        # Another worker's write, received over the invalidation channel
+        if key == SNAPSHOT_KEY:
+            self._apply_to_name_index(
+                version, written=[self._deserialize(value) for value in written.values()], removed=removed
+            )
+    
+    def _apply_to_name_index(self, version: Optional[int], written: Sequence[Category] = (),
+                             removed: Sequence[str] = ()) -> None:
+        if not version:
+            # The write did not reach the cache (version 0): it cannot be placed among the others
+            self._name_index_outdated = True
+            self.name_index.version = None
+            self._name_index_pending.clear()
+            self._name_index_checked_at = 0.0
+            return
+        if self.name_index.version is None and not self._name_index_rebuilding:
+            # The next query rebuilds the index anyway
+            return
+        self._name_index_pending[version] = (list(written), list(removed))
+        self._drain_name_index()
+    
+    def _drain_name_index(self) -> None:
+        """Apply the pending writes that follow the indexed version, in version order.
+        
+        A write whose predecessor has not arrived waits for it; if it never
+        does, the next check finds the index behind and rebuilds it.
+        """
+        if self._name_index_rebuilding:
+            return
+        index = self.name_index
+        pending = self._name_index_pending
+        if index.version is None:
+            pending.clear()
+            return
+        while index.version + 1 in pending:
+            written, removed = pending.pop(index.version + 1)
+            for category in written:
+                index.put(category)
+            for category_id in removed:
+                index.remove(category_id)
+            index.version += 1
+        for version in [version for version in pending if version <= index.version]:
+            del pending[version]
+    
+    def _from_snapshot(self, snapshot: dict) -> CategoryCollection:
+        # L1 hands out the same snapshot object until it is evicted: build its collection once
+        cached = self._snapshot_collection
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        builder = CategoryCollectionBuilder()
+        for category_id in sorted(snapshot):
+            data = snapshot[category_id]
+            if isinstance(data, dict):  # Additional check for each item
+                builder.append(data['id'], data['name'], data['description'])
+        collection = builder.build()
+        self._snapshot_collection = (snapshot, collection)
+        return collection
+    
+    async def _write_through_many(self, categories: List[Category], results: List[BulkItemResult]) -> None:
+        # One script call writes the whole batch through to the cache
+        written = [
+            (result.category_id, categories[result.index]) for result in results if result.succeeded
+        ]
+        if written:
+            stored = [replace(category, id=category_id) for category_id, category in written]
+            version = await self.cache_adapter.write_through_many(
+                SNAPSHOT_KEY,
+                VERSION_KEY,
+                [(str(category.id), self._serialize(category), f"category_{category.id}") for category in stored],
+                expire=CACHE_TTL
+            )
+            self._apply_to_name_index(version, written=stored)
+    
+    @staticmethod
+    def _page_key(version: int, limit: int, after: Optional[CategoryId], fields: Optional[Sequence[str]]) -> str:
+        projection = ",".join(sorted(set(fields))) if fields is not None else "*"
+        return f"{PAGE_KEY_PREFIX}:{version}:{limit}:{after or ''}:{projection}"
+    
+    @classmethod
+    def _serialize_page(cls, page: CategoryPage) -> dict:
+        return {
+            'items': [cls._serialize(category) for category in page.items],
+            'next_cursor': str(page.next_cursor) if page.next_cursor is not None else None
+        }
+    
+    @classmethod
+    def _deserialize_page(cls, data: dict) -> CategoryPage:
+        return CategoryPage(
+            items=[cls._deserialize(item) for item in data['items']],
+            next_cursor=CategoryId.trusted(data['next_cursor']) if data['next_cursor'] else None
+        )
+    
+    @staticmethod
+    def _serialize(category: Category) -> dict:
+        return {
+            'id': str(category.id),
+            'name': category.name,
+            'description': category.description
+        }
+    
+    @staticmethod
+    def _deserialize(data: dict) -> Category:
+        # Cache entries are written from validated categories only
+        return Category.trusted(CategoryId.trusted(data['id']), data['name'], data['description'])
@@ -0,0 +1,63 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection
+from domain.value_objects.category_name_key import category_name_key
+
+
+class NamePrefixIndex:
+    """In-process sorted-array index of category names for prefix queries.
+    
+    Entries are (name key, id) tuples in one sorted list, so a query
+    is a binary search followed by reading at most ``limit`` neighbours:
+    O(log n + k). Rows are kept as (name, description) tuples and turned into
+    new Category objects per result, so callers cannot change the index.
+    ``version`` is the collection version the index reflects (None until it
+    is built, or once it is known to be outdated).
+    """
+    
+    def __init__(self):
+        self._entries: List[Tuple[str, str]] = []
+        self._rows: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.version: Optional[int] = None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def rebuild(self, categories: Iterable[Category], version: int) -> None:
+        """Replace the whole index with the given categories"""
+        rows = {
+            category_id: (name, description)
+            for category_id, name, description in CategoryCollection.of(categories).rows()
+        }
+        self._entries = sorted((category_name_key(name), category_id) for category_id, (name, _) in rows.items())
+        self._rows = rows
+        self.version = version
+    
+    def put(self, category: Category) -> None:
+        """Add a category or replace its previous state"""
+        category_id = str(category.id)
+        self.remove(category_id)
+        insort(self._entries, (category_name_key(category.name), category_id))
+        self._rows[category_id] = (category.name, category.description)
+    
+    def remove(self, category_id: str) -> None:
+        row = self._rows.pop(category_id, None)
+        if row is not None:
+            entry = (category_name_key(row[0]), category_id)
+            position = bisect_left(self._entries, entry)
+            if position < len(self._entries) and self._entries[position] == entry:
+                del self._entries[position]
+    
+    def search(self, prefix: str, limit: int) -> List[Category]:
+        """Categories whose name key starts with the key of ``prefix``, ordered by name key then id"""
+        prefix = category_name_key(prefix)
+        # (prefix,) sorts before every (name, id) entry whose name is or starts with prefix
+        position = bisect_left(self._entries, (prefix,))
+        found = []
+        for name, category_id in self._entries[position:position + limit]:
+            if not name.startswith(prefix):
+                break
+            found.append(Category.trusted(CategoryId.trusted(category_id), *self._rows[category_id]))
+        return found
@@ -1,86 +1,305 @@
-import redis
-import json
-from typing import Optional, Any
+import asyncio
+import redis.asyncio as redis
+from typing import Optional, Any, Dict, List, Tuple
+import uuid
 from infrastructure.config.settings import Settings
+from infrastructure.serialization.codecs import get_codec, decode_value
+
+
+# Маркер полноты снимка: хэш существует (даже для пустой коллекции) только после полной загрузки
+SNAPSHOT_MARKER = "__snapshot__"
+_SNAPSHOT_MARKER_FIELD = SNAPSHOT_MARKER.encode()
+
+# KEYS: хэш снимка, счетчик версии, ключи элементов; ARGV: тройки поле, значение, TTL элемента
+_WRITE_THROUGH_SCRIPT = """
+local snapshot_loaded = redis.call('EXISTS', KEYS[1]) == 1
+for i = 3, #KEYS do
+    local field, value, ttl = ARGV[(i - 3) * 3 + 1], ARGV[(i - 3) * 3 + 2], ARGV[(i - 3) * 3 + 3]
+    if snapshot_loaded then
+        redis.call('HSET', KEYS[1], field, value)
+    end
+    redis.call('SET', KEYS[i], value, 'EX', ttl)
+end
+return redis.call('INCR', KEYS[2])
+"""
+
+# KEYS: хэш снимка, счетчик версии, ключи элементов; ARGV: поля
+_REMOVE_THROUGH_SCRIPT = """
+for i = 1, #ARGV do
+    redis.call('HDEL', KEYS[1], ARGV[i])
+    redis.call('DEL', KEYS[i + 2])
+end
+return redis.call('INCR', KEYS[2])
+"""
+
+# KEYS: ключ блокировки; ARGV: токен владельца
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS: хэш снимка, счетчик версии; ARGV: ожидаемая версия, TTL, затем пары поле/значение
+_PUT_SNAPSHOT_SCRIPT = """
+local current = redis.call('GET', KEYS[2]) or '0'
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], '__snapshot__', '1')
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
 
 
 class RedisCacheAdapter:
     def __init__(self, settings: Settings):
-        self.client = redis.Redis(
+        # Явный пул соединений: размер и время ожидания свободного соединения задаются в Settings
+        self.pool = redis.BlockingConnectionPool(
             host=settings.redis_host,
             port=settings.redis_port,
             db=settings.redis_db,
-            decode_responses=True
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            # Таймауты сокета: недоступный Redis дает ошибку (и промах кэша), а не зависший запрос
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            # Значения бинарные (кодек с заголовком), поэтому ответы не декодируются в строки
+            decode_responses=False
         )
+        self.client = redis.Redis(connection_pool=self.pool)
+        # Кодек для записи; читаются значения любого кодека (и старые без заголовка) по заголовку
+        self.codec = get_codec(settings.cache_codec)
+        self._write_through = self.client.register_script(_WRITE_THROUGH_SCRIPT)
+        self._remove_through = self.client.register_script(_REMOVE_THROUGH_SCRIPT)
+        self._put_snapshot = self.client.register_script(_PUT_SNAPSHOT_SCRIPT)
+        self._release_lock = self.client.register_script(_RELEASE_LOCK_SCRIPT)
     
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Получить значение по ключу из кэша"""
+        value, _ = await self.get_with_ttl(key)
+        return value
+    
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Получить значение и оставшееся время жизни в секундах за один round-trip"""
         try:
-            value = self.client.get(key)
+            async with self.client.pipeline(transaction=False) as pipe:
+                value, ttl_ms = await pipe.get(key).pttl(key).execute()
             if value:
-                # Проверим тип значения перед десериализацией
-                if isinstance(value, (str, bytes, bytearray)):
-                    return json.loads(value)
-                else:
-                    return value
-            return None
+                return decode_value(value), self._ttl_seconds(ttl_ms)
+            return None, None
         except Exception:
-            return None
+            return None, None
+    
+    async def get_many(self, *keys: str) -> Dict[str, Any]:
+        """Получить несколько значений одной командой MGET; в результат попадают только найденные ключи"""
+        if not keys:
+            return {}
+        try:
+            values = await self.client.mget(keys)
+            return {key: decode_value(value) for key, value in zip(keys, values) if value}
+        except Exception:
+            return {}
     
-    def set(self, key: str, value: Any, expire: int = 3600) -> bool:
+    async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
         """Сохранить значение в кэше с указанным временем жизни"""
         try:
-            serialized_value = json.dumps(value)
-            result = self.client.setex(key, expire, serialized_value)
+            serialized_value = self.codec.encode(value)
+            result = await self.client.setex(key, expire, serialized_value)
             # Преобразуем результат в bool
             return bool(result)
         except Exception:
             return False
     
-    def delete(self, key: str) -> bool:
-        """Удалить значение из кэша по ключу"""
+    async def set_many(self, values: Dict[str, Any], expire: int = 3600) -> bool:
+        """Сохранить несколько значений одним конвейером SETEX (один round-trip)"""
+        if not values:
+            return True
         try:
-            result = self.client.delete(key)
-            # Преобразуем результат в int и сравним с 0
-            try:
-                # Попробуем преобразовать в int, если это возможно
-                if hasattr(result, '__await__'):
-                    # Если результат асинхронный, вернем True по умолчанию
-                    return True
-                # Проверим, является ли результат числом
-                if isinstance(result, (int, float)):
-                    return int(result) > 0
-                return True
-            except (TypeError, ValueError):
-                # Если не можем преобразовать в int, вернем True по умолчанию
-                return True
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.setex(key, expire, self.codec.encode(value))
+                results = await pipe.execute()
+            return all(results)
         except Exception:
             return False
     
-    def exists(self, key: str) -> bool:
+    async def delete(self, key: str) -> bool:
+        """Удалить значение из кэша по ключу"""
+        return await self.delete_many(key) > 0
+    
+    async def delete_many(self, *keys: str) -> int:
+        """Удалить несколько ключей одной командой DEL (один сетевой round-trip)"""
+        if not keys:
+            return 0
+        try:
+            return int(await self.client.delete(*keys))
+        except Exception:
+            return 0
+    
+    async def exists(self, key: str) -> bool:
         """Проверить существование ключа в кэше"""
         try:
-            result = self.client.exists(key)
-            # Преобразуем результат в int и сравним с 0
-            try:
-                # Попробуем преобразовать в int, если это возможно
-                if hasattr(result, '__await__'):
-                    # Если результат асинхронный, вернем True по умолчанию
-                    return True
-                # Проверим, является ли результат числом
-                if isinstance(result, (int, float)):
-                    return int(result) > 0
-                return True
-            except (TypeError, ValueError):
-                # Если не можем преобразовать в int, вернем True по умолчанию
-                return True
+            return int(await self.client.exists(key)) > 0
         except Exception:
             return False
     
-    def flush(self) -> bool:
+    async def flush(self) -> bool:
         """Очистить весь кэш"""
         try:
-            self.client.flushdb()
+            await self.client.flushdb()
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    async def get_snapshot(self, key: str) -> Optional[Dict[str, Any]]:
+        """Получить полный снимок коллекции (хэш поле -> значение) или None, если снимка нет"""
+        snapshot, _ = await self.get_snapshot_with_ttl(key)
+        return snapshot
+    
+    async def get_snapshot_with_ttl(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """Получить снимок коллекции и оставшееся время жизни в секундах за один round-trip"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                entries, ttl_ms = await pipe.hgetall(key).pttl(key).execute()
+            if not entries or _SNAPSHOT_MARKER_FIELD not in entries:
+                return None, None
+            return {
+                field.decode(): decode_value(value)
+                for field, value in entries.items()
+                if field != _SNAPSHOT_MARKER_FIELD
+            }, self._ttl_seconds(ttl_ms)
+        except Exception:
+            return None, None
+    
+    async def put_snapshot(self, key: str, version_key: str, entries: Dict[str, Any],
+                           expected_version: int, expire: int = 3600) -> bool:
+        """Сохранить снимок, только если версия не изменилась с момента начала загрузки"""
+        try:
+            args = [expected_version, expire]
+            for field, value in entries.items():
+                args.extend((field, self.codec.encode(value)))
+            return bool(await self._put_snapshot(keys=[key, version_key], args=args))
+        except Exception:
+            return False
+    
+    async def get_version(self, version_key: str) -> Optional[int]:
+        """Текущая версия коллекции (0, если записей еще не было; None, если Redis недоступен)"""
+        try:
+            return int(await self.client.get(version_key) or 0)
+        except Exception:
+            return None
+    
+    async def write_through(self, key: str, version_key: str, field: str, value: Any,
+                            item_key: str, expire: int = 3600) -> int:
+        """Записать элемент в снимок (если он загружен) и в ключ элемента, увеличить версию.
+        
+        Одна команда EVALSHA - O(1) работы и один round-trip на запись.
+        """
+        return await self.write_through_many(key, version_key, [(field, value, item_key)], expire)
+    
+    async def write_through_many(self, key: str, version_key: str, items: List[Tuple[str, Any, str]],
+                                 expire: int = 3600) -> int:
+        """Записать пачку элементов (поле, значение, ключ элемента) одним скриптом; версия растет один раз"""
+        if not items:
+            return 0
+        try:
+            args = []
+            for field, value, _ in items:
+                args.extend((field, self.codec.encode(value), expire))
+            return int(await self._write_through(
+                keys=[key, version_key, *(item_key for _, _, item_key in items)],
+                args=args
+            ))
+        except Exception:
+            # Не смогли обновить кэш - удаляем, чтобы не оставить устаревшие данные
+            await self.delete_many(key, *(item_key for _, _, item_key in items))
+            return await self._bump_version(version_key)
+    
+    async def remove_through(self, key: str, version_key: str, field: str, item_key: str) -> int:
+        """Удалить элемент из снимка и ключ элемента, увеличить версию (один round-trip)"""
+        return await self.remove_through_many(key, version_key, [(field, item_key)])
+    
+    async def remove_through_many(self, key: str, version_key: str, items: List[Tuple[str, str]]) -> int:
+        """Удалить пачку элементов (поле, ключ элемента) из снимка одним скриптом"""
+        if not items:
+            return 0
+        try:
+            return int(await self._remove_through(
+                keys=[key, version_key, *(item_key for _, item_key in items)],
+                args=[field for field, _ in items]
+            ))
+        except Exception:
+            await self.delete_many(key, *(item_key for _, item_key in items))
+            return await self._bump_version(version_key)
+    
+    async def _bump_version(self, version_key: str) -> int:
+        """Увеличить версию после неудачного скрипта: страницы и ответы, закэшированные
+        по старой версии, становятся недоступны, как и после успешной записи. 0, если Redis недоступен"""
+        try:
+            return int(await self.client.incr(version_key))
+        except Exception:
+            return 0
+    
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """Взять короткую блокировку (SET NX PX); вернуть токен владельца или None, если занята"""
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.client.set(key, token, nx=True, px=max(1, int(ttl * 1000)))
+            return token if acquired else None
+        except Exception:
+            # Redis недоступен - не блокируем вызывающего, пусть идет в источник
+            return token
+    
+    async def release_lock(self, key: str, token: str) -> bool:
+        """Снять блокировку, только если она все еще принадлежит владельцу токена"""
+        try:
+            return bool(await self._release_lock(keys=[key], args=[token]))
+        except Exception:
+            return False
+    
+    async def publish(self, channel: str, message: str) -> int:
+        """Опубликовать сообщение в канал pub/sub, вернуть число получателей"""
+        try:
+            return int(await self.client.publish(channel, message))
+        except Exception:
+            return 0
+    
+    def pubsub(self):
+        """Создать объект pub/sub (занимает отдельное соединение из пула)"""
+        return self.client.pubsub(ignore_subscribe_messages=True)
+    
+    @staticmethod
+    def _ttl_seconds(ttl_ms: Any) -> Optional[float]:
+        # PTTL: -1 - ключ без срока жизни, -2 - ключа нет
+        ttl_ms = int(ttl_ms)
+        return ttl_ms / 1000 if ttl_ms >= 0 else None
+    
+    async def ping(self) -> None:
+        """Проверить доступность Redis; в отличие от остальных методов ошибку не скрывает"""
+        await self.client.ping()
+    
+    async def warm_up(self, connections: int) -> None:
+        """Заранее открыть connections соединений пула (одновременные PING занимают разные соединения)"""
+        await asyncio.gather(*(self.client.ping() for _ in range(min(connections, self.pool.max_connections))))
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """Загрузка пула соединений этого воркера"""
+        # redis-py не отдает счетчики пула публично: читаем его списки соединений
+        in_use = len(self.pool._in_use_connections)
+        idle = len(self.pool._available_connections)
+        return {
+            "max_size": self.pool.max_connections,
+            "open": in_use + idle,
+            "in_use": in_use
+        }
+    
+    async def close(self) -> None:
+        """Закрыть клиент и все соединения пула"""
+        await self.client.aclose()
+        await self.pool.disconnect()
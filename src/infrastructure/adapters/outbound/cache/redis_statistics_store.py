@@ -0,0 +1,193 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection
+from domain.ports.outbound.category_statistics_store import CategoryStatisticsStore
+from .cached_category_repository import VERSION_KEY
+from .redis_adapter import RedisCacheAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# Category id -> name length, ordered by length (then by id) for the shortest and longest name
+LENGTHS_KEY = "category_stats:lengths"
+# Category id -> name
+NAMES_KEY = "category_stats:names"
+# Sum of all name lengths
+TOTAL_LENGTH_KEY = "category_stats:total_length"
+# Present only while the state is complete; its TTL forces a periodic rebuild
+READY_KEY = "category_stats:ready"
+# Incremented by every update, drop and rebuild of the state
+REVISION_KEY = "category_stats:revision"
+
+_KEYS = [LENGTHS_KEY, NAMES_KEY, TOTAL_LENGTH_KEY, READY_KEY]
+
+# KEYS: lengths, names, total, ready, revision; ARGV: triples id, length, name
+_SAVE_SCRIPT = """
+redis.call('INCR', KEYS[5])
+if redis.call('EXISTS', KEYS[4]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 3 do
+    local id, length = ARGV[i], tonumber(ARGV[i + 1])
+    local previous = tonumber(redis.call('ZSCORE', KEYS[1], id) or '0')
+    redis.call('INCRBY', KEYS[3], length - previous)
+    redis.call('ZADD', KEYS[1], length, id)
+    redis.call('HSET', KEYS[2], id, ARGV[i + 2])
+end
+return 1
+"""
+
+# KEYS: lengths, names, total, ready, revision; ARGV: ids
+_DELETE_SCRIPT = """
+redis.call('INCR', KEYS[5])
+if redis.call('EXISTS', KEYS[4]) == 0 then
+    return 0
+end
+for i = 1, #ARGV do
+    local previous = redis.call('ZSCORE', KEYS[1], ARGV[i])
+    if previous then
+        redis.call('INCRBY', KEYS[3], -tonumber(previous))
+        redis.call('ZREM', KEYS[1], ARGV[i])
+        redis.call('HDEL', KEYS[2], ARGV[i])
+    end
+end
+return 1
+"""
+
+# KEYS: lengths, names, total, ready; returns false, or count, total, shortest name, longest name
+_READ_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then
+    return false
+end
+local count = redis.call('ZCARD', KEYS[1])
+if count == 0 then
+    return {0, 0, '', ''}
+end
+local total = redis.call('GET', KEYS[3]) or '0'
+local shortest = redis.call('ZRANGE', KEYS[1], 0, 0)[1]
+-- Among the longest names take the lowest id, like min()/max() over the list in id order
+local longest_length = redis.call('ZREVRANGE', KEYS[1], 0, 0, 'WITHSCORES')[2]
+local longest = redis.call('ZRANGEBYSCORE', KEYS[1], longest_length, longest_length, 'LIMIT', 0, 1)[1]
+return {count, total, redis.call('HGET', KEYS[2], shortest), redis.call('HGET', KEYS[2], longest)}
+"""
+
+# KEYS: lengths, names, total, ready, collection version, revision; ARGV: expected version, TTL, then triples
+_REBUILD_SCRIPT = """
+if (redis.call('GET', KEYS[5]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+local total = 0
+for i = 3, #ARGV, 3 do
+    redis.call('ZADD', KEYS[1], ARGV[i + 1], ARGV[i])
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 2])
+    total = total + tonumber(ARGV[i + 1])
+end
+redis.call('SET', KEYS[3], total)
+redis.call('SET', KEYS[4], '1', 'EX', ARGV[2])
+redis.call('INCR', KEYS[6])
+return 1
+"""
+
+
+class RedisCategoryStatisticsStore(CategoryStatisticsStore):
+    """Category statistics kept in Redis and updated by Lua scripts on every write.
+    
+    A sorted set of name lengths gives the shortest and longest name in
+    O(log n) and survives deletes; a counter keeps the total length. Every
+    operation is one script call. If an update fails, the state is dropped
+    and the next read rebuilds it from the full collection.
+    
+    Updates are recorded after the MongoDB write, not atomically with it:
+    two concurrent writes of the same category may reach the store in the
+    opposite order of their commits, and a worker dying between the two
+    steps loses its update. Either leaves the statistics off until the
+    state expires after rebuild_interval seconds and is rebuilt, so that
+    interval is the bound on their drift.
+    
+    Every update also increments a revision counter. The collection version
+    changes before the update arrives, so a response rendered in between is
+    keyed by the new version but the old revision, and is not served once
+    the update lands.
+    """
+    
+    def __init__(self, redis_adapter: RedisCacheAdapter, rebuild_interval: int = 300):
+        client = redis_adapter.client
+        self.client = client
+        self.rebuild_interval = rebuild_interval
+        self._save = client.register_script(_SAVE_SCRIPT)
+        self._delete = client.register_script(_DELETE_SCRIPT)
+        self._read = client.register_script(_READ_SCRIPT)
+        self._rebuild = client.register_script(_REBUILD_SCRIPT)
+    
+    async def get_statistics(self) -> Optional[Dict[str, Any]]:
+        try:
+            result = await self._read(keys=_KEYS)
+        except Exception:
+            logger.warning("Reading category statistics failed", exc_info=True)
+            return None
+        if not result:
+            return None
+        count, total, shortest, longest = result
+        count, total = int(count), int(total)
+        return {
+            "total_count": count,
+            "average_name_length": total / count if count else 0,
+            "longest_name": self._text(longest),
+            "shortest_name": self._text(shortest)
+        }
+    
+    async def get_revision(self) -> Optional[int]:
+        try:
+            return int(await self.client.get(REVISION_KEY) or 0)
+        except Exception:
+            return None
+    
+    async def record_saved(self, categories: List[Category]) -> None:
+        if not categories:
+            return
+        args = []
+        for category in categories:
+            args.extend((str(category.id), len(category.name), category.name))
+        await self._apply(self._save, args)
+    
+    async def record_deleted(self, category_ids: List[CategoryId]) -> None:
+        if category_ids:
+            await self._apply(self._delete, [str(category_id) for category_id in category_ids])
+    
+    async def rebuild(self, load_categories: Callable[[], Awaitable[CategoryCollection]]) -> CategoryCollection:
+        # Remember the version before loading: a write during the load makes the result stale
+        try:
+            version = int(await self.client.get(VERSION_KEY) or 0)
+        except Exception:
+            return await load_categories()
+        categories = CategoryCollection.of(await load_categories())
+        
+        args = [version, self.rebuild_interval]
+        for (category_id, name, _), length in zip(categories.rows(), categories.name_lengths.tolist()):
+            args.extend((category_id, length, name))
+        try:
+            await self._rebuild(keys=[*_KEYS, VERSION_KEY, REVISION_KEY], args=args)
+        except Exception:
+            logger.warning("Rebuilding category statistics failed", exc_info=True)
+        return categories
+    
+    async def _apply(self, script, args: list) -> None:
+        try:
+            await script(keys=[*_KEYS, REVISION_KEY], args=args)
+        except Exception:
+            # A lost update would skew the statistics for good: drop them instead
+            logger.warning("Updating category statistics failed, dropping them", exc_info=True)
+            try:
+                await self.client.delete(READY_KEY)
+                await self.client.incr(REVISION_KEY)
+            except Exception:
+                pass
+    
+    @staticmethod
+    def _text(value: Any) -> str:
+        if isinstance(value, bytes):
+            return value.decode()
+        return value or ""
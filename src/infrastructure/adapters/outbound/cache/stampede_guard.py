@@ -0,0 +1,113 @@
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class StampedeGuard:
+    """Protects a cache against stampedes when a hot entry expires.
+    
+    * single-flight: concurrent recomputations of one key inside this process
+      share a single backend call;
+    * a short Redis lock (SET NX PX) elects one recomputing process across
+      workers, the others poll the cache for its result;
+    * XFetch probabilistic early refresh: before an entry expires, a reader
+      is occasionally elected to rebuild it, with a probability that grows as
+      the remaining TTL approaches the observed recomputation time (delta).
+    """
+    
+    def __init__(self, cache_adapter, lock_ttl: float = 5.0, beta: float = 1.0,
+                 poll_interval: float = 0.05, default_delta: float = 0.05, max_tracked_keys: int = 10000):
+        self.cache_adapter = cache_adapter
+        self.lock_ttl = lock_ttl
+        self.beta = beta
+        self.poll_interval = poll_interval
+        self.default_delta = default_delta
+        self.max_tracked_keys = max_tracked_keys
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Last observed recomputation time per key (the XFetch delta), bounded LRU
+        self._deltas: "OrderedDict[str, float]" = OrderedDict()
+    
+    def should_refresh_early(self, key: str, ttl_remaining: Optional[float]) -> bool:
+        """XFetch test: -delta * beta * ln(rand) >= remaining TTL"""
+        if ttl_remaining is None:
+            return False
+        delta = self._deltas.get(key, self.default_delta)
+        # 1 - random() lies in (0, 1], so the logarithm is always defined
+        return -delta * self.beta * math.log(1.0 - random.random()) >= ttl_remaining
+    
+    def is_in_flight(self, key: str) -> bool:
+        return key in self._in_flight
+    
+    async def load(self, key: str, compute: Callable[[], Awaitable[Any]],
+                   read_cached: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """Recompute ``key`` once for all concurrent callers (in this process and across workers).
+        
+        ``compute`` loads from the backend and stores the result in the cache.
+        ``read_cached`` is polled while another worker holds the lock; if it
+        produces a value, the backend is not called at all.
+        """
+        return await self._single_flight(key, lambda: self._load_once(key, compute, read_cached))
+    
+    async def refresh_early(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        """Rebuild an entry that is still valid, if nobody else already does.
+        
+        Returns the fresh value, or None when another caller or worker is
+        rebuilding it - the caller should then keep serving its stale value.
+        """
+        if self.is_in_flight(key):
+            return None
+        token = await self.cache_adapter.acquire_lock(self._lock_key(key), self.lock_ttl)
+        if not token:
+            return None
+        if self.is_in_flight(key):
+            # A local miss started a rebuild while we were acquiring the lock
+            await self.cache_adapter.release_lock(self._lock_key(key), token)
+            return None
+        return await self._single_flight(key, lambda: self._compute(key, compute, token))
+    
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(factory())
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shield: a cancelled caller must not cancel the load the others are waiting on
+        return await asyncio.shield(in_flight)
+    
+    async def _load_once(self, key: str, compute: Callable[[], Awaitable[Any]],
+                         read_cached: Optional[Callable[[], Awaitable[Any]]]) -> Any:
+        token = await self.cache_adapter.acquire_lock(self._lock_key(key), self.lock_ttl)
+        if not token and read_cached is not None:
+            # Another worker is rebuilding: wait for its result instead of hitting the backend
+            deadline = time.monotonic() + self.lock_ttl
+            while not token and time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                value = await read_cached()
+                if value is not None:
+                    return value
+                # Lock released without a cached result (e.g. nothing to cache): take over
+                token = await self.cache_adapter.acquire_lock(self._lock_key(key), self.lock_ttl)
+            # Either we hold the lock now or the holder did not deliver in time: compute ourselves
+        return await self._compute(key, compute, token)
+    
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]], token: Optional[str]) -> Any:
+        started = time.monotonic()
+        try:
+            return await compute()
+        finally:
+            self._record_delta(key, time.monotonic() - started)
+            if token:
+                await self.cache_adapter.release_lock(self._lock_key(key), token)
+    
+    def _record_delta(self, key: str, delta: float) -> None:
+        self._deltas[key] = delta
+        self._deltas.move_to_end(key)
+        if len(self._deltas) > self.max_tracked_keys:
+            self._deltas.popitem(last=False)
+    
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"lock:{key}"
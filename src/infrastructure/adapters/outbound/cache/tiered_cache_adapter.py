@@ -0,0 +1,298 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from .local_cache import LocalCache
+from .redis_adapter import RedisCacheAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# Called with the snapshot key, the version a write produced, and the fields it wrote and removed
+ChangeListener = Callable[[str, Optional[int], Dict[str, Any], List[str]], None]
+
+
+class TieredCacheAdapter:
+    """Two-tier cache: in-process LocalCache (L1) in front of Redis (L2).
+    
+    Exposes the same interface as RedisCacheAdapter. Every invalidation is
+    broadcast on a Redis pub/sub channel so that the L1 caches of all other
+    workers drop the same keys; the L1 TTL bounds staleness if a message is lost.
+    
+    A Redis read still in flight when its key is invalidated would put the
+    old value back into L1. Every local invalidation bumps the key's
+    generation (a clear bumps the epoch), and a value read from Redis is
+    only kept locally if neither changed while the read was pending.
+    
+    L1 also tracks the collection version it reflects: each write's message
+    carries the version it produced. A version read from Redis that is ahead
+    of the invalidations received so far means a message is late or lost,
+    and L1 is cleared before anything is derived from that version.
+    
+    Snapshot writes also carry the fields they wrote and removed, so state
+    derived from the snapshot elsewhere (the name index) can follow another
+    worker's writes without reloading the snapshot: see on_change.
+    """
+    
+    def __init__(self, redis_adapter: RedisCacheAdapter, local_cache: LocalCache, channel: str):
+        self.redis_adapter = redis_adapter
+        self.local_cache = local_cache
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        # Collection version L1 reflects (None: unknown), and versions received out of order
+        self._version: Optional[int] = None
+        self._pending_versions: Set[int] = set()
+        self._change_listeners: List[ChangeListener] = []
+    
+    async def get(self, key: str) -> Optional[Any]:
+        value, _ = await self.get_with_ttl(key)
+        return value
+    
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """L1 hits report no TTL: they are short-lived and never need an early refresh"""
+        self._ensure_listener()
+        value = self.local_cache.get(key)
+        if value is not None:
+            return value, None
+        
+        generation = self._generation(key)
+        value, ttl = await self.redis_adapter.get_with_ttl(key)
+        if value is not None and self._generation(key) == generation:
+            self.local_cache.set(key, value, ttl=ttl)
+        return value, ttl
+    
+    async def get_many(self, *keys: str) -> Dict[str, Any]:
+        self._ensure_listener()
+        found = {}
+        remote = []
+        for key in keys:
+            value = self.local_cache.get(key)
+            if value is not None:
+                found[key] = value
+            else:
+                remote.append(key)
+        
+        # Only the local misses go to Redis, in one MGET
+        if remote:
+            generations = {key: self._generation(key) for key in remote}
+            values = await self.redis_adapter.get_many(*remote)
+            for key, value in values.items():
+                if self._generation(key) == generations[key]:
+                    self.local_cache.set(key, value)
+            found.update(values)
+        return found
+    
+    async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
+        self._ensure_listener()
+        self.local_cache.set(key, value, ttl=expire)
+        return await self.redis_adapter.set(key, value, expire=expire)
+    
+    async def set_many(self, values: Dict[str, Any], expire: int = 3600) -> bool:
+        self._ensure_listener()
+        for key, value in values.items():
+            self.local_cache.set(key, value, ttl=expire)
+        return await self.redis_adapter.set_many(values, expire=expire)
+    
+    async def delete(self, key: str) -> bool:
+        return await self.delete_many(key) > 0
+    
+    async def delete_many(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        self._ensure_listener()
+        result = await self.redis_adapter.delete_many(*keys)
+        # Evicted after the L2 write; reads of these keys still in flight see the new generation
+        await self._evict(list(keys))
+        return result
+    
+    async def get_snapshot(self, key: str) -> Optional[Dict[str, Any]]:
+        snapshot, _ = await self.get_snapshot_with_ttl(key)
+        return snapshot
+    
+    async def get_snapshot_with_ttl(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        self._ensure_listener()
+        snapshot = self.local_cache.get(key)
+        if snapshot is not None:
+            return snapshot, None
+        
+        generation = self._generation(key)
+        snapshot, ttl = await self.redis_adapter.get_snapshot_with_ttl(key)
+        if snapshot is not None and self._generation(key) == generation:
+            self.local_cache.set(key, snapshot, ttl=ttl)
+        return snapshot, ttl
+    
+    async def put_snapshot(self, key: str, version_key: str, entries: Dict[str, Any],
+                           expected_version: int, expire: int = 3600) -> bool:
+        self._ensure_listener()
+        generation = self._generation(key)
+        stored = await self.redis_adapter.put_snapshot(key, version_key, entries, expected_version, expire)
+        # A write that landed after the snapshot was stored has already evicted it elsewhere
+        if stored and self._generation(key) == generation:
+            self.local_cache.set(key, entries, ttl=expire)
+        return stored
+    
+    async def get_version(self, version_key: str) -> Optional[int]:
+        # Always read from Redis: the version is what tells workers apart
+        self._ensure_listener()
+        version = await self.redis_adapter.get_version(version_key)
+        if version is not None and (self._version is None or version > self._version):
+            # Writes up to this version whose invalidations have not arrived: L1 may hold their old data
+            self._invalidate(None)
+            self._version = version
+            self._pending_versions = {pending for pending in self._pending_versions if pending > version}
+        return version
+    
+    async def write_through(self, key: str, version_key: str, field: str, value: Any,
+                            item_key: str, expire: int = 3600) -> int:
+        self._ensure_listener()
+        version = await self.redis_adapter.write_through(key, version_key, field, value, item_key, expire)
+        await self._evict([key, item_key], version, (key, {field: value}, []))
+        return version
+    
+    async def write_through_many(self, key: str, version_key: str, items: List[Tuple[str, Any, str]],
+                                 expire: int = 3600) -> int:
+        self._ensure_listener()
+        version = await self.redis_adapter.write_through_many(key, version_key, items, expire)
+        written = {field: value for field, value, _ in items}
+        await self._evict([key, *(item_key for _, _, item_key in items)], version, (key, written, []))
+        return version
+    
+    async def remove_through(self, key: str, version_key: str, field: str, item_key: str) -> int:
+        self._ensure_listener()
+        version = await self.redis_adapter.remove_through(key, version_key, field, item_key)
+        await self._evict([key, item_key], version, (key, {}, [field]))
+        return version
+    
+    async def remove_through_many(self, key: str, version_key: str, items: List[Tuple[str, str]]) -> int:
+        self._ensure_listener()
+        version = await self.redis_adapter.remove_through_many(key, version_key, items)
+        removed = [field for field, _ in items]
+        await self._evict([key, *(item_key for _, item_key in items)], version, (key, {}, removed))
+        return version
+    
+    async def exists(self, key: str) -> bool:
+        if self.local_cache.get(key) is not None:
+            return True
+        return await self.redis_adapter.exists(key)
+    
+    async def flush(self) -> bool:
+        result = await self.redis_adapter.flush()
+        self._invalidate(None)
+        await self._broadcast(None)
+        return result
+    
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        return await self.redis_adapter.acquire_lock(key, ttl)
+    
+    async def release_lock(self, key: str, token: str) -> bool:
+        return await self.redis_adapter.release_lock(key, token)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the in-process tier"""
+        return self.local_cache.stats()
+    
+    def on_change(self, listener: ChangeListener) -> None:
+        """Call listener(key, version, written, removed) for every snapshot write made by another worker"""
+        self._change_listeners.append(listener)
+    
+    def handle_invalidation(self, message: str) -> None:
+        """Apply an invalidation message received from another worker"""
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+        self._invalidate(payload.get("keys"))
+        self._advance_version(payload.get("version"))
+        changes = payload.get("changes")
+        if changes:
+            for listener in self._change_listeners:
+                try:
+                    listener(changes["key"], payload.get("version"), changes["written"], changes["removed"])
+                except Exception:
+                    logger.warning("Cache change listener failed", exc_info=True)
+    
+    def _generation(self, key: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(key, 0)
+    
+    def _invalidate(self, keys: Optional[List[str]]) -> None:
+        """Drop keys (None: everything) from L1 and make pending reads of them discard their result"""
+        if keys is None or len(self._generations) + len(keys) > self.local_cache.max_size:
+            # A new epoch invalidates every pending read at once, so the counters can start over
+            self._epoch += 1
+            self._generations.clear()
+        else:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+        if keys is None:
+            self.local_cache.clear()
+            self._version = None
+        else:
+            self.local_cache.delete(*keys)
+    
+    def _advance_version(self, version: Optional[int]) -> None:
+        """Record that L1 no longer holds data older than the write that produced version"""
+        # 0 is returned by a write that failed to reach Redis
+        if not version or self._version is None or version <= self._version:
+            return
+        self._pending_versions.add(version)
+        while self._version + 1 in self._pending_versions:
+            self._version += 1
+            self._pending_versions.discard(self._version)
+        if len(self._pending_versions) > self.local_cache.max_size:
+            # A gap that never closes: the next version read resynchronizes L1
+            self._invalidate(None)
+            self._pending_versions.clear()
+    
+    async def _evict(self, keys: List[str], version: Optional[int] = None,
+                     changes: Optional[Tuple[str, Dict[str, Any], List[str]]] = None) -> None:
+        self._invalidate(keys)
+        self._advance_version(version)
+        await self._broadcast(keys, version, changes)
+    
+    async def _broadcast(self, keys: Optional[List[str]], version: Optional[int] = None,
+                         changes: Optional[Tuple[str, Dict[str, Any], List[str]]] = None) -> None:
+        """Tell the other workers to drop these keys (None drops everything) written at version,
+        with the snapshot fields the write changed, if any"""
+        payload = {"origin": self.instance_id, "keys": keys, "version": version}
+        if changes is not None:
+            key, written, removed = changes
+            payload["changes"] = {"key": key, "written": written, "removed": removed}
+        await self.redis_adapter.publish(self.channel, json.dumps(payload))
+    
+    def _ensure_listener(self) -> None:
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.get_running_loop().create_task(self._listen())
+    
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis_adapter.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message and message.get("type") == "message":
+                        self.handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Missed messages while disconnected: drop everything, L2 stays authoritative
+                logger.warning("Cache invalidation channel lost, resubscribing", exc_info=True)
+                self._invalidate(None)
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+    
+    async def close(self) -> None:
+        """Stop listening for invalidations"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener_task = None
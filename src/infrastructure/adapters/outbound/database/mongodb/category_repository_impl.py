@@ -1,86 +1,401 @@
+import asyncio
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection, CategoryCollectionBuilder
+from domain.value_objects.bulk_item_result import BulkItemResult, BulkItemStatus
 from domain.ports.outbound.category_repository import CategoryRepository
-from typing import List, Optional
-import pymongo
-from bson import ObjectId
+from domain.exceptions.category_exceptions import CategoryAlreadyExistsError, CategoryNotFoundError
+from domain.events.category_events import CategoryCreated, CategoryDeleted, CategoryEvent, CategoryUpdated
+from domain.value_objects.category_name_key import category_name_key
+from infrastructure.mappers.event_mappers import event_to_message
+from .indexes import apply_indexes
+from .query_plan_inspector import FULL_SCAN_COMMENT
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+
+# MongoDB error code for a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
+# Collection the domain events are recorded in when the transactional outbox is enabled
+OUTBOX_COLLECTION = "category_outbox"
+
+# Documents whose name key is backfilled per bulk write
+NAME_KEY_BACKFILL_BATCH_SIZE = 1000
+
+# Bulk reads leave out the name key: it is derived from the name and only queried on
+WITHOUT_NAME_KEY = {"name_key": 0}
+
+T = TypeVar("T")
 
 
 class MongoCategoryRepository(CategoryRepository):
-    """MongoDB implementation of CategoryRepository"""
+    """MongoDB implementation of CategoryRepository (non-blocking, Motor based).
+    
+    With outbox_enabled every write also records its domain events in the
+    outbox collection inside the same transaction (requires a replica set),
+    so a change is never stored without its events or the other way round.
+    OutboxRelay delivers them to the broker afterwards.
+    """
     
-    def __init__(self, connection_string: str, database_name: str):
-        self.client = pymongo.MongoClient(connection_string)
+    def __init__(self, connection_string: str, database_name: str, export_batch_size: int = 1000,
+                 outbox_enabled: bool = False, event_listeners: Sequence[Any] = (),
+                 client_options: Optional[Dict[str, Any]] = None):
+        # event_listeners: pymongo monitoring listeners (MongoPoolMetrics, QueryPlanInspector);
+        # client_options: pool size and timeouts, as MongoClient keyword options
+        self.client = AsyncIOMotorClient(
+            connection_string, event_listeners=list(event_listeners), **(client_options or {})
+        )
         self.db = self.client[database_name]
         self.collection = self.db.categories
+        self.outbox = self.db[OUTBOX_COLLECTION]
+        self.export_batch_size = export_batch_size
+        self.outbox_enabled = outbox_enabled
     
-    def create(self, category: Category) -> Category:
+    async def create(self, category: Category) -> Category:
         # Create should only create new categories
         if category.id is None:
             category.id = CategoryId.new()
-        else:
-            # If ID exists, check that category doesn't already exist
-            existing = self.collection.find_one({"_id": str(category.id)})
-            if existing:
-                raise ValueError(f"Category with id {category.id} already exists")
         
-        # Convert to dict for MongoDB
-        category_dict = {
-            "_id": str(category.id),
-            "name": category.name,
-            "description": category.description
-        }
+        async def write(session):
+            await self.collection.insert_one(self._to_document(category), session=session)
+            await self._record_events(session, [CategoryCreated(category.id, category.name, category.description)])
         
-        # Insert new category
-        self.collection.insert_one(category_dict)
+        # Insert new category; the unique _id index rejects duplicates in the same round-trip
+        try:
+            await self._write(write)
+        except DuplicateKeyError:
+            raise CategoryAlreadyExistsError(f"Category with id {category.id} already exists")
         
         return category
     
-    def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
-        doc = self.collection.find_one({"_id": str(category_id)})
+    async def find_by_id(self, category_id: CategoryId) -> Optional[Category]:
+        doc = await self.collection.find_one({"_id": str(category_id)})
         if not doc:
             return None
         
-        return Category(
-            id=CategoryId(doc["_id"]),
-            name=doc["name"],
-            description=doc.get("description")
-        )
+        return self._to_category(doc)
     
-    def find_all(self) -> List[Category]:
-        categories = []
-        for doc in self.collection.find():
-            categories.append(Category(
-                id=CategoryId(doc["_id"]),
-                name=doc["name"],
-                description=doc.get("description")
-            ))
-        return categories
-    
-    def update(self, category: Category) -> Category:
+    async def find_by_ids(self, category_ids: List[CategoryId]) -> List[Category]:
+        ids = list(dict.fromkeys(str(category_id) for category_id in category_ids))
+        if not ids:
+            return []
+        found = {doc["_id"]: doc async for doc in self.collection.find({"_id": {"$in": ids}})}
+        return [self._to_category(found[category_id]) for category_id in ids if category_id in found]
+    
+    async def find_all(self) -> CategoryCollection:
+        # Rows are packed as they arrive: no Category objects, and no list of documents
+        builder = CategoryCollectionBuilder()
+        async for doc in self.collection.find({}, WITHOUT_NAME_KEY).sort("_id", 1).batch_size(self.export_batch_size):
+            builder.append(doc["_id"], doc["name"], doc.get("description"))
+        return builder.build()
+    
+    async def iter_all(self) -> AsyncIterator[Category]:
+        # Documents arrive from the server export_batch_size at a time: memory stays bounded
+        cursor = self.collection.find({}, WITHOUT_NAME_KEY).sort("_id", 1).batch_size(self.export_batch_size)
+        try:
+            async for doc in cursor:
+                yield self._to_category(doc)
+        finally:
+            # The consumer may stop early (e.g. the client disconnected): free the server cursor
+            await cursor.close()
+    
+    async def find_page(self, limit: int, after: Optional[CategoryId] = None,
+                        fields: Optional[Sequence[str]] = None) -> CategoryPage:
+        # Keyset pagination on the _id index: the cost of a page does not depend on its position
+        query = {"_id": {"$gt": str(after)}} if after is not None else {}
+        projection = None
+        if fields is not None:
+            projection = {"name": 1}
+            projection.update({field: 1 for field in fields if field not in ("id", "name")})
+        
+        # One extra document tells whether there is a next page
+        cursor = self.collection.find(query, projection).sort("_id", 1).limit(limit + 1)
+        docs = await cursor.to_list(length=limit + 1)
+        items = [self._to_category(doc) for doc in docs[:limit]]
+        next_cursor = items[-1].id if len(docs) > limit else None
+        return CategoryPage(items=items, next_cursor=next_cursor)
+    
+    async def find_by_name_prefix(self, prefix: str, limit: int) -> List[Category]:
+        # A range scan on the name_prefix index: reads at most limit index entries.
+        # Keys compare by code point, like the in-process NamePrefixIndex
+        key = category_name_key(prefix)
+        key_range = {"$gte": key}
+        upper_bound = self._prefix_upper_bound(key)
+        if upper_bound is not None:
+            key_range["$lt"] = upper_bound
+        cursor = self.collection.find({"name_key": key_range}).sort(
+            [("name_key", ASCENDING), ("_id", ASCENDING)]
+        ).limit(limit)
+        return [self._to_category(doc) async for doc in cursor]
+    
+    async def search_by_name(self, query: str, limit: int) -> List[Category]:
+        cursor = self.collection.find(
+            {"$text": {"$search": query}},
+            {"name": 1, "description": 1, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+        return [self._to_category(doc) async for doc in cursor]
+    
+    async def ping(self) -> None:
+        """Round-trip to the server; raises if it cannot be reached"""
+        await self.client.admin.command("ping")
+    
+    async def warm_up(self, connections: int) -> None:
+        """Open that many pooled connections now (concurrent pings each check one out)"""
+        await asyncio.gather(*(self.ping() for _ in range(max(1, connections))))
+    
+    def close(self) -> None:
+        """Close the client and its connection pools"""
+        self.client.close()
+    
+    async def ensure_indexes(self) -> None:
+        """Create the indexes of the registry (indexes.INDEXES) the queries rely on"""
+        await self._backfill_name_keys()
+        await apply_indexes(self.db)
+    
+    async def update(self, category: Category) -> Category:
         # Update should only update existing categories
         if category.id is None:
             raise ValueError("Category ID is required for update")
         
-        # Check that category exists
-        existing = self.collection.find_one({"_id": str(category.id)})
-        if not existing:
-            raise ValueError(f"Category with id {category.id} not found")
+        async def write(session):
+            # Replace without upsert: the matched count tells whether the category exists
+            result = await self.collection.replace_one(
+                {"_id": str(category.id)},
+                self._to_document(category),
+                session=session
+            )
+            if result.matched_count == 0:
+                # Raising inside the transaction aborts it: no event is recorded
+                raise CategoryNotFoundError(f"Category with id {category.id} not found")
+            await self._record_events(session, [CategoryUpdated(category.id, category.name, category.description)])
+        
+        await self._write(write)
+        return category
+    
+    async def delete(self, category_id: CategoryId) -> bool:
+        async def write(session):
+            result = await self.collection.delete_one({"_id": str(category_id)}, session=session)
+            if result.deleted_count > 0:
+                await self._record_events(session, [CategoryDeleted(category_id)])
+            return result.deleted_count > 0
         
-        category_dict = {
+        return await self._write(write)
+    
+    async def create_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        if not categories:
+            return []
+        for category in categories:
+            if category.id is None:
+                category.id = CategoryId.new()
+        
+        if self.outbox_enabled:
+            errors = await self._create_many_with_outbox(categories)
+        else:
+            errors = {}
+            try:
+                # Unordered: the server applies every valid document and reports the rest
+                await self.collection.insert_many(
+                    [self._to_document(category) for category in categories], ordered=False
+                )
+            except BulkWriteError as e:
+                errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+        
+        results = []
+        for index, category in enumerate(categories):
+            error = errors.get(index)
+            if error is None:
+                results.append(BulkItemResult(index, category.id, BulkItemStatus.CREATED))
+            elif error.get("code") == DUPLICATE_KEY_ERROR:
+                results.append(BulkItemResult(
+                    index, category.id, BulkItemStatus.CONFLICT, f"Category with id {category.id} already exists"
+                ))
+            else:
+                results.append(BulkItemResult(index, category.id, BulkItemStatus.FAILED, error.get("errmsg")))
+        return results
+    
+    async def upsert_many(self, categories: List[Category]) -> List[BulkItemResult]:
+        if not categories:
+            return []
+        for category in categories:
+            if category.id is None:
+                category.id = CategoryId.new()
+        
+        operations = [
+            ReplaceOne({"_id": str(category.id)}, self._to_document(category), upsert=True)
+            for category in categories
+        ]
+        
+        async def write(session):
+            result = await self.collection.bulk_write(operations, ordered=False, session=session)
+            upserted = set(result.upserted_ids)
+            await self._record_events(session, [
+                (CategoryCreated if index in upserted else CategoryUpdated)(
+                    category.id, category.name, category.description
+                )
+                for index, category in enumerate(categories)
+            ])
+            return upserted
+        
+        errors = {}
+        try:
+            upserted = await self._write(write)
+        except BulkWriteError as e:
+            errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+            if self.outbox_enabled:
+                # The failed write aborted the transaction: nothing of the batch was stored
+                errors = {
+                    index: errors.get(index, {"errmsg": "Batch rolled back"}) for index in range(len(categories))
+                }
+            upserted = {item["index"] for item in e.details.get("upserted", [])}
+        
+        results = []
+        for index, category in enumerate(categories):
+            if index in errors:
+                results.append(BulkItemResult(index, category.id, BulkItemStatus.FAILED, errors[index].get("errmsg")))
+            elif index in upserted:
+                results.append(BulkItemResult(index, category.id, BulkItemStatus.CREATED))
+            else:
+                results.append(BulkItemResult(index, category.id, BulkItemStatus.UPDATED))
+        return results
+    
+    async def delete_many(self, category_ids: List[CategoryId]) -> List[BulkItemResult]:
+        if not category_ids:
+            return []
+        unique_ids = list(dict.fromkeys(category_ids))
+        ids = [str(category_id) for category_id in unique_ids]
+        
+        async def write(session):
+            # One lookup and one delete for the whole batch, whatever its size
+            found = [
+                doc["_id"] async for doc in self.collection.find({"_id": {"$in": ids}}, {"_id": 1}, session=session)
+            ]
+            if not found:
+                return set()
+            result = await self.collection.delete_many({"_id": {"$in": found}}, session=session)
+            if result.deleted_count == 0:
+                # Without a transaction another request deleted all of them in between
+                return set()
+            # A partial count means another request deleted some of them in between (never inside
+            # a transaction). The ones this delete removed cannot be told apart, and all of them
+            # are gone: each is reported deleted, its event and cache eviction are idempotent
+            deleted = set(found)
+            await self._record_events(session, [
+                CategoryDeleted(category_id) for category_id in unique_ids if str(category_id) in deleted
+            ])
+            return deleted
+        
+        deleted = await self._write(write)
+        results = []
+        for index, category_id in enumerate(category_ids):
+            # Only the first occurrence of a repeated id deletes it; the repeats find nothing
+            status = BulkItemStatus.DELETED if str(category_id) in deleted else BulkItemStatus.NOT_FOUND
+            deleted.discard(str(category_id))
+            results.append(BulkItemResult(index, category_id, status))
+        return results
+    
+    async def _create_many_with_outbox(self, categories: List[Category]) -> dict:
+        """Insert a batch and its created events in one transaction; return the write errors by index.
+        
+        Any write error aborts a transaction, so on duplicates the conflicting
+        ids are looked up and the rest of the batch is inserted in a second one.
+        If that one fails too, its whole part of the batch is reported failed.
+        """
+        async def write(batch: List[Category]):
+            async def insert(session):
+                await self.collection.insert_many(
+                    [self._to_document(category) for category in batch], ordered=False, session=session
+                )
+                await self._record_events(session, [
+                    CategoryCreated(category.id, category.name, category.description) for category in batch
+                ])
+            await self._write(insert)
+        
+        try:
+            await write(categories)
+            return {}
+        except BulkWriteError:
+            pass
+        
+        ids = [str(category.id) for category in categories]
+        existing = {doc["_id"] async for doc in self.collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+        errors = {}
+        remaining = []
+        for index, category in enumerate(categories):
+            # Already stored, or repeated within the batch
+            if str(category.id) in existing:
+                errors[index] = {"code": DUPLICATE_KEY_ERROR}
+            else:
+                existing.add(str(category.id))
+                remaining.append(index)
+        if remaining:
+            try:
+                await write([categories[index] for index in remaining])
+            except BulkWriteError as e:
+                # A concurrent insert took one of the ids after the lookup: the transaction
+                # was aborted, so nothing of the rest of the batch was stored either
+                failed = {error["index"]: error for error in e.details.get("writeErrors", [])}
+                for position, index in enumerate(remaining):
+                    errors[index] = failed.get(position, {"errmsg": "Batch rolled back"})
+        return errors
+    
+    async def _write(self, operation: Callable[[Any], Awaitable[T]]) -> T:
+        """Run a write; with the outbox enabled, inside a transaction together with its events"""
+        if not self.outbox_enabled:
+            return await operation(None)
+        async with await self.client.start_session() as session:
+            # with_transaction commits once and retries transient transaction errors
+            return await session.with_transaction(operation)
+    
+    async def _record_events(self, session, events: List[CategoryEvent]) -> None:
+        if session is None or not events:
+            return
+        created_at = datetime.utcnow()
+        await self.outbox.insert_many(
+            [{"event": event_to_message(event), "created_at": created_at} for event in events],
+            session=session
+        )
+    
+    async def _backfill_name_keys(self) -> None:
+        # Documents written before name_key existed are invisible to prefix queries until backfilled
+        cursor = self.collection.find(
+            {"name_key": {"$exists": False}}, {"name": 1}, comment=FULL_SCAN_COMMENT
+        )
+        batch = []
+        async for doc in cursor:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"name_key": category_name_key(doc["name"])}}))
+            if len(batch) >= NAME_KEY_BACKFILL_BATCH_SIZE:
+                await self.collection.bulk_write(batch, ordered=False)
+                batch = []
+        if batch:
+            await self.collection.bulk_write(batch, ordered=False)
+    
+    @staticmethod
+    def _prefix_upper_bound(key: str) -> Optional[str]:
+        """Smallest string after every string starting with key (None: there is none)"""
+        for position in range(len(key) - 1, -1, -1):
+            code = ord(key[position]) + 1
+            if code == 0xD800:
+                # Surrogates cannot be stored: the next character is the first one after them
+                code = 0xE000
+            if code <= 0x10FFFF:
+                return key[:position] + chr(code)
+        return None
+    
+    @staticmethod
+    def _to_document(category: Category) -> dict:
+        return {
             "_id": str(category.id),
             "name": category.name,
+            "name_key": category_name_key(category.name),
             "description": category.description
         }
-        
-        # Update existing category
-        self.collection.replace_one(
-            {"_id": str(category.id)},
-            category_dict
-        )
-        
-        return category
     
-    def delete(self, category_id: CategoryId) -> bool:
-        result = self.collection.delete_one({"_id": str(category_id)})
-        return result.deleted_count > 0
\ No newline at end of file
+    @staticmethod
+    def _to_category(doc: dict) -> Category:
+        # Our own documents were validated when written: skip validating them again
+        return Category.trusted(CategoryId.trusted(doc["_id"]), doc["name"], doc.get("description"))
\ No newline at end of file
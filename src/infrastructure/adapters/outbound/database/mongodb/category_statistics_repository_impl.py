@@ -0,0 +1,44 @@
+from domain.ports.outbound.category_statistics_repository import CategoryStatisticsRepository
+from typing import Any, Dict
+from .query_plan_inspector import FULL_SCAN_COMMENT
+
+
+# One pass, one $group: nothing but the result document leaves the server. The
+# shortest/longest names are $min over {length, _id, name} documents (compared
+# field by field), so ties go to the lowest id without a $sort stage.
+STATISTICS_PIPELINE = [
+    {"$project": {"name": 1, "length": {"$strLenCP": "$name"}}},
+    {"$group": {
+        "_id": None,
+        "total_count": {"$sum": 1},
+        "total_length": {"$sum": "$length"},
+        "shortest": {"$min": {"length": "$length", "id": "$_id", "name": "$name"}},
+        "longest": {"$min": {"length": {"$multiply": ["$length", -1]}, "id": "$_id", "name": "$name"}}
+    }}
+]
+
+
+class MongoCategoryStatisticsRepository(CategoryStatisticsRepository):
+    """MongoDB implementation of CategoryStatisticsRepository (aggregation pipeline)"""
+    
+    def __init__(self, db):
+        self.collection = db.categories
+    
+    async def compute_statistics(self) -> Dict[str, Any]:
+        # Reading every name is the point of this query: exempt from the collection scan check
+        results = await self.collection.aggregate(STATISTICS_PIPELINE, comment=FULL_SCAN_COMMENT).to_list(length=1)
+        if not results:
+            return {
+                "total_count": 0,
+                "average_name_length": 0,
+                "longest_name": "",
+                "shortest_name": ""
+            }
+        
+        result = results[0]
+        return {
+            "total_count": result["total_count"],
+            "average_name_length": result["total_length"] / result["total_count"],
+            "longest_name": result["longest"]["name"],
+            "shortest_name": result["shortest"]["name"]
+        }
@@ -0,0 +1,59 @@
+import logging
+from typing import Dict, List, Mapping
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+
+logger = logging.getLogger(__name__)
+
+# Server error codes for an index that exists under the same name or keys with another definition
+INDEX_OPTIONS_CONFLICT = 85
+INDEX_KEY_SPECS_CONFLICT = 86
+
+# Every secondary index the service's queries rely on, by collection. The _id
+# index is implicit; the outbox and its checkpoints are only read by _id.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "categories": [
+        # Prefix queries: range scan over the stored name key (binary order), ties broken by _id
+        IndexModel([("name_key", ASCENDING), ("_id", ASCENDING)], name="name_prefix"),
+        # Word queries; no language, so names are not stemmed and no stop words are dropped
+        IndexModel([("name", TEXT)], name="name_text", default_language="none")
+    ]
+}
+
+
+async def apply_indexes(db, registry: Mapping[str, List[IndexModel]] = INDEXES) -> None:
+    """Create the registry's indexes; safe to run on every start and from several workers.
+    
+    Creating an index that already exists with the same definition is a no-op
+    on the server. An index whose definition differs from the registry is
+    dropped and created again. Indexes missing from the registry are left alone.
+    """
+    for collection_name, models in registry.items():
+        collection = db[collection_name]
+        for model in models:
+            try:
+                await collection.create_indexes([model])
+            except OperationFailure as e:
+                if e.code not in (INDEX_OPTIONS_CONFLICT, INDEX_KEY_SPECS_CONFLICT):
+                    raise
+                name = model.document["name"]
+                logger.warning("Index %s.%s differs from its definition, rebuilding it", collection_name, name)
+                await _drop_conflicting(collection, model.document)
+                await collection.create_indexes([model])
+
+
+async def _drop_conflicting(collection, document: dict) -> None:
+    keys = list(document["key"].items())
+    is_text = any(direction == TEXT for _, direction in keys)
+    for name, info in (await collection.index_information()).items():
+        if name == "_id_":
+            continue
+        existing = [tuple(key) for key in info["key"]]
+        # A collection has at most one text index, whatever its keys
+        if name == document["name"] or existing == keys or (is_text and ("_fts", TEXT) in existing):
+            try:
+                await collection.drop_index(name)
+            except OperationFailure:
+                # Already dropped by another worker applying the same registry
+                pass
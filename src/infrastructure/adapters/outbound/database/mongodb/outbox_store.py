@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, List
+from pymongo.errors import DuplicateKeyError
+from domain.events.category_events import CategoryEvent
+from infrastructure.mappers.event_mappers import message_to_event
+from .category_repository_impl import OUTBOX_COLLECTION
+
+
+# One document per relay: lease owner, lease expiry and the last relayed event ids
+CHECKPOINT_COLLECTION = "outbox_checkpoints"
+
+
+@dataclass(frozen=True)
+class OutboxRecord:
+    record_id: Any
+    event: CategoryEvent
+
+
+class MongoOutboxStore:
+    """Reading side of the category outbox written by MongoCategoryRepository.
+    
+    Records are read oldest first and deleted once relayed. The checkpoint
+    document doubles as a lease so that only one relay (worker) drains the
+    outbox at a time.
+    """
+    
+    def __init__(self, db, relay_name: str = "category_outbox_relay"):
+        self.outbox = db[OUTBOX_COLLECTION]
+        self.checkpoints = db[CHECKPOINT_COLLECTION]
+        self.relay_name = relay_name
+    
+    async def fetch_pending(self, limit: int) -> List[OutboxRecord]:
+        # ObjectIds grow with insertion time: _id order is (roughly) commit order
+        docs = await self.outbox.find().sort("_id", 1).limit(limit).to_list(length=limit)
+        return [OutboxRecord(doc["_id"], message_to_event(doc["event"])) for doc in docs]
+    
+    async def acknowledge(self, record_ids: List[Any]) -> None:
+        if record_ids:
+            await self.outbox.delete_many({"_id": {"$in": record_ids}})
+    
+    async def load_checkpoint(self) -> List[str]:
+        """Event ids of the last relayed batch"""
+        doc = await self.checkpoints.find_one({"_id": self.relay_name})
+        return doc.get("last_event_ids", []) if doc else []
+    
+    async def save_checkpoint(self, event_ids: List[str]) -> None:
+        await self.checkpoints.update_one(
+            {"_id": self.relay_name},
+            {
+                "$set": {"last_event_ids": event_ids, "updated_at": datetime.utcnow()},
+                "$inc": {"relayed": len(event_ids)}
+            },
+            upsert=True
+        )
+    
+    async def acquire_lease(self, owner: str, ttl: float) -> bool:
+        """Take or renew the relay lease; False while another relay holds an unexpired one"""
+        now = datetime.utcnow()
+        try:
+            await self.checkpoints.find_one_and_update(
+                {
+                    "_id": self.relay_name,
+                    "$or": [{"owner": owner}, {"owner": None}, {"lease_until": {"$lt": now}}]
+                },
+                {"$set": {"owner": owner, "lease_until": now + timedelta(seconds=ttl)}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            # The document exists but did not match: someone else holds the lease
+            return False
+    
+    async def release_lease(self, owner: str) -> None:
+        await self.checkpoints.update_one({"_id": self.relay_name, "owner": owner}, {"$set": {"owner": None}})
@@ -0,0 +1,82 @@
+import threading
+from typing import Dict
+from pymongo import monitoring
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool utilization of a MongoDB client, from pymongo pool events.
+    
+    Passed in the client's event_listeners. Counts are summed over the pools
+    of all servers the client talks to. Events arrive on the driver's
+    threads, so the counters are updated under a lock.
+    """
+    
+    def __init__(self, max_pool_size: int = 100):
+        self.max_pool_size = max_pool_size
+        self._lock = threading.Lock()
+        self._open = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._checkout_failures = 0
+        self._pool_clears = 0
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_size": self.max_pool_size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._checkout_timeouts,
+                "checkout_failures": self._checkout_failures,
+                "pool_clears": self._pool_clears
+            }
+    
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._open += 1
+    
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._open -= 1
+    
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        with self._lock:
+            self._waiting += 1
+    
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._in_use += 1
+            self._checkouts += 1
+    
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._waiting -= 1
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                self._checkout_timeouts += 1
+            else:
+                self._checkout_failures += 1
+    
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._in_use -= 1
+    
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pool_clears += 1
+    
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+    
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+    
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+    
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
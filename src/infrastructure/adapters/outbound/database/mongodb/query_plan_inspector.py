@@ -0,0 +1,88 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+from pymongo import monitoring
+
+
+# Commands whose plan is worth checking; inserts and getMore have none
+EXPLAINABLE_COMMANDS = ("find", "aggregate", "count", "distinct", "update", "delete", "findAndModify")
+
+# Queries that read the whole collection on purpose carry this comment and are not reported
+FULL_SCAN_COMMENT = "intentional full scan"
+
+# Session, transaction and driver fields an explained command must not carry
+_DRIVER_FIELDS = ("lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern")
+
+
+@dataclass(frozen=True)
+class CollectionScan:
+    """A query whose winning plan reads the whole collection"""
+    database: str
+    command: Dict[str, Any]
+
+
+class QueryPlanInspector(monitoring.CommandListener):
+    """Diagnostic mode for MongoDB repositories: find queries planned as collection scans.
+    
+    Passed in a client's event_listeners, it records every query command
+    the client sends. check() then runs explain (queryPlanner verbosity, so
+    nothing is executed) for each of them and returns those whose winning
+    plan contains a COLLSCAN stage. Meant for tests and staging, not for
+    production traffic: every recorded query is kept until it is checked.
+    """
+    
+    def __init__(self):
+        self._commands = deque()
+    
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # Called on the driver's threads: deque appends are thread-safe
+        if event.command_name in EXPLAINABLE_COMMANDS:
+            self._commands.append((event.database_name, dict(event.command)))
+    
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+    
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+    
+    async def check(self, client) -> List[CollectionScan]:
+        """Explain the queries recorded since the last check; return the collection scans"""
+        scans = []
+        while self._commands:
+            database, command = self._commands.popleft()
+            command = self.explainable(command)
+            if command is None:
+                continue
+            explanation = await client[database].command({"explain": command, "verbosity": "queryPlanner"})
+            if has_collection_scan(explanation):
+                scans.append(CollectionScan(database, command))
+        return scans
+    
+    @staticmethod
+    def explainable(command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The command without driver fields, or None if it is exempt from the check"""
+        if command.get("comment") == FULL_SCAN_COMMENT:
+            return None
+        return {
+            key: value for key, value in command.items()
+            if not key.startswith("$") and key not in _DRIVER_FIELDS
+        }
+
+
+def has_collection_scan(explanation: Dict[str, Any]) -> bool:
+    """Whether any winning plan in an explain result (find, aggregate, sharded) has a COLLSCAN stage"""
+    return any(stage.get("stage") == "COLLSCAN" for stage in _winning_plan_stages(explanation))
+
+
+def _winning_plan_stages(node: Any, in_winning_plan: bool = False) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        if in_winning_plan and "stage" in node:
+            yield node
+        for key, value in node.items():
+            # Rejected plans were considered and discarded: only the winning ones run
+            if key != "rejectedPlans":
+                yield from _winning_plan_stages(value, in_winning_plan or key == "winningPlan")
+    elif isinstance(node, list):
+        for item in node:
+            yield from _winning_plan_stages(item, in_winning_plan)
+
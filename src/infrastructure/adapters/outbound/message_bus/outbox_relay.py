@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+from domain.ports.outbound.category_event_publisher import CategoryEventPublisher
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Background task that drains the category outbox to the event publisher.
+    
+    Each round reads up to batch_size records, hands the events to the
+    publisher in one call, waits until the broker confirmed them, stores
+    their event ids as the checkpoint and deletes the records. Events
+    handed over before (in this process, or in the checkpoint after a
+    restart) are not published again, so a crash between publishing and
+    deleting does not duplicate the last batch. Delivery is at-least-once:
+    consumers should still deduplicate by event id.
+    """
+    
+    def __init__(self, store, publisher: CategoryEventPublisher, batch_size: int = 500,
+                 poll_interval: float = 0.5, lease_ttl: float = 30.0, max_tracked_events: int = 100000):
+        self.store = store
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_ttl = lease_ttl
+        self.max_tracked_events = max_tracked_events
+        self.owner = uuid.uuid4().hex
+        self._handed_over: "OrderedDict[str, None]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self.relayed = 0
+        self.batches = 0
+        self.duplicates_skipped = 0
+        self._busy_seconds = 0.0
+    
+    async def relay_once(self) -> int:
+        """Relay one batch; return the number of outbox records it consumed"""
+        records = await self.store.fetch_pending(self.batch_size)
+        if not records:
+            return 0
+        started = time.perf_counter()
+        
+        events = [record.event for record in records if record.event.event_id not in self._handed_over]
+        self.duplicates_skipped += len(records) - len(events)
+        if events:
+            await self.publisher.publish_events(events)
+            # Remember before waiting: if the confirm times out the publisher still owns them
+            self._track(event.event_id for event in events)
+        # Records are acknowledged only after the broker confirmed them
+        await asyncio.wait_for(self.publisher.flush(), self.lease_ttl / 2)
+        
+        await self.store.save_checkpoint([record.event.event_id for record in records])
+        await self.store.acknowledge([record.record_id for record in records])
+        self.relayed += len(events)
+        self.batches += 1
+        self._busy_seconds += time.perf_counter() - started
+        return len(records)
+    
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        try:
+            await self.store.release_lease(self.owner)
+        except Exception:
+            # The lease expires on its own
+            pass
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "relayed": self.relayed,
+            "batches": self.batches,
+            "duplicates_skipped": self.duplicates_skipped,
+            "events_per_second": round(self.relayed / self._busy_seconds, 1) if self._busy_seconds else 0.0
+        }
+    
+    async def _run(self) -> None:
+        self._track(await self._load_checkpoint())
+        while True:
+            try:
+                if not await self.store.acquire_lease(self.owner, self.lease_ttl):
+                    # Another worker relays; stay on standby
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                # A full batch means there is more waiting: go on without sleeping
+                if await self.relay_once() < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Nothing was acknowledged: the same records are read again next round
+                logger.warning("Outbox relay round failed, retrying", exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+    
+    async def _load_checkpoint(self) -> Iterable[str]:
+        while True:
+            try:
+                return await self.store.load_checkpoint()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Loading the outbox checkpoint failed, retrying", exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+    
+    def _track(self, event_ids: Iterable[str]) -> None:
+        for event_id in event_ids:
+            self._handed_over[event_id] = None
+        while len(self._handed_over) > self.max_tracked_events:
+            self._handed_over.popitem(last=False)
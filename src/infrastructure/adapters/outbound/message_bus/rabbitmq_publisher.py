@@ -1,89 +1,219 @@
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
+from domain.events.category_events import CategoryCreated, CategoryDeleted, CategoryEvent, CategoryUpdated
 from domain.ports.outbound.category_event_publisher import CategoryEventPublisher
-import json
-import pika
-from datetime import datetime
+from infrastructure.mappers.event_mappers import event_routing_key, event_to_message
+from infrastructure.serialization.codecs import Codec, JsonCodec
+import asyncio
+import logging
+import aio_pika
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
 
 
 class RabbitMQCategoryEventPublisher(CategoryEventPublisher):
-    """RabbitMQ implementation of CategoryEventPublisher"""
+    """RabbitMQ implementation of CategoryEventPublisher (asyncio, aio-pika based).
+    
+    publish_* only put events on a bounded in-memory queue, so a write never
+    waits for the broker. A background task drains the queue in batches
+    (up to batch_size events or flush_interval seconds), publishes them on a
+    channel in publisher-confirm mode and waits for all confirms of a batch
+    together. A full queue makes publishers wait (backpressure). On a broker
+    failure the unconfirmed batch is kept and resent after reconnecting with
+    exponential backoff, so delivery is at-least-once; every message carries
+    the event id as its message_id so consumers can drop duplicates.
+    """
     
-    def __init__(self, rabbitmq_connection_params: pika.ConnectionParameters, exchange_name: str = "category_events"):
-        self.connection_params = rabbitmq_connection_params
+    def __init__(self, url: str, exchange_name: str = "category_events", max_queue_size: int = 10000,
+                 batch_size: int = 100, flush_interval: float = 0.05, confirm_timeout: float = 5.0,
+                 reconnect_initial_delay: float = 0.5, reconnect_max_delay: float = 30.0,
+                 connect_timeout: float = 5.0, heartbeat: int = 60,
+                 connect: Optional[Callable[..., Awaitable[Any]]] = None, codec: Optional[Codec] = None):
+        self.url = url
         self.exchange_name = exchange_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.confirm_timeout = confirm_timeout
+        self.reconnect_initial_delay = reconnect_initial_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.connect_timeout = connect_timeout
+        self.heartbeat = heartbeat
+        self._connect = connect or aio_pika.connect
+        self.codec = codec or JsonCodec()
+        self._queue: "asyncio.Queue[CategoryEvent]" = asyncio.Queue(maxsize=max_queue_size)
+        self._worker: Optional[asyncio.Task] = None
         self._connection = None
-        self._channel = None
-    
-    def _get_channel(self):
-        """Get or create a RabbitMQ channel"""
-        if self._connection is None or not self._connection.is_open:
-            self._connection = pika.BlockingConnection(self.connection_params)
-            self._channel = self._connection.channel()
-            # Declare exchange
-            self._channel.exchange_declare(exchange=self.exchange_name, exchange_type='topic', durable=True)
-        elif self._channel is None or self._channel.is_closed:
-            self._channel = self._connection.channel()
-            # Declare exchange
-            self._channel.exchange_declare(exchange=self.exchange_name, exchange_type='topic', durable=True)
-        return self._channel
-    
-    def publish_category_created(self, category: Category) -> None:
-        event = {
-            "event_type": "category_created",
-            "category_id": str(category.id),
-            "name": category.name,
-            "description": category.description,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        channel = self._get_channel()
-        channel.basic_publish(
-            exchange=self.exchange_name,
-            routing_key="category.created",
-            body=json.dumps(event),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # make message persistent
-            )
-        )
-    
-    def publish_category_updated(self, category: Category) -> None:
-        event = {
-            "event_type": "category_updated",
-            "category_id": str(category.id),
-            "name": category.name,
-            "description": category.description,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        channel = self._get_channel()
-        channel.basic_publish(
-            exchange=self.exchange_name,
-            routing_key="category.updated",
-            body=json.dumps(event),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # make message persistent
-            )
-        )
+        self._exchange = None
+        # The worker and connect() (warm-up, readiness checks) must not open two connections
+        self._connect_lock = asyncio.Lock()
+        self.published = 0
+        self.batches = 0
+        self.reconnects = 0
+    
+    async def publish_category_created(self, category: Category) -> None:
+        await self._enqueue([CategoryCreated(category.id, category.name, category.description)])
+    
+    async def publish_category_updated(self, category: Category) -> None:
+        await self._enqueue([CategoryUpdated(category.id, category.name, category.description)])
+    
+    async def publish_category_deleted(self, category_id: CategoryId) -> None:
+        await self._enqueue([CategoryDeleted(category_id)])
+    
+    async def publish_categories_created(self, categories: List[Category]) -> None:
+        await self._enqueue([
+            CategoryCreated(category.id, category.name, category.description) for category in categories
+        ])
+    
+    async def publish_categories_updated(self, categories: List[Category]) -> None:
+        await self._enqueue([
+            CategoryUpdated(category.id, category.name, category.description) for category in categories
+        ])
     
-    def publish_category_deleted(self, category_id: CategoryId) -> None:
-        event = {
-            "event_type": "category_deleted",
-            "category_id": str(category_id),
-            "timestamp": datetime.utcnow().isoformat()
+    async def publish_categories_deleted(self, category_ids: List[CategoryId]) -> None:
+        await self._enqueue([CategoryDeleted(category_id) for category_id in category_ids])
+    
+    async def publish_events(self, events: List[CategoryEvent]) -> None:
+        await self._enqueue(events)
+    
+    async def flush(self) -> None:
+        """Wait until every queued event has been confirmed by the broker"""
+        if self._worker is not None:
+            await self._queue.join()
+    
+    async def connect(self) -> None:
+        """Open the broker connection now instead of on the first publish; reopen it if it was lost"""
+        if self._connection is not None and getattr(self._connection, "is_closed", False):
+            await self._disconnect()
+        await self._get_exchange()
+    
+    async def check(self) -> None:
+        """Raise unless the broker connection is open; never opens one (used by readiness checks)"""
+        connection = self._connection
+        if connection is None or getattr(connection, "is_closed", False) or self._exchange is None:
+            raise ConnectionError("Not connected to the broker")
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "published": self.published,
+            "batches": self.batches,
+            "reconnects": self.reconnects,
+            "connected": int(self._connection is not None)
         }
-        
-        channel = self._get_channel()
-        channel.basic_publish(
-            exchange=self.exchange_name,
-            routing_key="category.deleted",
-            body=json.dumps(event),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # make message persistent
+    
+    async def _enqueue(self, events: List[CategoryEvent]) -> None:
+        self._ensure_worker()
+        for event in events:
+            # Waits only when max_queue_size events are already pending (backpressure)
+            await self._queue.put(event)
+    
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+    
+    async def _run(self) -> None:
+        batch: List[CategoryEvent] = []
+        delay = self.reconnect_initial_delay
+        while True:
+            try:
+                if not batch:
+                    batch = await self._next_batch()
+                exchange = await self._get_exchange()
+                await self._publish_batch(exchange, batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep the unconfirmed batch and retry it on a fresh connection
+                logger.warning("Publishing %d events failed, reconnecting in %.1fs", len(batch), delay, exc_info=True)
+                await self._disconnect()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_delay)
+                self.reconnects += 1
+                continue
+            
+            for _ in batch:
+                self._queue.task_done()
+            self.published += len(batch)
+            self.batches += 1
+            batch = []
+            delay = self.reconnect_initial_delay
+    
+    async def _next_batch(self) -> List[CategoryEvent]:
+        """Wait for one event, then collect more until the batch is full or flush_interval passes"""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+    
+    async def _publish_batch(self, exchange, batch: List[CategoryEvent]) -> None:
+        # All messages go out at once; the confirms are awaited together
+        await asyncio.gather(*(
+            exchange.publish(
+                aio_pika.Message(
+                    # content_type and the codec version header tell consumers how to decode the body
+                    body=self.codec.dumps(event_to_message(event)),
+                    content_type=self.codec.content_type,
+                    headers={"x-codec": self.codec.name, "x-codec-version": self.codec.version},
+                    message_id=event.event_id,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT  # make message persistent
+                ),
+                routing_key=event_routing_key(event),
+                timeout=self.confirm_timeout
             )
-        )
+            for event in batch
+        ))
+    
+    async def _get_exchange(self):
+        """Get or create the exchange on a publisher-confirm channel"""
+        async with self._connect_lock:
+            if self._exchange is None:
+                # A connection left over from an earlier attempt that failed half-way
+                await self._disconnect()
+                self._connection = await self._connect(
+                    self.url, timeout=self.connect_timeout, heartbeat=self.heartbeat
+                )
+                try:
+                    channel = await self._connection.channel(publisher_confirms=True)
+                    self._exchange = await channel.declare_exchange(
+                        self.exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
+                    )
+                except BaseException:
+                    # Failed or cancelled (e.g. by a timeout) after connecting: do not leak the connection
+                    await asyncio.shield(self._disconnect())
+                    raise
+            return self._exchange
+    
+    async def _disconnect(self) -> None:
+        connection, self._connection, self._exchange = self._connection, None, None
+        if connection is not None:
+            try:
+                await connection.close()
+            except Exception:
+                pass
     
-    def close(self):
-        """Close RabbitMQ connection"""
-        if self._connection and self._connection.is_open:
-            self._connection.close()
\ No newline at end of file
+    async def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events (bounded by timeout), stop the worker and close the connection"""
+        if self._worker is not None:
+            try:
+                await asyncio.wait_for(self.flush(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Closing publisher with %d unpublished events", self._queue.qsize())
+            self._worker.cancel()
+            try:
+                await self._worker
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._worker = None
+        await self._disconnect()
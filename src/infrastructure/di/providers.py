@@ -1,46 +1,153 @@
 from dishka import Provider, Scope, make_async_container, provide
 from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+from infrastructure.adapters.outbound.database.mongodb.outbox_store import MongoOutboxStore
+from infrastructure.adapters.outbound.database.mongodb.pool_metrics import MongoPoolMetrics
+from infrastructure.adapters.outbound.database.mongodb.category_statistics_repository_impl import (
+    MongoCategoryStatisticsRepository
+)
 from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher
+from infrastructure.adapters.outbound.message_bus.outbox_relay import OutboxRelay
 from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache
+from infrastructure.adapters.outbound.cache.tiered_cache_adapter import TieredCacheAdapter
 from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository
+from infrastructure.adapters.outbound.cache.stampede_guard import StampedeGuard
+from infrastructure.adapters.outbound.cache.redis_statistics_store import RedisCategoryStatisticsStore
+from infrastructure.adapters.inbound.rest.http_cache import ResponseCache
+from infrastructure.lifecycle.readiness import ReadinessProbe
 from application.use_cases.category_read_use_case import CategoryReadUseCase
 from application.use_cases.category_write_use_case import CategoryWriteUseCase
 from application.use_cases.category_statistics_use_case import CategoryStatisticsUseCase
 from infrastructure.config.settings import Settings
-import pika
-from urllib.parse import urlparse
+from infrastructure.serialization.codecs import get_codec
+from typing import Any, AsyncIterable, Dict, Iterable
+
+
+def mongo_client_options(settings: Settings) -> Dict[str, Any]:
+    """MongoClient pool size and timeout options from Settings"""
+    return {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "waitQueueTimeoutMS": int(settings.mongodb_wait_queue_timeout * 1000),
+        "serverSelectionTimeoutMS": int(settings.mongodb_server_selection_timeout * 1000),
+        "connectTimeoutMS": int(settings.mongodb_connect_timeout * 1000),
+        # The driver takes None (not 0) for no limit
+        "socketTimeoutMS": int(settings.mongodb_socket_timeout * 1000) or None
+    }
 
 
 class AdaptersProvider(Provider):
     @provide(scope=Scope.APP)
     def provide_settings(self) -> Settings:
         return Settings()
-
+    
     @provide(scope=Scope.APP)
-    def provide_mongo_category_repository(self, settings: Settings) -> MongoCategoryRepository:
-        return MongoCategoryRepository(
+    def provide_mongo_pool_metrics(self, settings: Settings) -> MongoPoolMetrics:
+        return MongoPoolMetrics(max_pool_size=settings.mongodb_max_pool_size)
+    
+    @provide(scope=Scope.APP)
+    def provide_mongo_category_repository(
+        self, settings: Settings, pool_metrics: MongoPoolMetrics
+    ) -> Iterable[MongoCategoryRepository]:
+        repository = MongoCategoryRepository(
             connection_string=settings.mongodb_connection_string,
-            database_name=settings.mongodb_database_name
+            database_name=settings.mongodb_database_name,
+            export_batch_size=settings.mongodb_export_batch_size,
+            outbox_enabled=settings.outbox_enabled,
+            event_listeners=[pool_metrics],
+            client_options=mongo_client_options(settings)
         )
-
+        yield repository
+        # Closed after everything that uses the client (outbox store, relay, statistics) is done
+        repository.close()
+    
     @provide(scope=Scope.APP)
-    def provide_rabbitmq_category_event_publisher(self, settings: Settings) -> RabbitMQCategoryEventPublisher:
-        # Parse the URL to extract connection parameters
-        parsed_url = urlparse(settings.rabbitmq_url)
-        connection_params = pika.ConnectionParameters(
-            host=parsed_url.hostname or 'localhost',
-            port=parsed_url.port or 5672,
-            virtual_host=parsed_url.path or '/',
-            credentials=pika.PlainCredentials(
-                parsed_url.username or 'guest',
-                parsed_url.password or 'guest'
-            )
+    def provide_mongo_outbox_store(self, repository: MongoCategoryRepository) -> MongoOutboxStore:
+        # Shares the repository's client (and its connection pool)
+        return MongoOutboxStore(repository.db)
+    
+    @provide(scope=Scope.APP)
+    def provide_mongo_category_statistics_repository(
+        self, repository: MongoCategoryRepository
+    ) -> MongoCategoryStatisticsRepository:
+        return MongoCategoryStatisticsRepository(repository.db)
+    
+    @provide(scope=Scope.APP)
+    async def provide_outbox_relay(
+        self, settings: Settings, store: MongoOutboxStore, publisher: RabbitMQCategoryEventPublisher
+    ) -> AsyncIterable[OutboxRelay]:
+        relay = OutboxRelay(
+            store,
+            publisher,
+            batch_size=settings.outbox_relay_batch_size,
+            poll_interval=settings.outbox_relay_poll_interval,
+            lease_ttl=settings.outbox_relay_lease_ttl
         )
-        return RabbitMQCategoryEventPublisher(connection_params, settings.rabbitmq_exchange_name)
+        yield relay
+        # Stop before the publisher it feeds is closed
+        await relay.stop()
     
     @provide(scope=Scope.APP)
-    def provide_redis_cache_adapter(self, settings: Settings) -> RedisCacheAdapter:
-        return RedisCacheAdapter(settings)
+    async def provide_rabbitmq_category_event_publisher(
+        self, settings: Settings
+    ) -> AsyncIterable[RabbitMQCategoryEventPublisher]:
+        publisher = RabbitMQCategoryEventPublisher(
+            settings.rabbitmq_url,
+            settings.rabbitmq_exchange_name,
+            max_queue_size=settings.rabbitmq_publisher_queue_size,
+            batch_size=settings.rabbitmq_publish_batch_size,
+            flush_interval=settings.rabbitmq_publish_flush_interval,
+            confirm_timeout=settings.rabbitmq_confirm_timeout,
+            reconnect_max_delay=settings.rabbitmq_reconnect_max_delay,
+            connect_timeout=settings.rabbitmq_connect_timeout,
+            heartbeat=settings.rabbitmq_heartbeat,
+            codec=get_codec(settings.event_codec)
+        )
+        yield publisher
+        # Deliver what is still queued before the container goes away
+        await publisher.close(timeout=settings.shutdown_publish_timeout)
+    
+    @provide(scope=Scope.APP)
+    async def provide_redis_cache_adapter(self, settings: Settings) -> AsyncIterable[RedisCacheAdapter]:
+        redis_adapter = RedisCacheAdapter(settings)
+        yield redis_adapter
+        await redis_adapter.close()
+    
+    @provide(scope=Scope.APP)
+    async def provide_tiered_cache_adapter(
+        self, settings: Settings, redis_adapter: RedisCacheAdapter
+    ) -> AsyncIterable[TieredCacheAdapter]:
+        local_cache = LocalCache(max_size=settings.local_cache_max_size, ttl=settings.local_cache_ttl)
+        cache_adapter = TieredCacheAdapter(redis_adapter, local_cache, settings.cache_invalidation_channel)
+        yield cache_adapter
+        # Stop the invalidation listener before the Redis pool it reads from is closed
+        await cache_adapter.close()
+    
+    @provide(scope=Scope.APP)
+    def provide_statistics_store(
+        self, settings: Settings, redis_adapter: RedisCacheAdapter
+    ) -> RedisCategoryStatisticsStore:
+        return RedisCategoryStatisticsStore(redis_adapter, rebuild_interval=settings.statistics_rebuild_interval)
+    
+    @provide(scope=Scope.APP)
+    def provide_response_cache(self, settings: Settings, repository: CachedCategoryRepository) -> ResponseCache:
+        local_cache = LocalCache(max_size=settings.response_cache_max_size, ttl=settings.response_cache_ttl)
+        return ResponseCache(local_cache, repository.get_version, max_age=settings.http_cache_max_age)
+    
+    @provide(scope=Scope.APP)
+    def provide_readiness_probe(
+        self,
+        settings: Settings,
+        repository: MongoCategoryRepository,
+        redis_adapter: RedisCacheAdapter,
+        event_publisher: RabbitMQCategoryEventPublisher
+    ) -> ReadinessProbe:
+        return ReadinessProbe(
+            {"mongodb": repository.ping, "redis": redis_adapter.ping, "rabbitmq": event_publisher.check},
+            # Without Redis reads miss the cache and events wait in memory (or in the outbox): only MongoDB is required
+            required=("mongodb",),
+            timeout=settings.health_check_timeout
+        )
 
 
 class InteractorProvider(Provider):
@@ -54,24 +161,51 @@ class InteractorProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def provide_category_write_use_case(
         self,
+        settings: Settings,
         cached_repository: CachedCategoryRepository,
-        event_publisher: RabbitMQCategoryEventPublisher
+        event_publisher: RabbitMQCategoryEventPublisher,
+        statistics_store: RedisCategoryStatisticsStore
     ) -> CategoryWriteUseCase:
-        return CategoryWriteUseCase(cached_repository, event_publisher)
+        # With the outbox the repository records the events and OutboxRelay publishes them
+        return CategoryWriteUseCase(
+            cached_repository,
+            None if settings.outbox_enabled else event_publisher,
+            statistics_store if settings.statistics_source == "store" else None
+        )
     
     @provide(scope=Scope.APP)
     def provide_cached_category_repository(
         self,
+        settings: Settings,
         repository: MongoCategoryRepository,
-        cache_adapter: RedisCacheAdapter
+        cache_adapter: TieredCacheAdapter
     ) -> CachedCategoryRepository:
-        return CachedCategoryRepository(repository, cache_adapter)
+        stampede_guard = StampedeGuard(
+            cache_adapter,
+            lock_ttl=settings.cache_lock_ttl,
+            beta=settings.cache_xfetch_beta
+        )
+        return CachedCategoryRepository(
+            repository,
+            cache_adapter,
+            stampede_guard,
+            name_index_refresh_interval=settings.name_index_refresh_interval,
+            # The index is rebuilt at least as often as a stale local snapshot can live
+            name_index_max_age=settings.local_cache_ttl
+        )
     
     @provide(scope=Scope.REQUEST)
     def provide_category_statistics_use_case(
         self,
-        read_use_case: CategoryReadUseCase
+        settings: Settings,
+        read_use_case: CategoryReadUseCase,
+        statistics_store: RedisCategoryStatisticsStore,
+        statistics_repository: MongoCategoryStatisticsRepository
     ) -> CategoryStatisticsUseCase:
+        if settings.statistics_source == "store":
+            return CategoryStatisticsUseCase(read_use_case, statistics_store=statistics_store)
+        if settings.statistics_source == "aggregation":
+            return CategoryStatisticsUseCase(read_use_case, statistics_repository=statistics_repository)
         return CategoryStatisticsUseCase(read_use_case)
 
 
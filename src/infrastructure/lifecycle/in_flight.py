@@ -0,0 +1,54 @@
+import asyncio
+
+
+class InFlightRequests:
+    """Number of HTTP requests this worker is still handling.
+    
+    Counted by InFlightMiddleware; at shutdown drain() waits for the count
+    to reach zero so that writes (and the events they queue) are not cut off
+    when the connection pools close.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+    
+    def enter(self) -> None:
+        self.count += 1
+        self._idle.clear()
+    
+    def exit(self) -> None:
+        self.count -= 1
+        if self.count == 0:
+            self._idle.set()
+    
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for in-flight requests to finish; return whether they all did"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class InFlightMiddleware:
+    """ASGI middleware counting HTTP requests in InFlightRequests.
+    
+    A plain ASGI middleware rather than BaseHTTPMiddleware: a request stays
+    counted until its response, streamed ones included, has been sent.
+    """
+    
+    def __init__(self, app, in_flight: InFlightRequests):
+        self.app = app
+        self.in_flight = in_flight
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self.in_flight.enter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight.exit()
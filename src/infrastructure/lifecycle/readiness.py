@@ -0,0 +1,55 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Collection, Dict, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class BackendCheck:
+    """Outcome of one backend check"""
+    ok: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+
+class ReadinessProbe:
+    """Whether this worker should receive traffic.
+    
+    The worker is ready once warm-up has finished (mark_ready) and every
+    required backend answers its check within timeout seconds. Other
+    backends are checked and reported too, but the service degrades without
+    them (a cache miss, events queued in memory) instead of failing
+    requests, so they do not take the worker out of rotation.
+    """
+    
+    def __init__(self, checks: Mapping[str, Callable[[], Awaitable[Any]]], required: Collection[str] = (),
+                 timeout: float = 2.0):
+        self.checks = dict(checks)
+        self.required = set(required)
+        self.timeout = timeout
+        self.accepting = False
+    
+    def mark_ready(self) -> None:
+        self.accepting = True
+    
+    def mark_not_ready(self) -> None:
+        self.accepting = False
+    
+    async def check(self) -> Tuple[bool, Dict[str, BackendCheck]]:
+        """Run every backend check concurrently; return readiness and the result per backend"""
+        names = list(self.checks)
+        results = await asyncio.gather(*(self._check_one(self.checks[name]) for name in names))
+        backends = dict(zip(names, results))
+        ready = self.accepting and all(backends[name].ok for name in self.required if name in backends)
+        return ready, backends
+    
+    async def _check_one(self, check: Callable[[], Awaitable[Any]]) -> BackendCheck:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(check(), self.timeout)
+            error = None
+        except asyncio.TimeoutError:
+            error = f"No answer within {self.timeout}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return BackendCheck(error is None, round((time.perf_counter() - started) * 1000, 2), error)
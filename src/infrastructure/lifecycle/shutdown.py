@@ -0,0 +1,34 @@
+import logging
+import time
+from infrastructure.config.settings import Settings
+from infrastructure.lifecycle.in_flight import InFlightRequests
+from infrastructure.lifecycle.readiness import ReadinessProbe
+
+
+logger = logging.getLogger(__name__)
+
+
+async def shut_down(container, settings: Settings, in_flight: InFlightRequests) -> None:
+    """Stop this worker in an order that loses no accepted write or queued event.
+    
+    The worker is first reported not ready, in case the server still routes
+    requests here. This does not take it out of rotation: under uvicorn
+    this runs only after the listener has closed and open connections have
+    finished, so the load balancer must already have stopped routing here
+    (the preStop pause described in docs/deployment.md). Requests still in
+    flight then get up to shutdown_drain_timeout seconds to finish. Closing the container runs the
+    providers' finalizers in reverse order of creation, so every component
+    is closed before the ones it depends on: the outbox relay stops, the
+    publisher delivers its queue (bounded by shutdown_publish_timeout), the
+    cache stops listening for invalidations, and only then are the Redis
+    and MongoDB pools closed.
+    """
+    started = time.perf_counter()
+    readiness = await container.get(ReadinessProbe)
+    readiness.mark_not_ready()
+    
+    if not await in_flight.drain(settings.shutdown_drain_timeout):
+        logger.warning("Shutting down with %d requests still in flight", in_flight.count)
+    
+    await container.close()
+    logger.info("Shutdown finished in %.2fs", time.perf_counter() - started)
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Tuple
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher
+from infrastructure.adapters.inbound.rest.http_cache import ResponseCache
+from infrastructure.lifecycle.readiness import ReadinessProbe
+
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up(container, settings: Settings) -> None:
+    """Prepare this worker for traffic, then mark it ready.
+    
+    Resolves the APP-scope dependencies (so no request pays for building
+    them), creates the MongoDB indexes, opens the minimum number of pooled
+    connections to MongoDB and Redis and the RabbitMQ connection, and with
+    warmup_preload_cache loads the hot cache. Each step is bounded by
+    warmup_step_timeout; a failed step is logged and skipped, since the
+    readiness checks report a backend that is still unreachable.
+    """
+    started = time.perf_counter()
+    repository = await container.get(MongoCategoryRepository)
+    redis_adapter = await container.get(RedisCacheAdapter)
+    cached_repository = await container.get(CachedCategoryRepository)
+    publisher = await container.get(RabbitMQCategoryEventPublisher)
+    await container.get(ResponseCache)
+    readiness = await container.get(ReadinessProbe)
+    
+    steps: List[Tuple[str, Callable[[], Awaitable[Any]]]] = [
+        ("mongodb indexes", repository.ensure_indexes),
+        ("mongodb connections", lambda: repository.warm_up(settings.mongodb_min_pool_size)),
+        ("redis connections", lambda: redis_adapter.warm_up(settings.redis_min_connections)),
+        ("rabbitmq connection", publisher.connect)
+    ]
+    if settings.warmup_preload_cache:
+        steps.append(("category cache", cached_repository.warm_up))
+    
+    for name, step in steps:
+        try:
+            await asyncio.wait_for(step(), settings.warmup_step_timeout)
+        except Exception:
+            logger.warning("Warm-up step '%s' failed", name, exc_info=True)
+    
+    readiness.mark_ready()
+    logger.info("Warm-up finished in %.2fs", time.perf_counter() - started)
@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Any, Dict
+from domain.events.category_events import CategoryCreated, CategoryDeleted, CategoryEvent, CategoryUpdated
+from domain.value_objects.category_id import CategoryId
+
+
+# Routing key on the category_events exchange for each event type
+ROUTING_KEYS = {
+    CategoryCreated: "category.created",
+    CategoryUpdated: "category.updated",
+    CategoryDeleted: "category.deleted"
+}
+
+EVENT_TYPES = {
+    CategoryCreated: "category_created",
+    CategoryUpdated: "category_updated",
+    CategoryDeleted: "category_deleted"
+}
+
+
+def event_routing_key(event: CategoryEvent) -> str:
+    """Routing key the event is published with"""
+    return ROUTING_KEYS[type(event)]
+
+
+def event_to_message(event: CategoryEvent) -> Dict[str, Any]:
+    """Map a domain event to its wire format (message body and outbox payload)"""
+    message = {
+        "event_id": event.event_id,
+        "event_type": EVENT_TYPES[type(event)],
+        "category_id": str(event.category_id),
+        "timestamp": event.timestamp.isoformat()
+    }
+    if not isinstance(event, CategoryDeleted):
+        message["name"] = event.name
+        message["description"] = event.description
+    return message
+
+
+def message_to_event(message: Dict[str, Any]) -> CategoryEvent:
+    """Map a wire-format message back to its domain event"""
+    category_id = CategoryId(message["category_id"])
+    timestamp = datetime.fromisoformat(message["timestamp"])
+    event_type = message["event_type"]
+    if event_type == "category_deleted":
+        return CategoryDeleted(category_id, timestamp=timestamp, event_id=message["event_id"])
+    if event_type == "category_created":
+        event_class = CategoryCreated
+    elif event_type == "category_updated":
+        event_class = CategoryUpdated
+    else:
+        raise ValueError(f"Unknown event type: {event_type}")
+    return event_class(
+        category_id, message["name"], message.get("description"),
+        timestamp=timestamp, event_id=message["event_id"]
+    )
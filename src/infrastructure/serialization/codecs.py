@@ -0,0 +1,146 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None
+
+
+# First byte of every encoded value. 0xFF never starts valid UTF-8, so values
+# written before codecs existed (plain JSON text) are told apart by it.
+MAGIC = b"\xff"
+
+
+class Codec(ABC):
+    """Serializes cache values and event bodies.
+    
+    encode() prefixes the payload with a three byte header: MAGIC, the codec
+    tag and the format version. decode_value() reads the header and picks the
+    matching codec, so switching codecs does not require flushing the cache:
+    entries written in the old format stay readable until they expire.
+    """
+    
+    name: str
+    tag: bytes
+    version: int
+    content_type: str
+    
+    @property
+    def header(self) -> bytes:
+        return MAGIC + self.tag + bytes([self.version])
+    
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Payload without header (e.g. an AMQP body, where content_type says the format)"""
+        pass
+    
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+    
+    def encode(self, value: Any) -> bytes:
+        return self.header + self.dumps(value)
+    
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return decode_value(data)
+
+
+class JsonCodec(Codec):
+    """Standard library JSON (the default)"""
+    
+    name = "json"
+    tag = b"j"
+    version = 1
+    content_type = "application/json"
+    
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+    
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson: same JSON format, several times faster to encode and decode"""
+    
+    name = "orjson"
+    tag = b"o"
+    version = 1
+    content_type = "application/json"
+    
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("The orjson codec requires the orjson package")
+    
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+    
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack: compact binary format"""
+    
+    name = "msgpack"
+    tag = b"m"
+    version = 1
+    content_type = "application/msgpack"
+    
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("The msgpack codec requires the msgpack package")
+    
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+    
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+
+_decoders: Dict[Tuple[bytes, int], Codec] = {}
+
+
+def get_codec(name: str) -> Codec:
+    """Codec by its settings name: json, orjson or msgpack"""
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown codec: {name}. Expected one of: {', '.join(CODECS)}")
+
+
+def decode_value(data: Union[bytes, str]) -> Any:
+    """Decode a value written by any codec, or a legacy header-less JSON value"""
+    if isinstance(data, str):
+        return json.loads(data)
+    if not data.startswith(MAGIC):
+        return json.loads(data)
+    return _decoder(data[1:2], data[2])(data[3:])
+
+
+def _decoder(tag: bytes, version: int):
+    codec = _decoders.get((tag, version))
+    if codec is None:
+        for codec_class in CODECS.values():
+            if codec_class.tag == tag and codec_class.version == version:
+                try:
+                    codec = codec_class()
+                except RuntimeError:
+                    if tag != OrjsonCodec.tag:
+                        raise
+                    # orjson writes plain JSON: readable without the package
+                    codec = JsonCodec()
+                break
+        else:
+            raise ValueError(f"Unknown codec header: {tag!r} version {version}")
+        _decoders[(tag, version)] = codec
+    return codec.loads
@@ -1,16 +1,29 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from infrastructure.di.providers import get_container
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.message_bus.outbox_relay import OutboxRelay
+from infrastructure.lifecycle.warmup import warm_up
+from infrastructure.lifecycle.shutdown import shut_down
+from infrastructure.lifecycle.in_flight import InFlightMiddleware, InFlightRequests
 from dishka.integrations.fastapi import setup_dishka
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    container = app.state.dishka_container
+    settings = await container.get(Settings)
+    # Connect, create indexes and optionally preload the cache before taking traffic
+    await warm_up(container, settings)
+    if settings.outbox_enabled:
+        # Drain the outbox in the background; the container stops the relay on close
+        relay = await container.get(OutboxRelay)
+        relay.start()
+    
     yield
     
-    # Close container on app termination
-    if hasattr(app.state, 'dishka_container'):
-        await app.state.dishka_container.close()
+    # Report not ready, let in-flight requests finish, then close everything in dependency order
+    await shut_down(container, settings, app.state.in_flight)
 
 
 def create_app() -> FastAPI:
@@ -22,9 +35,17 @@ def create_app() -> FastAPI:
     # Setup Dishka integration
     setup_dishka(container=container, app=app)
     
+    # Count requests in flight so shutdown can wait for them
+    app.state.in_flight = InFlightRequests()
+    app.add_middleware(InFlightMiddleware, in_flight=app.state.in_flight)
+    
     # Include routers
     from infrastructure.adapters.inbound.rest.category_controller import router as category_router
+    from infrastructure.adapters.inbound.rest.metrics_controller import router as metrics_router
+    from infrastructure.adapters.inbound.rest.health_controller import router as health_router
     app.include_router(category_router)
+    app.include_router(metrics_router)
+    app.include_router(health_router)
     
     @app.get("/")
     async def root():
@@ -1,12 +1,16 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 # Используем правильный путь импорта после настройки sys.path
-from main import app
+from main import create_app
 
 
 @pytest.fixture
 def client():
-    return TestClient(app)
+    # One application (and one event loop) per test: the Motor client binds
+    # to the loop it was first used on, so it must not be shared across tests
+    with TestClient(create_app()) as client:
+        yield client
 
 
 class TestCategoryAPI:
@@ -56,6 +60,95 @@ class TestCategoryAPI:
         data = response.json()
         assert isinstance(data, list)
     
+    def test_get_category_revalidates_with_etag(self, client):
+        # Arrange
+        created = client.post("/categories/", json={"name": "Cached Category"}).json()
+        first = client.get(f"/categories/{created['id']}")
+        
+        # Act
+        unchanged = client.get(f"/categories/{created['id']}", headers={"If-None-Match": first.headers["ETag"]})
+        client.put(f"/categories/{created['id']}", json={"name": "Renamed Category"})
+        changed = client.get(f"/categories/{created['id']}", headers={"If-None-Match": first.headers["ETag"]})
+        
+        # Assert
+        assert "must-revalidate" in first.headers["Cache-Control"]
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.json()["name"] == "Renamed Category"
+        assert changed.headers["ETag"] != first.headers["ETag"]
+    
+    def test_get_all_categories_paginates_with_cursor(self, client):
+        # Arrange
+        for index in range(3):
+            client.post("/categories/", json={"name": f"Paged {index}", "description": "Paged"})
+        
+        # Act
+        first = client.get("/categories/", params={"limit": 2})
+        second = client.get("/categories/", params={"limit": 2, "after": first.headers["X-Next-Cursor"]})
+        
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 200
+        first_ids = [item["id"] for item in first.json()]
+        second_ids = [item["id"] for item in second.json()]
+        assert len(first_ids) == 2
+        assert first_ids == sorted(first_ids)
+        assert not set(first_ids) & set(second_ids)
+        assert all(item_id > first_ids[-1] for item_id in second_ids)
+    
+    def test_get_all_categories_with_field_projection(self, client):
+        # Arrange
+        client.post("/categories/", json={"name": "Projected", "description": "Not returned"})
+        
+        # Act
+        response = client.get("/categories/", params={"fields": "name"})
+        
+        # Assert
+        assert response.status_code == 200
+        for item in response.json():
+            assert set(item) == {"id", "name"}
+    
+    def test_export_categories_ndjson(self, client):
+        # Arrange
+        created = client.post("/categories/", json={"name": "Exported", "description": "NDJSON"}).json()
+        
+        # Act
+        response = client.get("/categories/export")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert created in rows
+        assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    
+    def test_export_categories_json(self, client):
+        # Arrange
+        created = client.post("/categories/", json={"name": "Exported", "description": "JSON"}).json()
+        
+        # Act
+        response = client.get("/categories/export", params={"format": "json"})
+        
+        # Assert
+        assert response.status_code == 200
+        assert created in response.json()
+    
+    def test_get_categories_batch(self, client):
+        # Arrange
+        first = client.post("/categories/", json={"name": "Batch 1"}).json()
+        second = client.post("/categories/", json={"name": "Batch 2"}).json()
+        
+        # Act
+        response = client.get(
+            "/categories/batch", params=[("ids", second["id"]), ("ids", "missing-id"), ("ids", first["id"])]
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [second["id"], first["id"]]
+        assert data["missing"] == ["missing-id"]
+    
     def test_update_category_success(self, client):
         # Arrange
         # First create a category
@@ -81,6 +174,13 @@ class TestCategoryAPI:
         assert data["name"] == update_data["name"]
         assert data["description"] == update_data["description"]
     
+    def test_update_missing_category_returns_404(self, client):
+        # Act
+        response = client.put("/categories/missing-id", json={"name": "Name"})
+        
+        # Assert
+        assert response.status_code == 404
+    
     def test_delete_category_success(self, client):
         # Arrange
         # First create a category
@@ -99,6 +199,48 @@ class TestCategoryAPI:
         data = response.json()
         assert "message" in data
     
+    def test_bulk_create_categories(self, client):
+        # Arrange
+        items = [{"name": f"Bulk {index}", "description": "Imported"} for index in range(5)] + [{"name": ""}]
+        
+        # Act
+        response = client.post("/categories/bulk", json={"items": items})
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 5
+        assert data["failed"] == 1
+        assert data["results"][-1]["status"] == "invalid"
+        created_id = data["results"][0]["id"]
+        assert client.get(f"/categories/{created_id}").json()["name"] == "Bulk 0"
+    
+    def test_bulk_upsert_and_delete_categories(self, client):
+        # Arrange
+        existing = client.post("/categories/", json={"name": "Before upsert"}).json()
+        items = [
+            {"id": existing["id"], "name": "After upsert"},
+            {"id": f"{existing['id']}-new", "name": "Upserted"}
+        ]
+        
+        # Act
+        upsert_response = client.put("/categories/bulk", json={"items": items})
+        delete_response = client.post(
+            "/categories/bulk-delete", json={"ids": [existing["id"], f"{existing['id']}-missing"]}
+        )
+        
+        # Assert
+        assert [item["status"] for item in upsert_response.json()["results"]] == ["updated", "created"]
+        assert [item["status"] for item in delete_response.json()["results"]] == ["deleted", "not_found"]
+        assert client.get(f"/categories/{existing['id']}").status_code == 404
+    
+    def test_delete_missing_category_returns_404(self, client):
+        # Act
+        response = client.delete("/categories/missing-id")
+        
+        # Assert
+        assert response.status_code == 404
+    
     def test_get_category_statistics(self, client):
         # Arrange
         # Create a few categories first
@@ -124,4 +266,40 @@ class TestCategoryAPI:
         assert data["total_count"] >= 3
         assert isinstance(data["average_name_length"], (int, float))
         assert isinstance(data["longest_name"], str)
-        assert isinstance(data["shortest_name"], str)
\ No newline at end of file
+        assert isinstance(data["shortest_name"], str)
+    
+    def test_get_extended_category_statistics(self, client):
+        # Arrange
+        client.post("/categories/", json={"name": "Books"})
+        client.post("/categories/", json={"name": "Electronics"})
+        
+        # Act
+        response = client.get("/categories/statistics/extended")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] >= 2
+        assert data["min_name_length"] <= 5
+        assert data["max_name_length"] >= 11
+        assert set(data["name_length_percentiles"]) == {"p50", "p90", "p99"}
+        assert sum(bucket["count"] for bucket in data["name_length_histogram"]) == data["total_count"]
+    
+    def test_search_categories_by_prefix_and_words(self, client):
+        # Arrange
+        client.post("/categories/", json={"name": "Mountain bikes"})
+        client.post("/categories/", json={"name": "Mountaineering"})
+        
+        # Act
+        prefix_response = client.get("/categories/search", params={"q": "mountain", "limit": 50})
+        text_response = client.get("/categories/search", params={"q": "bikes", "mode": "text"})
+        empty_response = client.get("/categories/search", params={"q": "  "})
+        
+        # Assert
+        assert prefix_response.status_code == 200
+        names = [item["name"] for item in prefix_response.json()]
+        assert {"Mountain bikes", "Mountaineering"} <= set(names)
+        assert names == sorted(names, key=str.casefold)
+        assert text_response.status_code == 200
+        assert "Mountain bikes" in [item["name"] for item in text_response.json()]
+        assert empty_response.status_code == 400
\ No newline at end of file
@@ -0,0 +1,32 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import create_app
+
+
+@pytest.fixture
+def client():
+    # Entering the client runs the lifespan, i.e. the warm-up
+    with TestClient(create_app()) as client:
+        yield client
+
+
+class TestHealthAPI:
+    
+    def test_liveness(self, client):
+        # Act
+        response = client.get("/health/live")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+    
+    def test_readiness_after_warm_up(self, client):
+        # Act
+        response = client.get("/health/ready")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert set(data["backends"]) == {"mongodb", "redis", "rabbitmq"}
+        assert all(backend["ok"] for backend in data["backends"].values())
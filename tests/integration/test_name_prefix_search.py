@@ -0,0 +1,40 @@
+import pytest
+from domain.entities.category import Category
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+from infrastructure.adapters.outbound.cache.name_prefix_index import NamePrefixIndex
+
+
+# Names the ICU collation and code point order disagree on
+NAMES = [
+    "Straße", "STRASSE", "Strasse 2", "Ärzte", "arzt", "Zebra", "9 lives", "_draft", "Éclair", "eclair",
+    "Café", "cafe", "Σίσυφος", "ΣΊΣΥΦΟΣ", "😀 smileys", "Books", "books", "Boats"
+]
+
+
+class TestNamePrefixSearch:
+    """The in-process index and MongoDB must answer a prefix query identically"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefix", ["s", "STRAß", "ar", "ä", "caf", "σί", "😀", "b", "bo", "9", "_"])
+    async def test_index_and_repository_return_the_same_page(self, prefix):
+        # Arrange
+        settings = Settings()
+        database_name = f"{settings.mongodb_database_name}_name_prefix"
+        repository = MongoCategoryRepository(settings.mongodb_connection_string, database_name)
+        await repository.client.drop_database(database_name)
+        await repository.ensure_indexes()
+        try:
+            await repository.create_many([Category(id=None, name=name) for name in NAMES])
+            index = NamePrefixIndex()
+            index.rebuild(await repository.find_all(), version=1)
+            
+            # Act
+            from_repository = await repository.find_by_name_prefix(prefix, 5)
+            from_index = index.search(prefix, 5)
+        finally:
+            await repository.client.drop_database(database_name)
+            repository.close()
+        
+        # Assert
+        assert [str(category.id) for category in from_repository] == [str(category.id) for category in from_index]
@@ -0,0 +1,56 @@
+import pytest
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+from infrastructure.adapters.outbound.database.mongodb.category_statistics_repository_impl import (
+    MongoCategoryStatisticsRepository
+)
+from infrastructure.adapters.outbound.database.mongodb.outbox_store import MongoOutboxStore
+from infrastructure.adapters.outbound.database.mongodb.query_plan_inspector import QueryPlanInspector
+
+
+class TestQueryPlans:
+    """Every query of the MongoDB adapters must be served by an index"""
+    
+    @pytest.mark.asyncio
+    async def test_repository_queries_do_not_scan_collections(self):
+        # Arrange
+        settings = Settings()
+        inspector = QueryPlanInspector()
+        database_name = f"{settings.mongodb_database_name}_query_plans"
+        repository = MongoCategoryRepository(
+            settings.mongodb_connection_string, database_name, event_listeners=[inspector]
+        )
+        await repository.client.drop_database(database_name)
+        await repository.ensure_indexes()
+        outbox_store = MongoOutboxStore(repository.db)
+        try:
+            # Act: run every query the adapters issue
+            books = await repository.create(Category(id=None, name="Books"))
+            await repository.create_many([Category(id=None, name="Boats"), Category(id=None, name="Cars")])
+            await repository.upsert_many([Category(id=CategoryId("fixed-id"), name="Bikes")])
+            await repository.find_by_id(books.id)
+            await repository.find_by_ids([books.id, CategoryId("fixed-id")])
+            await repository.find_all()
+            _ = [category async for category in repository.iter_all()]
+            page = await repository.find_page(2, fields=["name"])
+            await repository.find_page(2, after=page.next_cursor)
+            await repository.find_by_name_prefix("bo", 10)
+            await repository.search_by_name("books", 10)
+            await repository.update(Category(id=books.id, name="Old books"))
+            await MongoCategoryStatisticsRepository(repository.db).compute_statistics()
+            await outbox_store.fetch_pending(10)
+            await outbox_store.acquire_lease("worker", 30.0)
+            await outbox_store.load_checkpoint()
+            await outbox_store.save_checkpoint([])
+            await outbox_store.acknowledge([])
+            await repository.delete(books.id)
+            await repository.delete_many([CategoryId("fixed-id")])
+            
+            scans = await inspector.check(repository.client)
+        finally:
+            await repository.client.drop_database(database_name)
+        
+        # Assert
+        assert scans == [], "\n".join(f"COLLSCAN: {scan.command}" for scan in scans)
@@ -1,7 +1,11 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, AsyncMock
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_page import CategoryPage
+from domain.value_objects.category_collection import CategoryCollection
+from domain.value_objects.bulk_item_result import BulkItemResult, BulkItemStatus
 from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository
 
 
@@ -10,17 +14,18 @@ class TestCachedCategoryRepository:
     
     @pytest.fixture
     def mock_repository(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def mock_cache_adapter(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def cached_repository(self, mock_repository, mock_cache_adapter):
         return CachedCategoryRepository(mock_repository, mock_cache_adapter)
     
-    def test_find_by_id_returns_cached_category(self, cached_repository, mock_cache_adapter, mock_repository):
+    @pytest.mark.asyncio
+    async def test_find_by_id_returns_cached_category(self, cached_repository, mock_cache_adapter, mock_repository):
         """Test that find_by_id returns category from cache when available"""
         # Arrange
         category_id = CategoryId("test-id")
@@ -29,78 +34,121 @@ class TestCachedCategoryRepository:
             'name': 'Test Category',
             'description': 'Test Description'
         }
-        mock_cache_adapter.get.return_value = cached_data
+        mock_cache_adapter.get_with_ttl.return_value = (cached_data, 120.0)
         
         # Act
-        result = cached_repository.find_by_id(category_id)
+        result = await cached_repository.find_by_id(category_id)
         
         # Assert
-        mock_cache_adapter.get.assert_called_once_with("category_test-id")
+        mock_cache_adapter.get_with_ttl.assert_called_once_with("category_test-id")
         mock_repository.find_by_id.assert_not_called()
         assert isinstance(result, Category)
         assert result.id == category_id
         assert result.name == "Test Category"
         assert result.description == "Test Description"
     
-    def test_find_by_id_returns_repository_category_when_not_cached(self, cached_repository, mock_cache_adapter, mock_repository):
+    @pytest.mark.asyncio
+    async def test_find_by_id_returns_repository_category_when_not_cached(self, cached_repository, mock_cache_adapter, mock_repository):
         """Test that find_by_id returns category from repository when not in cache"""
         # Arrange
         category_id = CategoryId("test-id")
-        mock_cache_adapter.get.return_value = None
+        mock_cache_adapter.get_with_ttl.return_value = (None, None)
+        mock_cache_adapter.acquire_lock.return_value = "lock-token"
         category = Category(id=category_id, name="Test Category", description="Test Description")
         mock_repository.find_by_id.return_value = category
         
         # Act
-        result = cached_repository.find_by_id(category_id)
+        result = await cached_repository.find_by_id(category_id)
         
         # Assert
-        mock_cache_adapter.get.assert_called_once_with("category_test-id")
+        mock_cache_adapter.get_with_ttl.assert_called_once_with("category_test-id")
         mock_repository.find_by_id.assert_called_once_with(category_id)
         assert result == category
     
-    def test_find_by_id_returns_none_when_not_found(self, cached_repository, mock_cache_adapter, mock_repository):
+    @pytest.mark.asyncio
+    async def test_find_by_id_returns_none_when_not_found(self, cached_repository, mock_cache_adapter, mock_repository):
         """Test that find_by_id returns None when category not found"""
         # Arrange
         category_id = CategoryId("test-id")
-        mock_cache_adapter.get.return_value = None
+        mock_cache_adapter.get_with_ttl.return_value = (None, None)
+        mock_cache_adapter.acquire_lock.return_value = "lock-token"
         mock_repository.find_by_id.return_value = None
         
         # Act
-        result = cached_repository.find_by_id(category_id)
+        result = await cached_repository.find_by_id(category_id)
         
         # Assert
         assert result is None
     
-    def test_find_all_returns_cached_categories(self, cached_repository, mock_cache_adapter, mock_repository):
-        """Test that find_all returns categories from cache when available"""
+    @pytest.mark.asyncio
+    async def test_find_all_returns_cached_categories(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that find_all returns categories from the cached snapshot when available"""
         # Arrange
-        cached_data = [
-            {
-                'id': 'test-id-1',
-                'name': 'Test Category 1',
-                'description': 'Test Description 1'
-            },
-            {
+        cached_data = {
+            'test-id-2': {
                 'id': 'test-id-2',
                 'name': 'Test Category 2',
                 'description': 'Test Description 2'
+            },
+            'test-id-1': {
+                'id': 'test-id-1',
+                'name': 'Test Category 1',
+                'description': 'Test Description 1'
             }
-        ]
-        mock_cache_adapter.get.return_value = cached_data
+        }
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (cached_data, 120.0)
         
         # Act
-        result = cached_repository.find_all()
+        result = await cached_repository.find_all()
         
         # Assert
-        mock_cache_adapter.get.assert_called_once_with("all_categories")
+        mock_cache_adapter.get_snapshot_with_ttl.assert_called_once_with("categories_snapshot")
         mock_repository.find_all.assert_not_called()
+        assert isinstance(result, CategoryCollection)
         assert len(result) == 2
         assert all(isinstance(cat, Category) for cat in result)
+        assert [str(cat.id) for cat in result] == ['test-id-1', 'test-id-2']
     
-    def test_find_all_returns_repository_categories_when_not_cached(self, cached_repository, mock_cache_adapter, mock_repository):
-        """Test that find_all returns categories from repository when not in cache"""
+    @pytest.mark.asyncio
+    async def test_find_all_reuses_collection_until_snapshot_changes(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that the same local snapshot is turned into a collection only once"""
         # Arrange
-        mock_cache_adapter.get.return_value = None
+        snapshot = {'test-id': {'id': 'test-id', 'name': 'Old', 'description': None}}
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (snapshot, None)
+        
+        # Act
+        first = await cached_repository.find_all()
+        second = await cached_repository.find_all()
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (
+            {'test-id': {'id': 'test-id', 'name': 'New', 'description': None}}, None
+        )
+        after_eviction = await cached_repository.find_all()
+        
+        # Assert
+        assert second is first
+        assert after_eviction is not first
+        assert after_eviction[0].name == 'New'
+    
+    @pytest.mark.asyncio
+    async def test_find_all_returns_empty_cached_snapshot(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that an empty collection is served from cache too"""
+        # Arrange
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = ({}, 120.0)
+        
+        # Act
+        result = await cached_repository.find_all()
+        
+        # Assert
+        mock_repository.find_all.assert_not_called()
+        assert result == []
+    
+    @pytest.mark.asyncio
+    async def test_find_all_returns_repository_categories_when_not_cached(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that find_all loads from repository and stores a snapshot guarded by the version read before loading"""
+        # Arrange
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (None, None)
+        mock_cache_adapter.acquire_lock.return_value = "lock-token"
+        mock_cache_adapter.get_version.return_value = 7
         categories = [
             Category(id=CategoryId("test-id-1"), name="Test Category 1", description="Test Description 1"),
             Category(id=CategoryId("test-id-2"), name="Test Category 2", description="Test Description 2")
@@ -108,30 +156,45 @@ class TestCachedCategoryRepository:
         mock_repository.find_all.return_value = categories
         
         # Act
-        result = cached_repository.find_all()
+        result = await cached_repository.find_all()
         
         # Assert
-        mock_cache_adapter.get.assert_called_once_with("all_categories")
+        mock_cache_adapter.get_snapshot_with_ttl.assert_called_once_with("categories_snapshot")
         mock_repository.find_all.assert_called_once()
+        mock_cache_adapter.put_snapshot.assert_awaited_once()
+        args, kwargs = mock_cache_adapter.put_snapshot.await_args
+        assert args[:2] == ("categories_snapshot", "categories_version")
+        assert set(args[2]) == {"test-id-1", "test-id-2"}
+        assert kwargs["expected_version"] == 7
         assert result == categories
     
-    def test_create_invalidates_all_categories_cache(self, cached_repository, mock_cache_adapter, mock_repository):
-        """Test that create invalidates all categories cache"""
+    @pytest.mark.asyncio
+    async def test_create_writes_through_to_cached_list(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that create adds the category to the cached list instead of dropping it"""
         # Arrange
         category = Category(id=None, name="Test Category", description="Test Description")
         saved_category = Category(id=CategoryId("test-id"), name="Test Category", description="Test Description")
         mock_repository.create.return_value = saved_category
         
         # Act
-        result = cached_repository.create(category)
+        result = await cached_repository.create(category)
         
         # Assert
         mock_repository.create.assert_called_once_with(category)
-        mock_cache_adapter.delete.assert_called_once_with("all_categories")
+        mock_cache_adapter.write_through.assert_awaited_once_with(
+            "categories_snapshot",
+            "categories_version",
+            "test-id",
+            {'id': 'test-id', 'name': 'Test Category', 'description': 'Test Description'},
+            "category_test-id",
+            expire=300
+        )
+        mock_cache_adapter.delete.assert_not_called()
         assert result == saved_category
     
-    def test_update_invalidates_caches(self, cached_repository, mock_cache_adapter, mock_repository):
-        """Test that update invalidates both specific category and all categories caches"""
+    @pytest.mark.asyncio
+    async def test_update_writes_through_to_caches(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that update writes the new state to the category key and the cached list in one call"""
         # Arrange
         category_id = CategoryId("test-id")
         category = Category(id=category_id, name="Updated Category", description="Updated Description")
@@ -139,27 +202,379 @@ class TestCachedCategoryRepository:
         mock_repository.update.return_value = updated_category
         
         # Act
-        result = cached_repository.update(category)
+        result = await cached_repository.update(category)
         
         # Assert
         mock_repository.update.assert_called_once_with(category)
-        assert mock_cache_adapter.delete.call_count == 2
-        mock_cache_adapter.delete.assert_any_call("category_test-id")
-        mock_cache_adapter.delete.assert_any_call("all_categories")
+        mock_cache_adapter.write_through.assert_awaited_once_with(
+            "categories_snapshot",
+            "categories_version",
+            "test-id",
+            {'id': 'test-id', 'name': 'Updated Category', 'description': 'Updated Description'},
+            "category_test-id",
+            expire=300
+        )
+        mock_cache_adapter.delete_many.assert_not_called()
         assert result == updated_category
     
-    def test_delete_invalidates_caches(self, cached_repository, mock_cache_adapter, mock_repository):
-        """Test that delete invalidates both specific category and all categories caches"""
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_caches(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that delete removes the category from its key and the cached list in one call"""
         # Arrange
         category_id = CategoryId("test-id")
         mock_repository.delete.return_value = True
         
         # Act
-        result = cached_repository.delete(category_id)
+        result = await cached_repository.delete(category_id)
         
         # Assert
         mock_repository.delete.assert_called_once_with(category_id)
-        assert mock_cache_adapter.delete.call_count == 2
-        mock_cache_adapter.delete.assert_any_call("category_test-id")
-        mock_cache_adapter.delete.assert_any_call("all_categories")
-        assert result is True
\ No newline at end of file
+        mock_cache_adapter.remove_through.assert_awaited_once_with(
+            "categories_snapshot", "categories_version", "test-id", "category_test-id"
+        )
+        assert result is True
+    
+    @pytest.mark.asyncio
+    async def test_delete_of_missing_category_leaves_cache_untouched(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a no-op delete does not bump the cache version"""
+        # Arrange
+        mock_repository.delete.return_value = False
+        
+        # Act
+        result = await cached_repository.delete(CategoryId("test-id"))
+        
+        # Assert
+        mock_cache_adapter.remove_through.assert_not_called()
+        assert result is False
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_find_all_misses_scan_repository_once(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that simultaneous misses are coalesced into one full scan"""
+        # Arrange
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (None, None)
+        mock_cache_adapter.acquire_lock.return_value = "lock-token"
+        categories = [Category(id=CategoryId("test-id"), name="Test Category", description=None)]
+        
+        async def slow_find_all():
+            await asyncio.sleep(0.01)
+            return categories
+        
+        mock_repository.find_all.side_effect = slow_find_all
+        
+        # Act
+        results = await asyncio.gather(*(cached_repository.find_all() for _ in range(50)))
+        
+        # Assert
+        mock_repository.find_all.assert_awaited_once()
+        assert all(result == categories for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_find_page_returns_cached_page(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a page is served from the cache entry of the current collection version"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 7
+        mock_cache_adapter.get.return_value = {
+            'items': [{'id': 'b', 'name': 'B', 'description': None}],
+            'next_cursor': 'b'
+        }
+        
+        # Act
+        result = await cached_repository.find_page(1, CategoryId("a"), ["name"])
+        
+        # Assert
+        mock_cache_adapter.get.assert_called_once_with("categories_page:7:1:a:name")
+        mock_repository.find_page.assert_not_called()
+        assert result == CategoryPage(items=[Category(id=CategoryId("b"), name="B")], next_cursor=CategoryId("b"))
+    
+    @pytest.mark.asyncio
+    async def test_find_page_bypasses_cache_without_version(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that pages are neither read from nor stored in the cache while the version is unknown"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = None
+        page = CategoryPage(items=[Category(id=CategoryId("a"), name="A")], next_cursor=None)
+        mock_repository.find_page.return_value = page
+        
+        # Act
+        result = await cached_repository.find_page(50)
+        
+        # Assert
+        assert result == page
+        mock_cache_adapter.get.assert_not_called()
+        mock_cache_adapter.set.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_find_page_loads_and_caches_page_when_not_cached(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a missed page is loaded once and stored under the version read before loading"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 3
+        mock_cache_adapter.get.return_value = None
+        mock_cache_adapter.acquire_lock.return_value = "lock-token"
+        page = CategoryPage(items=[Category(id=CategoryId("a"), name="A", description="Desc")], next_cursor=None)
+        mock_repository.find_page.return_value = page
+        
+        # Act
+        result = await cached_repository.find_page(50)
+        
+        # Assert
+        assert result == page
+        mock_repository.find_page.assert_called_once_with(50, None, None)
+        mock_cache_adapter.set.assert_called_once_with(
+            "categories_page:3:50::*",
+            {'items': [{'id': 'a', 'name': 'A', 'description': 'Desc'}], 'next_cursor': None},
+            expire=300
+        )
+    
+    @pytest.mark.asyncio
+    async def test_iter_all_streams_from_repository_without_caching(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that exports bypass the cache entirely"""
+        # Arrange
+        category = Category(id=CategoryId("test-id"), name="Test Category", description=None)
+        
+        async def iter_all():
+            yield category
+        
+        mock_repository.iter_all = Mock(return_value=iter_all())
+        
+        # Act
+        result = [item async for item in cached_repository.iter_all()]
+        
+        # Assert
+        assert result == [category]
+        assert mock_cache_adapter.mock_calls == []
+    
+    @pytest.mark.asyncio
+    async def test_create_many_writes_successful_items_through_in_one_call(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a bulk create updates the cache with one script call for the whole batch"""
+        # Arrange
+        categories = [Category(id=None, name="First"), Category(id=None, name="Second")]
+        mock_repository.create_many.return_value = [
+            BulkItemResult(0, CategoryId("first-id"), BulkItemStatus.CREATED),
+            BulkItemResult(1, CategoryId("second-id"), BulkItemStatus.CONFLICT, "already exists")
+        ]
+        
+        # Act
+        results = await cached_repository.create_many(categories)
+        
+        # Assert
+        assert results == mock_repository.create_many.return_value
+        mock_cache_adapter.write_through_many.assert_awaited_once_with(
+            "categories_snapshot",
+            "categories_version",
+            [("first-id", {'id': 'first-id', 'name': 'First', 'description': None}, "category_first-id")],
+            expire=300
+        )
+        mock_cache_adapter.write_through.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_removes_deleted_items_in_one_call(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a bulk delete removes only the deleted ids from the cache in one call"""
+        # Arrange
+        mock_repository.delete_many.return_value = [
+            BulkItemResult(0, CategoryId("gone-id"), BulkItemStatus.DELETED),
+            BulkItemResult(1, CategoryId("missing-id"), BulkItemStatus.NOT_FOUND)
+        ]
+        
+        # Act
+        await cached_repository.delete_many([CategoryId("gone-id"), CategoryId("missing-id")])
+        
+        # Assert
+        mock_cache_adapter.remove_through_many.assert_awaited_once_with(
+            "categories_snapshot", "categories_version", [("gone-id", "category_gone-id")]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_find_by_ids_loads_only_cache_misses(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that one MGET serves the hits and one repository query serves the misses"""
+        # Arrange
+        mock_cache_adapter.get_many.return_value = {
+            "category_a": {'id': 'a', 'name': 'A', 'description': None}
+        }
+        mock_repository.find_by_ids.return_value = [Category(id=CategoryId("b"), name="B", description=None)]
+        
+        # Act
+        result = await cached_repository.find_by_ids([CategoryId("b"), CategoryId("a"), CategoryId("c"), CategoryId("a")])
+        
+        # Assert
+        mock_cache_adapter.get_many.assert_awaited_once_with("category_b", "category_a", "category_c")
+        mock_repository.find_by_ids.assert_awaited_once_with([CategoryId("b"), CategoryId("c")])
+        mock_cache_adapter.set_many.assert_awaited_once_with(
+            {"category_b": {'id': 'b', 'name': 'B', 'description': None}}, expire=300
+        )
+        assert [str(category.id) for category in result] == ["b", "a"]
+    
+    @pytest.mark.asyncio
+    async def test_find_by_ids_all_cached_skips_repository(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a fully cached lookup does not reach the repository"""
+        # Arrange
+        mock_cache_adapter.get_many.return_value = {
+            "category_a": {'id': 'a', 'name': 'A', 'description': None}
+        }
+        
+        # Act
+        result = await cached_repository.find_by_ids([CategoryId("a")])
+        
+        # Assert
+        mock_repository.find_by_ids.assert_not_called()
+        assert result == [Category(id=CategoryId("a"), name="A", description=None)]    
+    @pytest.mark.asyncio
+    async def test_find_by_name_prefix_answers_from_name_index(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that prefix queries build the name index once from the snapshot and then skip the backends"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 4
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = ({
+            'a': {'id': 'a', 'name': 'Books', 'description': None},
+            'b': {'id': 'b', 'name': 'bikes', 'description': 'Two wheels'},
+            'c': {'id': 'c', 'name': 'Cars', 'description': None}
+        }, 120.0)
+        
+        # Act
+        first = await cached_repository.find_by_name_prefix("b", 10)
+        second = await cached_repository.find_by_name_prefix("BO", 10)
+        
+        # Assert
+        assert [category.name for category in first] == ["bikes", "Books"]
+        assert second == [Category(id=CategoryId("a"), name="Books")]
+        mock_cache_adapter.get_snapshot_with_ttl.assert_awaited_once()
+        mock_cache_adapter.get_version.assert_awaited_once()
+        mock_repository.find_by_name_prefix.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_find_by_name_prefix_rebuilds_name_index_when_a_remote_write_stays_missing(self, mock_repository, mock_cache_adapter):
+        """Test that the name index is rebuilt once it is still behind the version seen at the previous check"""
+        # Arrange
+        cached_repository = CachedCategoryRepository(mock_repository, mock_cache_adapter, name_index_refresh_interval=0)
+        mock_cache_adapter.get_version.return_value = 1
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (
+            {'a': {'id': 'a', 'name': 'Books', 'description': None}}, 120.0
+        )
+        await cached_repository.find_by_name_prefix("b", 10)
+        mock_cache_adapter.get_version.return_value = 2
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = ({
+            'a': {'id': 'a', 'name': 'Books', 'description': None},
+            'b': {'id': 'b', 'name': 'Boats', 'description': None}
+        }, 120.0)
+        
+        # Act
+        waiting = await cached_repository.find_by_name_prefix("b", 10)
+        rebuilt = await cached_repository.find_by_name_prefix("b", 10)
+        
+        # Assert
+        assert [category.name for category in waiting] == ["Books"]
+        assert [category.name for category in rebuilt] == ["Boats", "Books"]
+        assert cached_repository.name_index.version == 2
+    
+    @pytest.mark.asyncio
+    async def test_remote_writes_are_applied_to_name_index_in_version_order(self, mock_repository, mock_cache_adapter):
+        """Test that other workers' writes update the name index in place, even when they arrive out of order"""
+        # Arrange
+        cached_repository = CachedCategoryRepository(mock_repository, mock_cache_adapter, name_index_refresh_interval=0)
+        mock_cache_adapter.get_version.return_value = 1
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (
+            {'a': {'id': 'a', 'name': 'Books', 'description': None}}, 120.0
+        )
+        await cached_repository.find_by_name_prefix("b", 10)
+        
+        # Act
+        cached_repository._apply_change("categories_snapshot", 3, {}, ["b"])
+        cached_repository._apply_change(
+            "categories_snapshot", 2, {'b': {'id': 'b', 'name': 'Boats', 'description': None}}, []
+        )
+        cached_repository._apply_change(
+            "categories_snapshot", 4, {'c': {'id': 'c', 'name': 'Bikes', 'description': None}}, []
+        )
+        mock_cache_adapter.get_version.return_value = 4
+        result = await cached_repository.find_by_name_prefix("b", 10)
+        
+        # Assert
+        assert [category.name for category in result] == ["Bikes", "Books"]
+        assert cached_repository.name_index.version == 4
+        mock_cache_adapter.get_snapshot_with_ttl.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_unreadable_version_keeps_serving_name_index(self, mock_repository, mock_cache_adapter):
+        """Test that the name index is not rebuilt on every check while the cache is unreachable"""
+        # Arrange
+        cached_repository = CachedCategoryRepository(mock_repository, mock_cache_adapter, name_index_refresh_interval=0)
+        mock_cache_adapter.get_version.return_value = None
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (
+            {'a': {'id': 'a', 'name': 'Books', 'description': None}}, 120.0
+        )
+        
+        # Act
+        first = await cached_repository.find_by_name_prefix("b", 10)
+        second = await cached_repository.find_by_name_prefix("b", 10)
+        
+        # Assert
+        assert [category.name for category in first] == [category.name for category in second] == ["Books"]
+        mock_cache_adapter.get_snapshot_with_ttl.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_local_writes_are_applied_to_name_index(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that writes following the indexed version update the name index in place"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 1
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = (
+            {'a': {'id': 'a', 'name': 'Books', 'description': None}}, 120.0
+        )
+        await cached_repository.find_by_name_prefix("b", 10)
+        mock_repository.create.return_value = Category(id=CategoryId("b"), name="Boats")
+        mock_cache_adapter.write_through.return_value = 2
+        mock_repository.delete.return_value = True
+        mock_cache_adapter.remove_through.return_value = 3
+        
+        # Act
+        await cached_repository.create(Category(id=None, name="Boats"))
+        await cached_repository.delete(CategoryId("a"))
+        result = await cached_repository.find_by_name_prefix("b", 10)
+        
+        # Assert
+        assert result == [Category(id=CategoryId("b"), name="Boats")]
+        assert cached_repository.name_index.version == 3
+        mock_cache_adapter.get_snapshot_with_ttl.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_write_after_missed_version_waits_for_the_missing_ones(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a write that does not follow the indexed version is not applied before its predecessors"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 1
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = ({}, 120.0)
+        await cached_repository.find_by_name_prefix("b", 10)
+        mock_repository.update.return_value = Category(id=CategoryId("b"), name="Boats")
+        mock_cache_adapter.write_through.return_value = 5
+        
+        # Act
+        await cached_repository.update(Category(id=CategoryId("b"), name="Boats"))
+        
+        # Assert
+        assert cached_repository.name_index.version == 1
+        assert cached_repository.name_index.search("b", 10) == []
+    
+    @pytest.mark.asyncio
+    async def test_write_that_missed_the_cache_invalidates_name_index(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that a write whose version is unknown marks the name index outdated"""
+        # Arrange
+        mock_cache_adapter.get_version.return_value = 1
+        mock_cache_adapter.get_snapshot_with_ttl.return_value = ({}, 120.0)
+        await cached_repository.find_by_name_prefix("b", 10)
+        mock_repository.update.return_value = Category(id=CategoryId("b"), name="Boats")
+        mock_cache_adapter.write_through.return_value = 0
+        
+        # Act
+        await cached_repository.update(Category(id=CategoryId("b"), name="Boats"))
+        
+        # Assert
+        assert cached_repository.name_index.version is None
+    
+    @pytest.mark.asyncio
+    async def test_search_by_name_delegates_to_repository(self, cached_repository, mock_cache_adapter, mock_repository):
+        """Test that full-text search always goes to the repository"""
+        # Arrange
+        categories = [Category(id=CategoryId("a"), name="Mountain bikes")]
+        mock_repository.search_by_name.return_value = categories
+        
+        # Act
+        result = await cached_repository.search_by_name("bikes", 5)
+        
+        # Assert
+        mock_repository.search_by_name.assert_awaited_once_with("bikes", 5)
+        assert result == categories
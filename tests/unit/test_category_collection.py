@@ -0,0 +1,86 @@
+import pytest
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection, CategoryCollectionBuilder
+
+
+class TestCategoryCollection:
+    """Unit tests for CategoryCollection"""
+    
+    @pytest.fixture
+    def categories(self):
+        return [
+            Category(id=CategoryId("id-1"), name="Книги", description="Бумажные"),
+            Category(id=CategoryId("id-2"), name="Toys", description=None),
+            Category(id=CategoryId("id-3"), name="Games 🎲", description="")
+        ]
+    
+    def test_rows_round_trip(self, categories):
+        """Test that non-ASCII text, empty and missing descriptions survive packing"""
+        # Act
+        collection = CategoryCollection.of(categories)
+        
+        # Assert
+        assert len(collection) == 3
+        assert list(collection) == categories
+        assert list(collection.rows()) == [("id-1", "Книги", "Бумажные"), ("id-2", "Toys", None), ("id-3", "Games 🎲", "")]
+        assert collection.name_lengths.tolist() == [5, 4, 7]
+    
+    def test_rows_are_built_lazily_on_access(self, categories):
+        """Test indexing, negative indexes and slices of the lazy row views"""
+        # Arrange
+        collection = CategoryCollection.of(categories)
+        
+        # Act / Assert
+        assert collection[1] == categories[1]
+        assert collection[-1] == categories[-1]
+        assert collection[0:2] == categories[0:2]
+        assert collection.names[2] == "Games 🎲"
+        assert collection.descriptions[1] is None
+        with pytest.raises(IndexError):
+            collection[3]
+    
+    def test_to_dicts_honours_the_projection(self, categories):
+        """Test that dicts are read straight from the requested columns"""
+        # Arrange
+        collection = CategoryCollection.of(categories)
+        
+        # Act
+        items = collection.to_dicts(["id", "name"])
+        
+        # Assert
+        assert items[1] == {"id": "id-2", "name": "Toys"}
+        assert collection.to_dicts()[1] == {"id": "id-2", "name": "Toys", "description": None}
+    
+    def test_builder_packs_rows_as_they_arrive(self):
+        """Test that rows appended one by one give the same collection as from_rows"""
+        # Arrange
+        builder = CategoryCollectionBuilder()
+        
+        # Act
+        builder.append("id-1", "Books", "Paper")
+        builder.append("id-2", "Toys")
+        collection = builder.build()
+        
+        # Assert
+        assert collection == CategoryCollection.from_rows([("id-1", "Books", "Paper"), ("id-2", "Toys", None)])
+        assert collection.nbytes > 0
+    
+    def test_of_keeps_an_existing_collection(self, categories):
+        """Test that converting a collection again does not copy it"""
+        # Arrange
+        collection = CategoryCollection.of(categories)
+        
+        # Act / Assert
+        assert CategoryCollection.of(collection) is collection
+    
+    def test_empty_collection(self):
+        """Test that an empty collection behaves like an empty list"""
+        # Act
+        collection = CategoryCollection.of([])
+        
+        # Assert
+        assert len(collection) == 0
+        assert collection == []
+        assert collection.to_dicts() == []
+        assert collection.name_lengths.size == 0
@@ -0,0 +1,52 @@
+import pytest
+from dataclasses import FrozenInstanceError
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+# The entity module imports its exception through the src package
+from src.domain.exceptions.category_exceptions import InvalidCategoryError
+
+
+class TestCategoryEntities:
+    """Unit tests for the Category entity and the CategoryId value object"""
+    
+    def test_trusted_constructors_build_equal_objects(self):
+        """Test that trusted construction gives the same objects as the validating constructors"""
+        # Act
+        category = Category.trusted(CategoryId.trusted("test-id"), "Books", "Paper")
+        
+        # Assert
+        assert category == Category(id=CategoryId("test-id"), name="Books", description="Paper")
+        assert hash(category.id) == hash(CategoryId("test-id"))
+        assert str(category.id) == "test-id"
+    
+    def test_untrusted_input_is_still_validated(self):
+        """Test that the regular constructors keep rejecting invalid values"""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            CategoryId("")
+        with pytest.raises(InvalidCategoryError):
+            Category(id=None, name="")
+    
+    def test_instances_are_slotted(self):
+        """Test that neither type carries a per-instance __dict__"""
+        # Act
+        category = Category.trusted(CategoryId.trusted("test-id"), "Books")
+        
+        # Assert
+        assert not hasattr(category, "__dict__")
+        assert not hasattr(category.id, "__dict__")
+        assert category.description is None
+    
+    def test_category_id_is_frozen_and_category_is_not(self):
+        """Test that ids are immutable while a category can still receive its generated id"""
+        # Arrange
+        category = Category(id=None, name="Books")
+        category_id = CategoryId.new()
+        
+        # Act
+        category.id = category_id
+        
+        # Assert
+        assert category.id is category_id
+        with pytest.raises(FrozenInstanceError):
+            category_id.value = "other"
@@ -0,0 +1,56 @@
+import pytest
+from domain.entities.category import Category
+from domain.value_objects.category_name_key import category_name_key
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+
+
+# Names the ICU collation and code point order disagree on
+NAMES = [
+    "Straße", "STRASSE", "Strasse 2", "Ärzte", "arzt", "Zebra", "zz", "9 lives", "_draft", "Éclair", "eclair",
+    "Café", "cafe", "ǅemal", "Σίσυφος", "ΣΊΣΥΦΟΣ", "😀 smileys", "a\uffff", "a\U0010ffff", "b"
+]
+
+
+class TestCategoryNameKey:
+    """Unit tests for the name key shared by the in-process index and MongoDB"""
+    
+    def test_key_folds_case_including_special_cases(self):
+        """Test that names differing only in case, ß included, share a key"""
+        # Act
+        keys = {category_name_key(name) for name in ("Straße", "STRASSE", "strasse")}
+        
+        # Assert
+        assert keys == {"strasse"}
+    
+    @pytest.mark.parametrize("prefix", ["s", "STRAß", "ar", "ä", "caf", "σί", "😀", "a", "a\uffff", "9", "_", "zz"])
+    def test_mongo_range_matches_the_same_names_as_the_index(self, prefix):
+        """Test that the MongoDB key range selects exactly the keys the in-process index matches"""
+        # Arrange
+        key = category_name_key(prefix)
+        keys = sorted(category_name_key(name) for name in NAMES)
+        upper_bound = MongoCategoryRepository._prefix_upper_bound(key)
+        
+        # Act
+        in_range = [
+            name_key for name_key in keys if key <= name_key and (upper_bound is None or name_key < upper_bound)
+        ]
+        
+        # Assert
+        assert in_range == [name_key for name_key in keys if name_key.startswith(key)]
+    
+    def test_upper_bound_of_the_last_character_carries_over(self):
+        """Test that a prefix ending with the highest code point has the next string as its bound"""
+        # Act
+        bound = MongoCategoryRepository._prefix_upper_bound("a\U0010ffff")
+        
+        # Assert
+        assert bound == "b"
+        assert MongoCategoryRepository._prefix_upper_bound("\U0010ffff") is None
+    
+    def test_stored_document_carries_the_name_key(self):
+        """Test that every written document has the key prefix queries match on"""
+        # Act
+        document = MongoCategoryRepository._to_document(Category(id=None, name="Straße"))
+        
+        # Assert
+        assert document["name_key"] == "strasse"
@@ -1,44 +1,53 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
-from domain.exceptions.category_exceptions import CategoryNotFoundError
-from application.use_cases.category_read_use_case import CategoryReadUseCase
+from domain.value_objects.category_page import CategoryPage
+from domain.exceptions.category_exceptions import CategoryNotFoundError, InvalidCategoryError
+from application.use_cases.category_read_use_case import (
+    CategoryReadUseCase,
+    MAX_PAGE_SIZE,
+    MAX_LOOKUP_SIZE,
+    MAX_SEARCH_LIMIT
+)
 
 
 class TestCategoryReadUseCase:
     
     @pytest.fixture
     def mock_repository(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def use_case(self, mock_repository):
         return CategoryReadUseCase(mock_repository)
     
-    def test_get_category_success_from_repository(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_get_category_success_from_repository(self, use_case, mock_repository):
         # Arrange
         category_id = CategoryId.new()
         expected_category = Category(id=category_id, name="Test", description="Test")
         mock_repository.find_by_id.return_value = expected_category
         
         # Act
-        result = use_case.get_category(category_id)
+        result = await use_case.get_category(category_id)
         
         # Assert
         assert result == expected_category
         mock_repository.find_by_id.assert_called_once_with(category_id)
     
-    def test_get_category_not_found_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_get_category_not_found_raises_exception(self, use_case, mock_repository):
         # Arrange
         category_id = CategoryId.new()
         mock_repository.find_by_id.return_value = None
         
         # Act & Assert
         with pytest.raises(CategoryNotFoundError):
-            use_case.get_category(category_id)
+            await use_case.get_category(category_id)
     
-    def test_get_all_categories_from_repository(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_get_all_categories_from_repository(self, use_case, mock_repository):
         # Arrange
         categories = [
             Category(id=CategoryId.new(), name="Category 1", description="Desc 1"),
@@ -47,8 +56,113 @@ class TestCategoryReadUseCase:
         mock_repository.find_all.return_value = categories
         
         # Act
-        result = use_case.get_all_categories()
+        result = await use_case.get_all_categories()
         
         # Assert
         assert result == categories
-        mock_repository.find_all.assert_called_once()
\ No newline at end of file
+        mock_repository.find_all.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_categories_page_from_repository(self, use_case, mock_repository):
+        # Arrange
+        after = CategoryId("cursor-id")
+        page = CategoryPage(items=[Category(id=CategoryId("next-id"), name="Category 1")], next_cursor=None)
+        mock_repository.find_page.return_value = page
+        
+        # Act
+        result = await use_case.get_categories_page(10, after, ["name"])
+        
+        # Assert
+        assert result == page
+        mock_repository.find_page.assert_called_once_with(10, after, ["name"])
+    
+    @pytest.mark.asyncio
+    async def test_get_categories_page_caps_page_size(self, use_case, mock_repository):
+        # Arrange
+        mock_repository.find_page.return_value = CategoryPage()
+        
+        # Act
+        await use_case.get_categories_page(MAX_PAGE_SIZE * 10)
+        
+        # Assert
+        mock_repository.find_page.assert_called_once_with(MAX_PAGE_SIZE, None, None)
+    
+    @pytest.mark.asyncio
+    async def test_export_categories_streams_from_repository(self, use_case, mock_repository):
+        # Arrange
+        categories = [
+            Category(id=CategoryId("id-1"), name="Category 1"),
+            Category(id=CategoryId("id-2"), name="Category 2")
+        ]
+        
+        async def iter_all():
+            for category in categories:
+                yield category
+        
+        mock_repository.iter_all = Mock(return_value=iter_all())
+        
+        # Act
+        result = [category async for category in use_case.export_categories()]
+        
+        # Assert
+        assert result == categories
+        mock_repository.iter_all.assert_called_once_with()
+        mock_repository.find_all.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_get_categories_resolves_ids_in_one_call(self, use_case, mock_repository):
+        # Arrange
+        category_ids = [CategoryId("id-1"), CategoryId("id-2")]
+        categories = [Category(id=CategoryId("id-1"), name="Category 1")]
+        mock_repository.find_by_ids.return_value = categories
+        
+        # Act
+        result = await use_case.get_categories(category_ids)
+        
+        # Assert
+        assert result == categories
+        mock_repository.find_by_ids.assert_called_once_with(category_ids)
+    
+    @pytest.mark.asyncio
+    async def test_get_categories_rejects_oversized_lookup(self, use_case, mock_repository):
+        # Arrange
+        category_ids = [CategoryId.new() for _ in range(MAX_LOOKUP_SIZE + 1)]
+        
+        # Act & Assert
+        with pytest.raises(InvalidCategoryError):
+            await use_case.get_categories(category_ids)
+        mock_repository.find_by_ids.assert_not_called()    
+    @pytest.mark.asyncio
+    async def test_autocomplete_categories_bounds_limit(self, use_case, mock_repository):
+        # Arrange
+        categories = [Category(id=CategoryId("id-1"), name="Books")]
+        mock_repository.find_by_name_prefix.return_value = categories
+        
+        # Act
+        result = await use_case.autocomplete_categories(" bo ", MAX_SEARCH_LIMIT + 100)
+        
+        # Assert
+        assert result == categories
+        mock_repository.find_by_name_prefix.assert_called_once_with("bo", MAX_SEARCH_LIMIT)
+    
+    @pytest.mark.asyncio
+    async def test_search_categories_uses_text_search(self, use_case, mock_repository):
+        # Arrange
+        mock_repository.search_by_name.return_value = []
+        
+        # Act
+        result = await use_case.search_categories("mountain bikes", 5)
+        
+        # Assert
+        assert result == []
+        mock_repository.search_by_name.assert_called_once_with("mountain bikes", 5)
+    
+    @pytest.mark.asyncio
+    async def test_empty_search_query_is_rejected(self, use_case, mock_repository):
+        # Act & Assert
+        with pytest.raises(InvalidCategoryError):
+            await use_case.autocomplete_categories("  ")
+        with pytest.raises(InvalidCategoryError):
+            await use_case.search_categories("")
+        mock_repository.find_by_name_prefix.assert_not_called()
+        mock_repository.search_by_name.assert_not_called()
@@ -0,0 +1,76 @@
+import json
+from typing import List
+from pydantic import TypeAdapter
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection
+from infrastructure.adapters.inbound.rest.responses import (
+    CATEGORY_BATCH_ADAPTER,
+    CATEGORY_LIST_ADAPTER,
+    category_items,
+    json_response
+)
+from infrastructure.adapters.inbound.rest.schemas.category_schemas import (
+    CategoryBatchResponse,
+    CategoryListItemResponse
+)
+
+
+CATEGORIES = [
+    Category(id=CategoryId("a"), name="Категория", description="Описание"),
+    Category(id=CategoryId("b"), name="Second", description=None)
+]
+
+
+class TestCategoryResponses:
+    """The fast response path must produce exactly what the response models would"""
+    
+    def test_list_body_matches_the_response_model(self):
+        """Test that the list is serialized like List[CategoryListItemResponse]"""
+        # Arrange
+        expected = [
+            CategoryListItemResponse(id=str(category.id), name=category.name, description=category.description)
+            for category in CATEGORIES
+        ]
+        
+        # Act
+        response = json_response(CATEGORY_LIST_ADAPTER, category_items(CATEGORIES))
+        
+        # Assert
+        assert json.loads(response.body) == TypeAdapter(List[CategoryListItemResponse]).dump_python(expected)
+        assert response.media_type == "application/json"
+    
+    def test_projection_leaves_fields_out_like_exclude_unset(self):
+        """Test that projected items contain only id and the requested fields"""
+        # Act
+        response = json_response(
+            CATEGORY_LIST_ADAPTER, category_items(CATEGORIES, ["description"]), {"X-Next-Cursor": "b"}
+        )
+        
+        # Assert
+        assert json.loads(response.body) == [
+            CategoryListItemResponse(id="a", description="Описание").model_dump(exclude_unset=True),
+            CategoryListItemResponse(id="b", description=None).model_dump(exclude_unset=True)
+        ]
+        assert response.headers["X-Next-Cursor"] == "b"
+    
+    def test_batch_body_matches_the_response_model(self):
+        """Test that the batch lookup is serialized like CategoryBatchResponse"""
+        # Arrange
+        content = {"items": category_items(CATEGORIES[:1]), "missing": ["z"]}
+        
+        # Act
+        response = json_response(CATEGORY_BATCH_ADAPTER, content)
+        
+        # Assert
+        assert json.loads(response.body) == CategoryBatchResponse(**content).model_dump()
+    
+    def test_collection_items_match_the_list_items(self):
+        """Test that a CategoryCollection gives the same items as a list of categories, projected or not"""
+        # Arrange
+        collection = CategoryCollection.of(CATEGORIES)
+        
+        # Act / Assert
+        assert category_items(collection) == category_items(CATEGORIES)
+        assert category_items(collection, ["name"]) == category_items(CATEGORIES, ["name"])
+        assert category_items(collection, ["description"]) == category_items(CATEGORIES, ["description"])
@@ -0,0 +1,95 @@
+import random
+import pytest
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.services.category_statistics_engine import CategoryStatisticsEngine
+
+
+class TestCategoryStatisticsEngine:
+    """Unit tests for CategoryStatisticsEngine"""
+    
+    @pytest.fixture
+    def engine(self):
+        return CategoryStatisticsEngine()
+    
+    def test_statistics_match_pure_python(self, engine):
+        """Test that the vectorized statistics equal the pure Python ones, ties and non-ASCII names included"""
+        # Arrange
+        rng = random.Random(7)
+        categories = [
+            Category(id=CategoryId.new(), name="".join(rng.choice("abcё€") for _ in range(rng.randint(1, 40))))
+            for _ in range(1000)
+        ]
+        
+        # Act
+        result = engine.calculate_category_statistics(categories)
+        
+        # Assert
+        names = [category.name for category in categories]
+        assert result == {
+            "total_count": len(names),
+            "average_name_length": sum(map(len, names)) / len(names),
+            "longest_name": max(names, key=len),
+            "shortest_name": min(names, key=len)
+        }
+    
+    def test_ties_go_to_the_first_name(self, engine):
+        """Test that among equally long names the first one is reported, like max()/min()"""
+        # Act
+        result = engine.calculate_statistics(["Toys", "Books", "Games", "Food"])
+        
+        # Assert
+        assert result["longest_name"] == "Books"
+        assert result["shortest_name"] == "Toys"
+    
+    def test_extended_statistics(self, engine):
+        """Test the length range, percentiles and histogram of the extended statistics"""
+        # Arrange
+        names = ["x" * length for length in range(1, 101)]
+        
+        # Act
+        result = engine.calculate_extended_statistics(names)
+        
+        # Assert
+        assert result["total_count"] == 100
+        assert result["average_name_length"] == 50.5
+        assert result["min_name_length"] == 1
+        assert result["max_name_length"] == 100
+        assert result["name_length_percentiles"] == pytest.approx({"p50": 50.5, "p90": 90.1, "p99": 99.01})
+        assert len(result["name_length_histogram"]) == 10
+        assert result["name_length_histogram"][0] == {"min_length": 1, "max_length": 10, "count": 10}
+        assert result["name_length_histogram"][-1] == {"min_length": 91, "max_length": 100, "count": 10}
+    
+    def test_histogram_counts_every_name(self):
+        """Test that uneven ranges keep integer bucket bounds and lose no names"""
+        # Arrange
+        engine = CategoryStatisticsEngine(histogram_buckets=4)
+        names = ["a" * length for length in (3, 3, 4, 9, 12)]
+        
+        # Act
+        histogram = engine.calculate_extended_statistics(names)["name_length_histogram"]
+        
+        # Assert
+        assert histogram == [
+            {"min_length": 3, "max_length": 5, "count": 3},
+            {"min_length": 6, "max_length": 8, "count": 0},
+            {"min_length": 9, "max_length": 11, "count": 1},
+            {"min_length": 12, "max_length": 12, "count": 1}
+        ]
+    
+    def test_empty_input(self, engine):
+        """Test that no categories give zeroed statistics and an empty histogram"""
+        # Act
+        result = engine.calculate_extended_statistics([])
+        
+        # Assert
+        assert result == {
+            "total_count": 0,
+            "average_name_length": 0,
+            "longest_name": "",
+            "shortest_name": "",
+            "min_name_length": 0,
+            "max_name_length": 0,
+            "name_length_percentiles": {"p50": 0.0, "p90": 0.0, "p99": 0.0},
+            "name_length_histogram": []
+        }
@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from infrastructure.adapters.outbound.database.mongodb.category_statistics_repository_impl import (
+    MongoCategoryStatisticsRepository,
+    STATISTICS_PIPELINE
+)
+from infrastructure.adapters.outbound.database.mongodb.query_plan_inspector import FULL_SCAN_COMMENT
+
+
+class TestMongoCategoryStatisticsRepository:
+    """Unit tests for MongoCategoryStatisticsRepository"""
+    
+    @staticmethod
+    def make_repository(results):
+        cursor = Mock()
+        cursor.to_list = AsyncMock(return_value=results)
+        db = Mock()
+        db.categories.aggregate = Mock(return_value=cursor)
+        return MongoCategoryStatisticsRepository(db), db.categories
+    
+    @pytest.mark.asyncio
+    async def test_statistics_come_from_one_aggregation(self):
+        """Test that the single result document is mapped to the statistics format"""
+        # Arrange
+        repository, collection = self.make_repository([{
+            "_id": None,
+            "total_count": 3,
+            "total_length": 24,
+            "shortest": {"length": 5, "id": "b", "name": "Books"},
+            "longest": {"length": -11, "id": "a", "name": "Electronics"}
+        }])
+        
+        # Act
+        result = await repository.compute_statistics()
+        
+        # Assert
+        collection.aggregate.assert_called_once_with(STATISTICS_PIPELINE, comment=FULL_SCAN_COMMENT)
+        assert result == {
+            "total_count": 3,
+            "average_name_length": 8.0,
+            "longest_name": "Electronics",
+            "shortest_name": "Books"
+        }
+    
+    @pytest.mark.asyncio
+    async def test_empty_collection_matches_the_in_memory_statistics(self):
+        """Test that an empty collection gives the same result as CategoryService"""
+        # Arrange
+        repository, _ = self.make_repository([])
+        
+        # Act
+        result = await repository.compute_statistics()
+        
+        # Assert
+        assert result == {"total_count": 0, "average_name_length": 0, "longest_name": "", "shortest_name": ""}
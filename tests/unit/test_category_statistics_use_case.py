@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
 from application.use_cases.category_statistics_use_case import CategoryStatisticsUseCase
@@ -9,13 +9,14 @@ class TestCategoryStatisticsUseCase:
     
     @pytest.fixture
     def mock_read_use_case(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def use_case(self, mock_read_use_case):
         return CategoryStatisticsUseCase(mock_read_use_case)
     
-    def test_get_category_statistics(self, use_case, mock_read_use_case):
+    @pytest.mark.asyncio
+    async def test_get_category_statistics(self, use_case, mock_read_use_case):
         # Arrange
         categories = [
             Category(id=CategoryId.new(), name="Electronics", description="Electronic devices"),
@@ -25,7 +26,7 @@ class TestCategoryStatisticsUseCase:
         mock_read_use_case.get_all_categories.return_value = categories
         
         # Act
-        result = use_case.get_category_statistics()
+        result = await use_case.get_category_statistics()
         
         # Assert
         assert isinstance(result, dict)
@@ -38,4 +39,91 @@ class TestCategoryStatisticsUseCase:
         assert result["shortest_name"] == "Books"
         
         # Verify that get_all_categories was called
-        mock_read_use_case.get_all_categories.assert_called_once()
\ No newline at end of file
+        mock_read_use_case.get_all_categories.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_statistics_come_from_the_store(self, mock_read_use_case):
+        """Test that maintained statistics are returned without loading the categories"""
+        # Arrange
+        statistics = {"total_count": 2, "average_name_length": 4.0, "longest_name": "Toys", "shortest_name": "Toys"}
+        store = AsyncMock()
+        store.get_statistics.return_value = statistics
+        use_case = CategoryStatisticsUseCase(mock_read_use_case, store)
+        
+        # Act
+        result = await use_case.get_category_statistics()
+        
+        # Assert
+        assert result == statistics
+        mock_read_use_case.get_all_categories.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_empty_store_is_rebuilt_from_all_categories(self, mock_read_use_case):
+        """Test that a store without state is rebuilt once and the statistics are computed from the load"""
+        # Arrange
+        categories = [Category(id=CategoryId.new(), name="Books")]
+        store = AsyncMock()
+        store.get_statistics.return_value = None
+        store.rebuild.return_value = categories
+        use_case = CategoryStatisticsUseCase(mock_read_use_case, store)
+        
+        # Act
+        result = await use_case.get_category_statistics()
+        
+        # Assert
+        store.rebuild.assert_awaited_once_with(mock_read_use_case.get_all_categories)
+        assert result["total_count"] == 1
+        assert result["longest_name"] == "Books"
+    
+    @pytest.mark.asyncio
+    async def test_statistics_are_computed_by_the_repository(self, mock_read_use_case):
+        """Test that the statistics repository result is returned without loading the categories"""
+        # Arrange
+        statistics = {"total_count": 2, "average_name_length": 4.5, "longest_name": "Books", "shortest_name": "Toys"}
+        repository = AsyncMock()
+        repository.compute_statistics.return_value = statistics
+        use_case = CategoryStatisticsUseCase(mock_read_use_case, statistics_repository=repository)
+        
+        # Act
+        result = await use_case.get_category_statistics()
+        
+        # Assert
+        assert result == statistics
+        repository.compute_statistics.assert_awaited_once()
+        mock_read_use_case.get_all_categories.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_store_takes_precedence_over_the_repository(self, mock_read_use_case):
+        """Test that maintained statistics are preferred to an aggregation"""
+        # Arrange
+        store = AsyncMock()
+        store.get_statistics.return_value = {"total_count": 0}
+        repository = AsyncMock()
+        use_case = CategoryStatisticsUseCase(mock_read_use_case, store, repository)
+        
+        # Act
+        result = await use_case.get_category_statistics()
+        
+        # Assert
+        assert result == {"total_count": 0}
+        repository.compute_statistics.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_extended_statistics_are_computed_from_all_categories(self, mock_read_use_case):
+        """Test that the extended statistics are computed in memory even when a store is configured"""
+        # Arrange
+        mock_read_use_case.get_all_categories.return_value = [
+            Category(id=CategoryId.new(), name="Books"),
+            Category(id=CategoryId.new(), name="Electronics")
+        ]
+        store = AsyncMock()
+        use_case = CategoryStatisticsUseCase(mock_read_use_case, store)
+        
+        # Act
+        result = await use_case.get_extended_category_statistics()
+        
+        # Assert
+        store.get_statistics.assert_not_called()
+        assert result["total_count"] == 2
+        assert result["name_length_percentiles"]["p50"] == 8.0
+        assert sum(bucket["count"] for bucket in result["name_length_histogram"]) == 2
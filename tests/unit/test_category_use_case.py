@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, AsyncMock
 # Используем абсолютные пути импорта после настройки sys.path в conftest.py
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
@@ -15,17 +15,18 @@ class TestCategoryWriteUseCase:
     
     @pytest.fixture
     def mock_repository(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def mock_event_publisher(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def use_case(self, mock_repository, mock_event_publisher):
         return CategoryWriteUseCase(mock_repository, mock_event_publisher)
     
-    def test_create_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_create_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         name = "Test Category"
         description = "Test Description"
@@ -34,74 +35,76 @@ class TestCategoryWriteUseCase:
         mock_repository.create.return_value = expected_category
         
         # Act
-        result = use_case.create_category(name, description)
+        result = await use_case.create_category(name, description)
         
         # Assert
         assert result.name == name
         assert result.description == description
         mock_repository.create.assert_called_once()
-        mock_event_publisher.publish_category_created.assert_called_once_with(expected_category)
+        mock_event_publisher.publish_category_created.assert_awaited_once_with(expected_category)
     
-    def test_create_category_invalid_name_raises_exception(self, use_case):
+    @pytest.mark.asyncio
+    async def test_create_category_invalid_name_raises_exception(self, use_case):
         # Arrange
         invalid_name = ""
         
         # Act & Assert
         with pytest.raises(InvalidCategoryError):
-            use_case.create_category(invalid_name)
+            await use_case.create_category(invalid_name)
     
-    def test_update_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_update_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
         name = "Updated Name"
         description = "Updated Description"
         
-        existing_category = Category(id=category_id, name="Old Name", description="Old Desc")
         updated_category = Category(id=category_id, name=name, description=description)
-        
-        mock_repository.find_by_id.return_value = existing_category
         mock_repository.update.return_value = updated_category
         
         # Act
-        result = use_case.update_category(category_id, name, description)
+        result = await use_case.update_category(category_id, name, description)
         
         # Assert
         assert result.name == name
         assert result.description == description
-        mock_repository.find_by_id.assert_called_once_with(category_id)
-        mock_repository.update.assert_called_once()
-        mock_event_publisher.publish_category_updated.assert_called_once_with(updated_category)
+        mock_repository.find_by_id.assert_not_called()
+        mock_repository.update.assert_called_once_with(updated_category)
+        mock_event_publisher.publish_category_updated.assert_awaited_once_with(updated_category)
     
-    def test_update_category_not_found_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_update_category_not_found_raises_exception(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        mock_repository.find_by_id.return_value = None
+        mock_repository.update.side_effect = CategoryNotFoundError(f"Category with id {category_id} not found")
         
         # Act & Assert
         with pytest.raises(CategoryNotFoundError):
-            use_case.update_category(category_id, "Name", "Desc")
+            await use_case.update_category(category_id, "Name", "Desc")
+        mock_event_publisher.publish_category_updated.assert_not_called()
     
-    def test_delete_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_delete_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        existing_category = Category(id=category_id, name="Test", description="Test")
-        mock_repository.find_by_id.return_value = existing_category
         mock_repository.delete.return_value = True
         
         # Act
-        result = use_case.delete_category(category_id)
+        result = await use_case.delete_category(category_id)
         
         # Assert
         assert result is True
-        mock_repository.find_by_id.assert_called_once_with(category_id)
+        mock_repository.find_by_id.assert_not_called()
         mock_repository.delete.assert_called_once_with(category_id)
-        mock_event_publisher.publish_category_deleted.assert_called_once_with(category_id)
+        mock_event_publisher.publish_category_deleted.assert_awaited_once_with(category_id)
     
-    def test_delete_category_not_found_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_delete_category_not_found_raises_exception(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        mock_repository.find_by_id.return_value = None
+        mock_repository.delete.return_value = False
         
         # Act & Assert
         with pytest.raises(CategoryNotFoundError):
-            use_case.delete_category(category_id)
\ No newline at end of file
+            await use_case.delete_category(category_id)
+        mock_event_publisher.publish_category_deleted.assert_not_called()
\ No newline at end of file
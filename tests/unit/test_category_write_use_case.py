@@ -1,26 +1,66 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from domain.entities.category import Category
 from domain.value_objects.category_id import CategoryId
-from domain.exceptions.category_exceptions import CategoryNotFoundError, InvalidCategoryError
-from application.use_cases.category_write_use_case import CategoryWriteUseCase
+from domain.exceptions.category_exceptions import CategoryAlreadyExistsError, CategoryNotFoundError, InvalidCategoryError
+from domain.value_objects.bulk_item_result import BulkItemResult, BulkItemStatus
+from application.dtos.create_category_dto import CreateCategoryDTO
+from application.dtos.update_category_dto import UpdateCategoryDTO
+from application.use_cases.category_write_use_case import CategoryWriteUseCase, MAX_BULK_SIZE
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository
+
+
+class CountingCategoryRepository:
+    """In-memory repository with MongoDB write semantics that counts round-trips"""
+    
+    def __init__(self, categories=()):
+        self.documents = {str(category.id): category for category in categories}
+        self.round_trips = 0
+    
+    async def find_by_id(self, category_id):
+        self.round_trips += 1
+        return self.documents.get(str(category_id))
+    
+    async def create(self, category):
+        # insert_one: the unique _id index reports duplicates
+        self.round_trips += 1
+        if category.id is None:
+            category.id = CategoryId.new()
+        if str(category.id) in self.documents:
+            raise CategoryAlreadyExistsError(f"Category with id {category.id} already exists")
+        self.documents[str(category.id)] = category
+        return category
+    
+    async def update(self, category):
+        # replace_one: matched_count == 0 means the category does not exist
+        self.round_trips += 1
+        if str(category.id) not in self.documents:
+            raise CategoryNotFoundError(f"Category with id {category.id} not found")
+        self.documents[str(category.id)] = category
+        return category
+    
+    async def delete(self, category_id):
+        # delete_one: deleted_count == 0 means the category does not exist
+        self.round_trips += 1
+        return self.documents.pop(str(category_id), None) is not None
 
 
 class TestCategoryWriteUseCase:
     
     @pytest.fixture
     def mock_repository(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def mock_event_publisher(self):
-        return Mock()
+        return AsyncMock()
     
     @pytest.fixture
     def use_case(self, mock_repository, mock_event_publisher):
         return CategoryWriteUseCase(mock_repository, mock_event_publisher)
     
-    def test_create_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_create_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         name = "Test Category"
         description = "Test Description"
@@ -29,85 +69,308 @@ class TestCategoryWriteUseCase:
         mock_repository.create.return_value = expected_category
         
         # Act
-        result = use_case.create_category(name, description)
+        result = await use_case.create_category(name, description)
         
         # Assert
         assert result.name == name
         assert result.description == description
         mock_repository.create.assert_called_once()
-        mock_event_publisher.publish_category_created.assert_called_once_with(expected_category)
+        mock_event_publisher.publish_category_created.assert_awaited_once_with(expected_category)
     
-    def test_create_category_invalid_name_raises_exception(self, use_case):
+    @pytest.mark.asyncio
+    async def test_create_category_invalid_name_raises_exception(self, use_case):
         # Arrange
         invalid_name = ""
         
         # Act & Assert
         with pytest.raises(InvalidCategoryError):
-            use_case.create_category(invalid_name)
+            await use_case.create_category(invalid_name)
     
-    def test_update_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_update_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
         name = "Updated Name"
         description = "Updated Description"
         
-        existing_category = Category(id=category_id, name="Old Name", description="Old Desc")
         updated_category = Category(id=category_id, name=name, description=description)
-        
-        mock_repository.find_by_id.return_value = existing_category
         mock_repository.update.return_value = updated_category
         
         # Act
-        result = use_case.update_category(category_id, name, description)
+        result = await use_case.update_category(category_id, name, description)
         
         # Assert
         assert result.name == name
         assert result.description == description
-        mock_repository.find_by_id.assert_called_once_with(category_id)
-        mock_repository.update.assert_called_once()
-        mock_event_publisher.publish_category_updated.assert_called_once_with(updated_category)
+        mock_repository.find_by_id.assert_not_called()
+        mock_repository.update.assert_called_once_with(updated_category)
+        mock_event_publisher.publish_category_updated.assert_awaited_once_with(updated_category)
     
-    def test_update_category_not_found_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_update_category_not_found_raises_exception(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        mock_repository.find_by_id.return_value = None
+        mock_repository.update.side_effect = CategoryNotFoundError(f"Category with id {category_id} not found")
         
         # Act & Assert
         with pytest.raises(CategoryNotFoundError):
-            use_case.update_category(category_id, "Name", "Desc")
+            await use_case.update_category(category_id, "Name", "Desc")
+        mock_event_publisher.publish_category_updated.assert_not_called()
     
-    def test_update_category_invalid_name_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_update_category_invalid_name_raises_exception(self, use_case, mock_repository):
         # Arrange
         category_id = CategoryId.new()
-        existing_category = Category(id=category_id, name="Old Name", description="Old Desc")
-        mock_repository.find_by_id.return_value = existing_category
         invalid_name = ""
         
         # Act & Assert
         with pytest.raises(InvalidCategoryError):
-            use_case.update_category(category_id, invalid_name)
+            await use_case.update_category(category_id, invalid_name)
+        mock_repository.update.assert_not_called()
     
-    def test_delete_category_success(self, use_case, mock_repository, mock_event_publisher):
+    @pytest.mark.asyncio
+    async def test_delete_category_success(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        existing_category = Category(id=category_id, name="Test", description="Test")
-        mock_repository.find_by_id.return_value = existing_category
         mock_repository.delete.return_value = True
         
         # Act
-        result = use_case.delete_category(category_id)
+        result = await use_case.delete_category(category_id)
         
         # Assert
         assert result is True
-        mock_repository.find_by_id.assert_called_once_with(category_id)
+        mock_repository.find_by_id.assert_not_called()
         mock_repository.delete.assert_called_once_with(category_id)
-        mock_event_publisher.publish_category_deleted.assert_called_once_with(category_id)
+        mock_event_publisher.publish_category_deleted.assert_awaited_once_with(category_id)
     
-    def test_delete_category_not_found_raises_exception(self, use_case, mock_repository):
+    @pytest.mark.asyncio
+    async def test_delete_category_not_found_raises_exception(self, use_case, mock_repository, mock_event_publisher):
         # Arrange
         category_id = CategoryId.new()
-        mock_repository.find_by_id.return_value = None
+        mock_repository.delete.return_value = False
         
         # Act & Assert
         with pytest.raises(CategoryNotFoundError):
-            use_case.delete_category(category_id)
\ No newline at end of file
+            await use_case.delete_category(category_id)
+        mock_event_publisher.publish_category_deleted.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_categories_stores_valid_items_in_one_call(self, use_case, mock_repository, mock_event_publisher):
+        # Arrange
+        items = [
+            CreateCategoryDTO(name="First"),
+            CreateCategoryDTO(name=""),
+            CreateCategoryDTO(name="Third", description="Desc")
+        ]
+        mock_repository.create_many.return_value = [
+            BulkItemResult(0, CategoryId("first-id"), BulkItemStatus.CREATED),
+            BulkItemResult(1, CategoryId("third-id"), BulkItemStatus.CONFLICT, "already exists")
+        ]
+        
+        # Act
+        results = await use_case.create_categories(items)
+        
+        # Assert
+        stored = mock_repository.create_many.call_args.args[0]
+        assert [category.name for category in stored] == ["First", "Third"]
+        assert [(result.index, result.status) for result in results] == [
+            (0, BulkItemStatus.CREATED),
+            (1, BulkItemStatus.INVALID),
+            (2, BulkItemStatus.CONFLICT)
+        ]
+        mock_event_publisher.publish_categories_created.assert_awaited_once_with([
+            Category(id=CategoryId("first-id"), name="First", description=None)
+        ])
+        mock_event_publisher.publish_category_created.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_upsert_categories_publishes_created_and_updated_batches(self, use_case, mock_repository, mock_event_publisher):
+        # Arrange
+        items = [
+            UpdateCategoryDTO(id=CategoryId("new-id"), name="New"),
+            UpdateCategoryDTO(id=CategoryId("old-id"), name="Old")
+        ]
+        mock_repository.upsert_many.return_value = [
+            BulkItemResult(0, CategoryId("new-id"), BulkItemStatus.CREATED),
+            BulkItemResult(1, CategoryId("old-id"), BulkItemStatus.UPDATED)
+        ]
+        
+        # Act
+        results = await use_case.upsert_categories(items)
+        
+        # Assert
+        assert all(result.succeeded for result in results)
+        mock_event_publisher.publish_categories_created.assert_awaited_once_with([
+            Category(id=CategoryId("new-id"), name="New")
+        ])
+        mock_event_publisher.publish_categories_updated.assert_awaited_once_with([
+            Category(id=CategoryId("old-id"), name="Old")
+        ])
+    
+    @pytest.mark.asyncio
+    async def test_delete_categories_publishes_only_deleted_ids(self, use_case, mock_repository, mock_event_publisher):
+        # Arrange
+        category_ids = [CategoryId("gone-id"), CategoryId("missing-id")]
+        mock_repository.delete_many.return_value = [
+            BulkItemResult(0, CategoryId("gone-id"), BulkItemStatus.DELETED),
+            BulkItemResult(1, CategoryId("missing-id"), BulkItemStatus.NOT_FOUND)
+        ]
+        
+        # Act
+        results = await use_case.delete_categories(category_ids)
+        
+        # Assert
+        mock_repository.delete_many.assert_called_once_with(category_ids)
+        assert [result.status for result in results] == [BulkItemStatus.DELETED, BulkItemStatus.NOT_FOUND]
+        mock_event_publisher.publish_categories_deleted.assert_awaited_once_with([CategoryId("gone-id")])
+    
+    @pytest.mark.asyncio
+    async def test_delete_categories_publishes_repeated_id_once(self, use_case, mock_repository, mock_event_publisher):
+        """Test that a category whose id appears twice in the request yields one event"""
+        # Arrange
+        mock_repository.delete_many.return_value = [
+            BulkItemResult(0, CategoryId("gone-id"), BulkItemStatus.DELETED),
+            BulkItemResult(1, CategoryId("gone-id"), BulkItemStatus.DELETED)
+        ]
+        
+        # Act
+        await use_case.delete_categories([CategoryId("gone-id"), CategoryId("gone-id")])
+        
+        # Assert
+        mock_event_publisher.publish_categories_deleted.assert_awaited_once_with([CategoryId("gone-id")])
+    
+    @pytest.mark.asyncio
+    async def test_create_categories_rejects_oversized_batch(self, use_case, mock_repository):
+        # Arrange
+        items = [CreateCategoryDTO(name="Category")] * (MAX_BULK_SIZE + 1)
+        
+        # Act & Assert
+        with pytest.raises(InvalidCategoryError):
+            await use_case.create_categories(items)
+        mock_repository.create_many.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_without_publisher_events_are_left_to_the_outbox(self, mock_repository):
+        """Test that writes succeed without an inline publisher (the repository records the events)"""
+        # Arrange
+        use_case = CategoryWriteUseCase(mock_repository)
+        mock_repository.create.return_value = Category(id=CategoryId("test-id"), name="Test")
+        mock_repository.delete_many.return_value = [BulkItemResult(0, CategoryId("test-id"), BulkItemStatus.DELETED)]
+        
+        # Act
+        created = await use_case.create_category("Test")
+        results = await use_case.delete_categories([CategoryId("test-id")])
+        
+        # Assert
+        assert created.id == CategoryId("test-id")
+        assert results[0].succeeded
+
+
+class TestCategoryWriteStatistics:
+    """Every successful write is applied to the statistics store"""
+    
+    @pytest.fixture
+    def repository(self):
+        return AsyncMock()
+    
+    @pytest.fixture
+    def statistics_store(self):
+        return AsyncMock()
+    
+    @pytest.fixture
+    def use_case(self, repository, statistics_store):
+        return CategoryWriteUseCase(repository, AsyncMock(), statistics_store)
+    
+    @pytest.mark.asyncio
+    async def test_update_records_the_saved_category(self, use_case, repository, statistics_store):
+        """Test that an update is applied with the stored category"""
+        # Arrange
+        saved = Category(id=CategoryId("test-id"), name="Renamed")
+        repository.update.return_value = saved
+        
+        # Act
+        await use_case.update_category(CategoryId("test-id"), "Renamed")
+        
+        # Assert
+        statistics_store.record_saved.assert_awaited_once_with([saved])
+    
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_recorded(self, use_case, repository, statistics_store):
+        """Test that a write the repository rejected does not touch the statistics"""
+        # Arrange
+        repository.delete.return_value = False
+        
+        # Act
+        with pytest.raises(CategoryNotFoundError):
+            await use_case.delete_category(CategoryId("missing-id"))
+        
+        # Assert
+        statistics_store.record_deleted.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_delete_records_only_deleted_ids(self, use_case, repository, statistics_store):
+        """Test that only the ids that existed are applied"""
+        # Arrange
+        repository.delete_many.return_value = [
+            BulkItemResult(0, CategoryId("gone-id"), BulkItemStatus.DELETED),
+            BulkItemResult(1, CategoryId("missing-id"), BulkItemStatus.NOT_FOUND)
+        ]
+        
+        # Act
+        await use_case.delete_categories([CategoryId("gone-id"), CategoryId("missing-id")])
+        
+        # Assert
+        statistics_store.record_deleted.assert_awaited_once_with([CategoryId("gone-id")])
+
+
+class TestCategoryWriteRoundTrips:
+    """Each single-item write costs exactly one repository round-trip"""
+    
+    @pytest.fixture
+    def repository(self):
+        return CountingCategoryRepository([Category(id=CategoryId("existing-id"), name="Existing")])
+    
+    @pytest.fixture
+    def use_case(self, repository):
+        # Through the cache decorator, as wired in production
+        return CategoryWriteUseCase(CachedCategoryRepository(repository, AsyncMock()), AsyncMock())
+    
+    @pytest.mark.asyncio
+    async def test_update_costs_one_round_trip(self, use_case, repository):
+        # Act
+        await use_case.update_category(CategoryId("existing-id"), "Renamed")
+        
+        # Assert
+        assert repository.round_trips == 1
+        assert repository.documents["existing-id"].name == "Renamed"
+    
+    @pytest.mark.asyncio
+    async def test_update_missing_category_costs_one_round_trip(self, use_case, repository):
+        # Act & Assert
+        with pytest.raises(CategoryNotFoundError):
+            await use_case.update_category(CategoryId("missing-id"), "Renamed")
+        assert repository.round_trips == 1
+    
+    @pytest.mark.asyncio
+    async def test_delete_costs_one_round_trip(self, use_case, repository):
+        # Act
+        result = await use_case.delete_category(CategoryId("existing-id"))
+        
+        # Assert
+        assert result is True
+        assert repository.round_trips == 1
+    
+    @pytest.mark.asyncio
+    async def test_delete_missing_category_costs_one_round_trip(self, use_case, repository):
+        # Act & Assert
+        with pytest.raises(CategoryNotFoundError):
+            await use_case.delete_category(CategoryId("missing-id"))
+        assert repository.round_trips == 1
+    
+    @pytest.mark.asyncio
+    async def test_create_costs_one_round_trip(self, use_case, repository):
+        # Act
+        await use_case.create_category("New")
+        
+        # Assert
+        assert repository.round_trips == 1
\ No newline at end of file
@@ -0,0 +1,47 @@
+import pytest
+from infrastructure.serialization.codecs import JsonCodec, MsgpackCodec, OrjsonCodec, decode_value, get_codec
+
+
+VALUE = {"id": "test-id", "name": "Тест", "description": None, "items": [1, 2.5, True]}
+
+
+class TestCodecs:
+    """Unit tests for the cache/event codecs"""
+    
+    @pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec(), MsgpackCodec()])
+    def test_encoded_value_round_trips_through_its_header(self, codec):
+        """Test that every codec's output is decoded by the header-dispatching decoder"""
+        # Act
+        encoded = codec.encode(VALUE)
+        
+        # Assert
+        assert encoded.startswith(codec.header)
+        assert decode_value(encoded) == VALUE
+        assert codec.loads(codec.dumps(VALUE)) == VALUE
+    
+    @pytest.mark.parametrize("legacy", ['{"id": "test-id"}', b'{"id": "test-id"}'])
+    def test_header_less_values_are_read_as_json(self, legacy):
+        """Test that values written before codecs existed stay readable"""
+        # Act & Assert
+        assert decode_value(legacy) == {"id": "test-id"}
+    
+    def test_msgpack_is_smaller_than_json(self):
+        """Test that the binary codec produces a more compact payload"""
+        # Arrange
+        snapshot = [{"id": f"id-{index}", "name": f"Category {index}", "description": None} for index in range(100)]
+        
+        # Act & Assert
+        assert len(MsgpackCodec().encode(snapshot)) < len(JsonCodec().encode(snapshot))
+    
+    def test_unknown_header_is_rejected(self):
+        """Test that a value of an unknown codec version raises instead of returning garbage"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            decode_value(b"\xffj\x09{}")
+    
+    def test_get_codec_by_name(self):
+        """Test that codecs are looked up by their settings name"""
+        # Act & Assert
+        assert isinstance(get_codec("msgpack"), MsgpackCodec)
+        with pytest.raises(ValueError):
+            get_codec("xml")
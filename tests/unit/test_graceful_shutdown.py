@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from infrastructure.config.settings import Settings
+from infrastructure.lifecycle.in_flight import InFlightMiddleware, InFlightRequests
+from infrastructure.lifecycle.readiness import ReadinessProbe
+from infrastructure.lifecycle.shutdown import shut_down
+
+
+class StubContainer:
+    """Dishka container stand-in recording whether it was closed"""
+    
+    def __init__(self, readiness: ReadinessProbe):
+        self.readiness = readiness
+        self.closed = False
+    
+    async def get(self, dependency_type):
+        return self.readiness
+    
+    async def close(self):
+        self.closed = True
+
+
+class TestInFlightRequests:
+    """Unit tests for InFlightRequests and InFlightMiddleware"""
+    
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_requests_to_finish(self):
+        """Test that drain returns once the last in-flight request has finished"""
+        # Arrange
+        in_flight = InFlightRequests()
+        release = asyncio.Event()
+        
+        async def slow_app(scope, receive, send):
+            await release.wait()
+        
+        middleware = InFlightMiddleware(slow_app, in_flight)
+        request = asyncio.create_task(middleware({"type": "http"}, None, None))
+        await asyncio.sleep(0)
+        
+        # Act
+        drain = asyncio.create_task(in_flight.drain(timeout=1.0))
+        await asyncio.sleep(0.01)
+        pending_while_busy = not drain.done()
+        release.set()
+        drained = await drain
+        await request
+        
+        # Assert
+        assert pending_while_busy
+        assert drained is True
+        assert in_flight.count == 0
+    
+    @pytest.mark.asyncio
+    async def test_drain_gives_up_after_timeout(self):
+        """Test that drain reports failure when a request outlives the deadline"""
+        # Arrange
+        in_flight = InFlightRequests()
+        in_flight.enter()
+        
+        # Act
+        drained = await in_flight.drain(timeout=0.01)
+        
+        # Assert
+        assert drained is False
+        assert in_flight.count == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_request_is_not_counted_forever(self):
+        """Test that a request raising an error still leaves the count"""
+        # Arrange
+        in_flight = InFlightRequests()
+        
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
+        
+        middleware = InFlightMiddleware(failing_app, in_flight)
+        
+        # Act
+        with pytest.raises(RuntimeError):
+            await middleware({"type": "http"}, None, None)
+        
+        # Assert
+        assert in_flight.count == 0
+        assert await in_flight.drain(timeout=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_messages_are_not_counted(self):
+        """Test that only HTTP requests are counted"""
+        # Arrange
+        in_flight = InFlightRequests()
+        seen = []
+        
+        async def app(scope, receive, send):
+            seen.append(in_flight.count)
+        
+        # Act
+        await InFlightMiddleware(app, in_flight)({"type": "lifespan"}, None, None)
+        
+        # Assert
+        assert seen == [0]
+
+
+class TestShutDown:
+    """Unit tests for the shutdown sequence"""
+    
+    @pytest.mark.asyncio
+    async def test_leaves_rotation_before_draining_and_closes_after(self):
+        """Test that the worker is not ready while requests drain and the container closes last"""
+        # Arrange
+        readiness = ReadinessProbe({})
+        readiness.mark_ready()
+        container = StubContainer(readiness)
+        in_flight = InFlightRequests()
+        in_flight.enter()
+        settings = Settings(shutdown_drain_timeout=1.0)
+        
+        # Act
+        shutdown = asyncio.create_task(shut_down(container, settings, in_flight))
+        await asyncio.sleep(0.01)
+        accepting_while_draining = readiness.accepting
+        closed_while_draining = container.closed
+        in_flight.exit()
+        await shutdown
+        
+        # Assert
+        assert accepting_while_draining is False
+        assert closed_while_draining is False
+        assert container.closed
+    
+    @pytest.mark.asyncio
+    async def test_closes_container_when_drain_times_out(self):
+        """Test that a stuck request does not keep the worker from closing its pools"""
+        # Arrange
+        container = StubContainer(ReadinessProbe({}))
+        in_flight = InFlightRequests()
+        in_flight.enter()
+        settings = Settings(shutdown_drain_timeout=0.01)
+        
+        # Act
+        await shut_down(container, settings, in_flight)
+        
+        # Assert
+        assert container.closed
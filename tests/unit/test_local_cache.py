@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import patch
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache
+
+
+class TestLocalCache:
+    """Unit tests for LocalCache"""
+    
+    @pytest.fixture
+    def cache(self):
+        return LocalCache(max_size=2, ttl=10.0)
+    
+    def test_get_counts_hits_and_misses(self, cache):
+        """Test that lookups update the hit/miss counters"""
+        # Arrange
+        cache.set("a", {"id": "a"})
+        
+        # Act
+        hit = cache.get("a")
+        miss = cache.get("b")
+        
+        # Assert
+        assert hit == {"id": "a"}
+        assert miss is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+    
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        """Test that the cache stays bounded and evicts the LRU entry"""
+        # Arrange
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        
+        # Act
+        cache.set("c", 3)
+        
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+    
+    def test_expired_entry_is_a_miss(self, cache):
+        """Test that entries are dropped once their TTL has passed"""
+        # Arrange
+        with patch("infrastructure.adapters.outbound.cache.local_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=5)
+        
+        # Act
+        with patch("infrastructure.adapters.outbound.cache.local_cache.time.monotonic", return_value=106.0):
+            result = cache.get("a")
+        
+        # Assert
+        assert result is None
+        assert cache.stats()["expirations"] == 1
+    
+    def test_ttl_is_capped_by_local_ttl(self, cache):
+        """Test that a long L2 expiry does not extend the local TTL"""
+        # Arrange
+        with patch("infrastructure.adapters.outbound.cache.local_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=300)
+        
+        # Act
+        with patch("infrastructure.adapters.outbound.cache.local_cache.time.monotonic", return_value=111.0):
+            result = cache.get("a")
+        
+        # Assert
+        assert result is None
@@ -0,0 +1,98 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from pymongo.errors import BulkWriteError
+from domain.entities.category import Category
+from domain.value_objects.bulk_item_result import BulkItemStatus
+from domain.value_objects.category_id import CategoryId
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+
+
+class TestMongoCategoryRepository:
+    """Unit tests for MongoCategoryRepository"""
+    
+    @pytest.fixture
+    def repository(self):
+        # The client connects lazily: nothing is sent as long as the collection is replaced
+        repository = MongoCategoryRepository("mongodb://localhost:27017", "unit_tests")
+        repository.collection = AsyncMock()
+        yield repository
+        repository.close()
+    
+    @staticmethod
+    def _stored(ids):
+        """Replace collection.find with a cursor over documents with these ids"""
+        async def cursor():
+            for category_id in ids:
+                yield {"_id": category_id}
+        
+        return MagicMock(side_effect=lambda *args, **kwargs: cursor())
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_sends_one_lookup_and_one_delete_per_batch(self, repository):
+        """Test that a batch of 1000 ids costs one lookup and one delete, whatever its size"""
+        # Arrange
+        ids = [f"id-{number}" for number in range(1000)]
+        repository.collection.find = self._stored(ids[:600])
+        repository.collection.delete_many.return_value = SimpleNamespace(deleted_count=600)
+        
+        # Act
+        results = await repository.delete_many([CategoryId(category_id) for category_id in ids])
+        
+        # Assert
+        assert repository.collection.find.call_count == 1
+        repository.collection.delete_many.assert_awaited_once_with({"_id": {"$in": ids[:600]}}, session=None)
+        repository.collection.delete_one.assert_not_called()
+        assert [result.status for result in results] == (
+            [BulkItemStatus.DELETED] * 600 + [BulkItemStatus.NOT_FOUND] * 400
+        )
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_reports_nothing_deleted_when_another_request_deleted_everything(self, repository):
+        """Test that ids another request deleted between the lookup and the delete are not found"""
+        # Arrange
+        repository.collection.find = self._stored(["a", "b"])
+        repository.collection.delete_many.return_value = SimpleNamespace(deleted_count=0)
+        
+        # Act
+        results = await repository.delete_many([CategoryId("a"), CategoryId("b")])
+        
+        # Assert
+        assert [result.status for result in results] == [BulkItemStatus.NOT_FOUND, BulkItemStatus.NOT_FOUND]
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_deletes_a_repeated_id_once(self, repository):
+        """Test that only the first occurrence of a repeated id is reported as deleted"""
+        # Arrange
+        repository.collection.find = self._stored(["a"])
+        repository.collection.delete_many.return_value = SimpleNamespace(deleted_count=1)
+        
+        # Act
+        results = await repository.delete_many([CategoryId("a"), CategoryId("a")])
+        
+        # Assert
+        repository.collection.delete_many.assert_awaited_once_with({"_id": {"$in": ["a"]}}, session=None)
+        assert [result.status for result in results] == [BulkItemStatus.DELETED, BulkItemStatus.NOT_FOUND]
+        assert [result.index for result in results] == [0, 1]
+    
+    @pytest.mark.asyncio
+    async def test_create_many_with_outbox_reports_an_id_taken_after_the_lookup(self, repository):
+        """Test that an id inserted concurrently after the conflict lookup yields per-item results"""
+        # Arrange
+        repository.outbox_enabled = True
+        repository.collection.find = self._stored(["a"])
+        repository._write = AsyncMock(side_effect=[
+            BulkWriteError({"writeErrors": [{"index": 0, "code": 11000}]}),
+            # "b" was inserted by another request between the lookup and the second transaction
+            BulkWriteError({"writeErrors": [{"index": 0, "code": 11000}]}),
+        ])
+        categories = [Category(CategoryId(category_id), f"Name {category_id}") for category_id in ("a", "b", "c")]
+        
+        # Act
+        results = await repository.create_many(categories)
+        
+        # Assert
+        assert [result.status for result in results] == [
+            BulkItemStatus.CONFLICT, BulkItemStatus.CONFLICT, BulkItemStatus.FAILED
+        ]
+        assert results[2].error == "Batch rolled back"
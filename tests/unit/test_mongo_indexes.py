@@ -0,0 +1,76 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from infrastructure.adapters.outbound.database.mongodb.indexes import (
+    INDEXES,
+    INDEX_OPTIONS_CONFLICT,
+    apply_indexes
+)
+
+
+class TestApplyIndexes:
+    """Unit tests for the index registry"""
+    
+    @staticmethod
+    def make_db():
+        collection = AsyncMock()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        return db, collection
+    
+    def test_registry_declares_name_indexes(self):
+        """Test that the name queries have their indexes declared"""
+        # Act
+        names = [model.document["name"] for model in INDEXES["categories"]]
+        
+        # Assert
+        assert names == ["name_prefix", "name_text"]
+    
+    @pytest.mark.asyncio
+    async def test_creates_every_registered_index(self):
+        """Test that each registered index is created in its collection"""
+        # Arrange
+        db, collection = self.make_db()
+        first = IndexModel([("a", ASCENDING)], name="a")
+        second = IndexModel([("b", ASCENDING)], name="b")
+        
+        # Act
+        await apply_indexes(db, {"items": [first, second]})
+        
+        # Assert
+        db.__getitem__.assert_called_with("items")
+        assert [call.args[0] for call in collection.create_indexes.await_args_list] == [[first], [second]]
+        collection.drop_index.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_rebuilds_index_with_changed_definition(self):
+        """Test that an index conflicting with its definition is dropped and created again"""
+        # Arrange
+        db, collection = self.make_db()
+        model = IndexModel([("name", ASCENDING), ("_id", ASCENDING)], name="name_prefix")
+        collection.create_indexes.side_effect = [OperationFailure("conflict", code=INDEX_OPTIONS_CONFLICT), ["name_prefix"]]
+        collection.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "old_name": {"key": [("name", 1), ("_id", 1)]},
+            "other": {"key": [("description", 1)]}
+        }
+        
+        # Act
+        await apply_indexes(db, {"categories": [model]})
+        
+        # Assert
+        collection.drop_index.assert_awaited_once_with("old_name")
+        assert collection.create_indexes.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self):
+        """Test that failures other than a definition conflict are not swallowed"""
+        # Arrange
+        db, collection = self.make_db()
+        collection.create_indexes.side_effect = OperationFailure("not authorized", code=13)
+        
+        # Act & Assert
+        with pytest.raises(OperationFailure):
+            await apply_indexes(db, {"categories": [IndexModel([("a", ASCENDING)], name="a")]})
+        collection.drop_index.assert_not_called()
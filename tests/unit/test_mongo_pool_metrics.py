@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+from pymongo import monitoring
+from infrastructure.adapters.outbound.database.mongodb.pool_metrics import MongoPoolMetrics
+
+
+class TestMongoPoolMetrics:
+    """Unit tests for MongoPoolMetrics"""
+    
+    def test_pool_events_update_utilization(self):
+        """Test that connection and checkout events are reflected in the stats"""
+        # Arrange
+        metrics = MongoPoolMetrics(max_pool_size=10)
+        event = Mock()
+        
+        # Act
+        for _ in range(3):
+            metrics.connection_created(event)
+            metrics.connection_check_out_started(event)
+            metrics.connection_checked_out(event)
+        metrics.connection_checked_in(event)
+        metrics.connection_check_out_started(event)
+        metrics.connection_closed(event)
+        
+        # Assert
+        stats = metrics.stats()
+        assert stats["max_size"] == 10
+        assert stats["open"] == 2
+        assert stats["in_use"] == 2
+        assert stats["waiting"] == 1
+        assert stats["checkouts"] == 3
+    
+    def test_checkout_timeouts_are_counted_apart_from_other_failures(self):
+        """Test that a checkout that waited too long is reported as a timeout"""
+        # Arrange
+        metrics = MongoPoolMetrics()
+        
+        # Act
+        for reason in (monitoring.ConnectionCheckOutFailedReason.TIMEOUT,
+                       monitoring.ConnectionCheckOutFailedReason.CONN_ERROR):
+            metrics.connection_check_out_started(Mock())
+            metrics.connection_check_out_failed(Mock(reason=reason))
+        
+        # Assert
+        stats = metrics.stats()
+        assert stats["checkout_timeouts"] == 1
+        assert stats["checkout_failures"] == 1
+        assert stats["waiting"] == 0
@@ -0,0 +1,74 @@
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from domain.value_objects.category_collection import CategoryCollection
+from infrastructure.adapters.outbound.cache.name_prefix_index import NamePrefixIndex
+
+
+def _category(category_id: str, name: str, description=None) -> Category:
+    return Category(id=CategoryId(category_id), name=name, description=description)
+
+
+class TestNamePrefixIndex:
+    """Unit tests for NamePrefixIndex"""
+    
+    def test_search_matches_prefix_case_insensitively_in_name_order(self):
+        """Test that search returns names starting with the prefix, ordered by name then id"""
+        # Arrange
+        index = NamePrefixIndex()
+        index.rebuild([
+            _category("3", "Cars"),
+            _category("2", "books"),
+            _category("1", "Bikes", "Two wheels"),
+            _category("4", "Books")
+        ], version=1)
+        
+        # Act
+        result = index.search("B", 10)
+        
+        # Assert
+        assert [(str(category.id), category.name) for category in result] == [
+            ("1", "Bikes"), ("2", "books"), ("4", "Books")
+        ]
+        assert result[0].description == "Two wheels"
+        assert index.version == 1
+    
+    def test_search_stops_at_limit_and_at_first_non_match(self):
+        """Test that search reads at most limit entries and nothing past the prefix range"""
+        # Arrange
+        index = NamePrefixIndex()
+        index.rebuild(CategoryCollection.from_rows(
+            (str(number), f"Item {number:02d}", None) for number in range(20)
+        ), version=1)
+        
+        # Act & Assert
+        assert [category.name for category in index.search("item 1", 3)] == ["Item 10", "Item 11", "Item 12"]
+        assert index.search("items", 10) == []
+        assert index.search("zzz", 10) == []
+    
+    def test_put_replaces_previous_name_and_remove_drops_entry(self):
+        """Test that single changes are applied in place"""
+        # Arrange
+        index = NamePrefixIndex()
+        index.rebuild([_category("1", "Books"), _category("2", "Boats")], version=1)
+        
+        # Act
+        index.put(_category("1", "Cars"))
+        index.remove("2")
+        index.remove("missing")
+        
+        # Assert
+        assert index.search("bo", 10) == []
+        assert index.search("car", 10) == [_category("1", "Cars")]
+        assert len(index) == 1
+    
+    def test_search_returns_copies(self):
+        """Test that changing a returned category does not change the index"""
+        # Arrange
+        index = NamePrefixIndex()
+        index.rebuild([_category("1", "Books")], version=1)
+        
+        # Act
+        index.search("b", 1)[0].name = "Changed"
+        
+        # Assert
+        assert index.search("b", 1)[0].name == "Books"
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+from domain.events.category_events import CategoryCreated, CategoryDeleted
+from domain.value_objects.category_id import CategoryId
+from infrastructure.adapters.outbound.database.mongodb.outbox_store import OutboxRecord
+from infrastructure.adapters.outbound.message_bus.outbox_relay import OutboxRelay
+from infrastructure.mappers.event_mappers import event_to_message, message_to_event
+
+
+class InMemoryOutboxStore:
+    """MongoOutboxStore stand-in backed by a list"""
+    
+    def __init__(self, events=(), checkpoint=()):
+        self.records = [OutboxRecord(index, event) for index, event in enumerate(events)]
+        self.checkpoint = list(checkpoint)
+        self.lease_owner = None
+    
+    async def fetch_pending(self, limit):
+        return self.records[:limit]
+    
+    async def acknowledge(self, record_ids):
+        acknowledged = set(record_ids)
+        self.records = [record for record in self.records if record.record_id not in acknowledged]
+    
+    async def load_checkpoint(self):
+        return self.checkpoint
+    
+    async def save_checkpoint(self, event_ids):
+        self.checkpoint = list(event_ids)
+    
+    async def acquire_lease(self, owner, ttl):
+        if self.lease_owner in (None, owner):
+            self.lease_owner = owner
+            return True
+        return False
+    
+    async def release_lease(self, owner):
+        if self.lease_owner == owner:
+            self.lease_owner = None
+
+
+def make_events(count):
+    return [CategoryCreated(CategoryId(f"id-{index}"), f"Category {index}", None) for index in range(count)]
+
+
+class TestOutboxRelay:
+    """Unit tests for OutboxRelay"""
+    
+    @pytest.fixture
+    def publisher(self):
+        return AsyncMock()
+    
+    @pytest.mark.asyncio
+    async def test_relay_once_publishes_a_batch_and_acknowledges_it(self, publisher):
+        """Test that one round hands batch_size events over in one call, then checkpoints and deletes them"""
+        # Arrange
+        events = make_events(5)
+        store = InMemoryOutboxStore(events)
+        relay = OutboxRelay(store, publisher, batch_size=3)
+        
+        # Act
+        relayed = await relay.relay_once()
+        
+        # Assert
+        assert relayed == 3
+        publisher.publish_events.assert_awaited_once_with(events[:3])
+        publisher.flush.assert_awaited_once()
+        assert store.checkpoint == [event.event_id for event in events[:3]]
+        assert [record.event for record in store.records] == events[3:]
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_records_and_does_not_publish_twice(self, publisher):
+        """Test that unconfirmed records stay in the outbox and are not handed over again"""
+        # Arrange
+        events = make_events(2)
+        store = InMemoryOutboxStore(events)
+        relay = OutboxRelay(store, publisher)
+        publisher.flush.side_effect = [ConnectionError("broker went away"), None]
+        
+        # Act
+        with pytest.raises(ConnectionError):
+            await relay.relay_once()
+        remaining = len(store.records)
+        await relay.relay_once()
+        
+        # Assert
+        assert remaining == 2
+        publisher.publish_events.assert_awaited_once_with(events)
+        assert store.records == []
+    
+    @pytest.mark.asyncio
+    async def test_events_in_the_checkpoint_are_not_published_again(self, publisher):
+        """Test that after a restart the last relayed batch is acknowledged without republishing"""
+        # Arrange
+        events = make_events(3)
+        store = InMemoryOutboxStore(events, checkpoint=[events[0].event_id, events[1].event_id])
+        relay = OutboxRelay(store, publisher, poll_interval=0.01)
+        
+        # Act
+        relay.start()
+        await asyncio.sleep(0.05)
+        await relay.stop()
+        
+        # Assert
+        publisher.publish_events.assert_awaited_once_with([events[2]])
+        assert store.records == []
+        assert relay.stats()["duplicates_skipped"] == 2
+        assert store.lease_owner is None
+    
+    @pytest.mark.asyncio
+    async def test_relay_without_the_lease_stays_idle(self, publisher):
+        """Test that only the lease holder drains the outbox"""
+        # Arrange
+        store = InMemoryOutboxStore(make_events(1))
+        store.lease_owner = "another-worker"
+        relay = OutboxRelay(store, publisher, poll_interval=0.01)
+        
+        # Act
+        relay.start()
+        await asyncio.sleep(0.05)
+        await relay.stop()
+        
+        # Assert
+        publisher.publish_events.assert_not_called()
+        assert len(store.records) == 1
+        assert store.lease_owner == "another-worker"
+
+
+class TestEventMappers:
+    """Unit tests for the event wire format shared by the outbox and the broker"""
+    
+    @pytest.mark.parametrize("event", [
+        CategoryCreated(CategoryId("test-id"), "Test", "Description"),
+        CategoryDeleted(CategoryId("test-id"))
+    ])
+    def test_message_round_trip_keeps_the_event_id(self, event):
+        """Test that an event survives being stored as JSON and read back"""
+        # Act
+        result = message_to_event(json.loads(json.dumps(event_to_message(event))))
+        
+        # Assert
+        assert result == event
@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from infrastructure.adapters.outbound.database.mongodb.query_plan_inspector import (
+    FULL_SCAN_COMMENT,
+    QueryPlanInspector,
+    has_collection_scan
+)
+
+
+def _started(command_name: str, command: dict) -> Mock:
+    return Mock(command_name=command_name, database_name="category_service", command=command)
+
+
+class TestQueryPlanInspector:
+    """Unit tests for QueryPlanInspector"""
+    
+    def test_collection_scan_in_winning_plan_is_found(self):
+        """Test that a COLLSCAN nested in the winning plan is reported and one in a rejected plan is not"""
+        # Arrange
+        collection_scan = {"queryPlanner": {
+            "winningPlan": {"stage": "LIMIT", "inputStage": {"stage": "COLLSCAN"}},
+            "rejectedPlans": []
+        }}
+        index_scan = {"queryPlanner": {
+            "winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "name_prefix"}},
+            "rejectedPlans": [{"stage": "COLLSCAN"}]
+        }}
+        aggregation = {"stages": [{"$cursor": {"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}}}]}
+        
+        # Act & Assert
+        assert has_collection_scan(collection_scan)
+        assert not has_collection_scan(index_scan)
+        assert has_collection_scan(aggregation)
+    
+    def test_explainable_strips_driver_fields_and_skips_exempt_queries(self):
+        """Test that session fields are removed and intentional full scans are skipped"""
+        # Arrange
+        command = {"find": "categories", "filter": {"_id": "a"}, "lsid": {"id": 1}, "$db": "category_service"}
+        
+        # Act & Assert
+        assert QueryPlanInspector.explainable(command) == {"find": "categories", "filter": {"_id": "a"}}
+        assert QueryPlanInspector.explainable({"aggregate": "categories", "comment": FULL_SCAN_COMMENT}) is None
+    
+    @pytest.mark.asyncio
+    async def test_check_explains_recorded_queries(self):
+        """Test that each recorded query is explained once and collection scans are returned"""
+        # Arrange
+        inspector = QueryPlanInspector()
+        inspector.started(_started("find", {"find": "categories", "filter": {"name": "Books"}}))
+        inspector.started(_started("find", {"find": "categories", "filter": {"_id": "a"}}))
+        inspector.started(_started("insert", {"insert": "categories", "documents": []}))
+        database = Mock()
+        database.command = AsyncMock(side_effect=[
+            {"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}},
+            {"queryPlanner": {"winningPlan": {"stage": "IDHACK"}}}
+        ])
+        client = MagicMock()
+        client.__getitem__.return_value = database
+        
+        # Act
+        scans = await inspector.check(client)
+        
+        # Assert
+        assert database.command.await_count == 2
+        assert [scan.command["filter"] for scan in scans] == [{"name": "Books"}]
+        assert await inspector.check(client) == []
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from domain.entities.category import Category
+from domain.events.category_events import CategoryUpdated
+from domain.value_objects.category_id import CategoryId
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher
+
+
+class StubBroker:
+    """aio-pika stand-in: connect() -> connection -> confirm channel -> exchange"""
+    
+    def __init__(self, latency=0.0, failures=0):
+        self.latency = latency
+        self.failures = failures
+        self.connections = 0
+        self.connect_options = None
+        self.published = []
+        self.message_ids = []
+        self.confirm_channels = 0
+    
+    async def connect(self, url, **options):
+        self.connections += 1
+        self.connect_options = options
+        return self
+    
+    async def channel(self, publisher_confirms=False):
+        self.confirm_channels += int(publisher_confirms)
+        return self
+    
+    async def declare_exchange(self, name, exchange_type, durable=False):
+        return self
+    
+    async def publish(self, message, routing_key, timeout=None):
+        await asyncio.sleep(self.latency)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker went away")
+        self.published.append((routing_key, json.loads(message.body)))
+        self.message_ids.append(message.message_id)
+    
+    async def close(self):
+        pass
+
+
+class SlowChannelBroker(StubBroker):
+    """Broker that accepts connections but is slow to open a channel"""
+    
+    def __init__(self, channel_delay):
+        super().__init__()
+        self.channel_delay = channel_delay
+        self.closed = 0
+    
+    async def channel(self, publisher_confirms=False):
+        await asyncio.sleep(self.channel_delay)
+        return await super().channel(publisher_confirms)
+    
+    async def close(self):
+        self.closed += 1
+
+
+class TestRabbitMQCategoryEventPublisher:
+    """Unit tests for RabbitMQCategoryEventPublisher"""
+    
+    @pytest.fixture
+    def broker(self):
+        return StubBroker()
+    
+    @pytest_asyncio.fixture
+    async def publisher(self, broker):
+        publisher = RabbitMQCategoryEventPublisher(
+            "amqp://stub", batch_size=10, flush_interval=0.01, reconnect_initial_delay=0.01, connect=broker.connect
+        )
+        yield publisher
+        await publisher.close(timeout=1.0)
+    
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_the_broker(self, publisher, broker):
+        """Test that publishing returns before the broker confirms"""
+        # Arrange
+        broker.latency = 0.5
+        
+        # Act
+        await asyncio.wait_for(
+            publisher.publish_category_created(Category(id=CategoryId("test-id"), name="Test")), timeout=0.05
+        )
+        
+        # Assert
+        assert broker.published == []
+    
+    @pytest.mark.asyncio
+    async def test_events_are_published_in_batches_with_confirms(self, publisher, broker):
+        """Test that queued events are flushed in batches of batch_size on a confirm channel"""
+        # Arrange
+        categories = [Category(id=CategoryId(f"id-{index}"), name=f"Category {index}") for index in range(25)]
+        
+        # Act
+        await publisher.publish_categories_created(categories)
+        await publisher.flush()
+        
+        # Assert
+        assert [event["category_id"] for _, event in broker.published] == [f"id-{index}" for index in range(25)]
+        assert {routing_key for routing_key, _ in broker.published} == {"category.created"}
+        assert publisher.stats()["batches"] == 3
+        assert broker.confirm_channels == 1
+    
+    @pytest.mark.asyncio
+    async def test_connection_uses_configured_timeout_and_heartbeat(self, broker):
+        """Test that the connection is opened with the connect timeout and heartbeat"""
+        # Arrange
+        publisher = RabbitMQCategoryEventPublisher(
+            "amqp://stub", flush_interval=0.0, connect_timeout=2.5, heartbeat=15, connect=broker.connect
+        )
+        
+        # Act
+        await publisher.publish_category_deleted(CategoryId("test-id"))
+        await publisher.flush()
+        
+        # Assert
+        assert broker.connect_options == {"timeout": 2.5, "heartbeat": 15}
+        assert publisher.stats()["connected"] == 1
+        await publisher.close(timeout=1.0)
+    
+    @pytest.mark.asyncio
+    async def test_connect_opens_connection_once(self, publisher, broker):
+        """Test that connect opens the connection ahead of publishing and reuses it afterwards"""
+        # Act
+        await publisher.connect()
+        await publisher.connect()
+        await publisher.publish_category_deleted(CategoryId("test-id"))
+        await publisher.flush()
+        
+        # Assert
+        assert broker.connections == 1
+        assert len(broker.published) == 1
+    
+    @pytest.mark.asyncio
+    async def test_publish_events_keeps_event_ids(self, publisher, broker):
+        """Test that relayed events are sent with their own event id as message_id"""
+        # Arrange
+        event = CategoryUpdated(CategoryId("test-id"), "Test", None)
+        
+        # Act
+        await publisher.publish_events([event])
+        await publisher.flush()
+        
+        # Assert
+        assert broker.published[0][0] == "category.updated"
+        assert broker.published[0][1]["event_id"] == event.event_id
+        assert broker.message_ids == [event.event_id]
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_resent_after_reconnect(self, publisher, broker):
+        """Test that a broker failure does not lose the unconfirmed events"""
+        # Arrange
+        broker.failures = 1
+        
+        # Act
+        await publisher.publish_category_deleted(CategoryId("test-id"))
+        await asyncio.wait_for(publisher.flush(), timeout=1.0)
+        
+        # Assert
+        assert [(routing_key, event["category_id"]) for routing_key, event in broker.published] == [
+            ("category.deleted", "test-id")
+        ]
+        assert broker.connections == 2
+        assert publisher.stats()["reconnects"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self, broker):
+        """Test that publishers wait once max_queue_size events are pending"""
+        # Arrange
+        broker.latency = 0.2
+        publisher = RabbitMQCategoryEventPublisher(
+            "amqp://stub", max_queue_size=2, batch_size=1, flush_interval=0.0, connect=broker.connect
+        )
+        categories = [Category(id=CategoryId(f"id-{index}"), name="Category") for index in range(4)]
+        
+        # Act & Assert
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(publisher.publish_categories_created(categories), timeout=0.05)
+        await publisher.close(timeout=0.0)
+    
+    @pytest.mark.asyncio
+    async def test_connect_cancelled_after_connecting_closes_the_connection(self):
+        """Test that a connect timing out while opening the channel does not leak the connection"""
+        # Arrange
+        broker = SlowChannelBroker(channel_delay=1.0)
+        publisher = RabbitMQCategoryEventPublisher("amqp://stub", connect=broker.connect)
+        
+        # Act
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(publisher.connect(), timeout=0.01)
+        
+        # Assert
+        assert broker.connections == broker.closed == 3
+        assert publisher.stats()["connected"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_check_does_not_open_a_connection(self, publisher, broker):
+        """Test that the readiness check only inspects the current connection"""
+        # Act
+        with pytest.raises(ConnectionError):
+            await publisher.check()
+        await publisher.connect()
+        await publisher.check()
+        
+        # Assert
+        assert broker.connections == 1
@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+from infrastructure.lifecycle.readiness import ReadinessProbe
+
+
+async def _ok():
+    return None
+
+
+async def _fail():
+    raise ConnectionError("connection refused")
+
+
+async def _hang():
+    await asyncio.sleep(10)
+
+
+class TestReadinessProbe:
+    """Unit tests for ReadinessProbe"""
+    
+    @pytest.mark.asyncio
+    async def test_not_ready_until_warm_up_finished(self):
+        """Test that healthy backends are not enough before mark_ready"""
+        # Arrange
+        probe = ReadinessProbe({"mongodb": _ok}, required=("mongodb",))
+        
+        # Act
+        before, _ = await probe.check()
+        probe.mark_ready()
+        after, backends = await probe.check()
+        
+        # Assert
+        assert before is False
+        assert after is True
+        assert backends["mongodb"].ok
+    
+    @pytest.mark.asyncio
+    async def test_optional_backend_failure_keeps_worker_ready(self):
+        """Test that only required backends decide readiness, while every failure is reported"""
+        # Arrange
+        probe = ReadinessProbe({"mongodb": _ok, "redis": _fail}, required=("mongodb",))
+        probe.mark_ready()
+        
+        # Act
+        ready, backends = await probe.check()
+        
+        # Assert
+        assert ready is True
+        assert not backends["redis"].ok
+        assert backends["redis"].error == "ConnectionError: connection refused"
+    
+    @pytest.mark.asyncio
+    async def test_hanging_required_backend_fails_within_timeout(self):
+        """Test that a backend that does not answer is reported after the timeout"""
+        # Arrange
+        probe = ReadinessProbe({"mongodb": _hang}, required=("mongodb",), timeout=0.05)
+        probe.mark_ready()
+        
+        # Act
+        ready, backends = await asyncio.wait_for(probe.check(), timeout=1.0)
+        
+        # Assert
+        assert ready is False
+        assert backends["mongodb"].error == "No answer within 0.05s"
+    
+    @pytest.mark.asyncio
+    async def test_mark_not_ready_takes_worker_out_of_rotation(self):
+        """Test that a worker marked not ready reports so even with healthy backends"""
+        # Arrange
+        probe = ReadinessProbe({"mongodb": _ok}, required=("mongodb",))
+        probe.mark_ready()
+        
+        # Act
+        probe.mark_not_ready()
+        ready, _ = await probe.check()
+        
+        # Assert
+        assert ready is False
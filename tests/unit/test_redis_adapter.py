@@ -0,0 +1,273 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.serialization.codecs import MsgpackCodec, OrjsonCodec
+
+
+class FakePipeline:
+    """Records queued commands and returns preset replies on execute()"""
+    
+    def __init__(self, replies):
+        self.replies = replies
+        self.commands = []
+    
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+    
+    async def execute(self):
+        return self.replies
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestRedisCacheAdapter:
+    """Unit tests for RedisCacheAdapter"""
+    
+    @pytest.fixture
+    def settings(self):
+        return Settings(
+            redis_max_connections=7, redis_pool_timeout=0.5, redis_socket_timeout=1.5, redis_socket_connect_timeout=0.8
+        )
+    
+    @pytest.fixture
+    def adapter(self, settings):
+        adapter = RedisCacheAdapter(settings)
+        adapter.client = AsyncMock()
+        return adapter
+    
+    def test_connection_pool_is_configured_from_settings(self, settings):
+        """Test that the connection pool size and wait timeout come from Settings"""
+        # Act
+        adapter = RedisCacheAdapter(settings)
+        
+        # Assert
+        assert adapter.pool.max_connections == 7
+        assert adapter.pool.timeout == 0.5
+        assert adapter.client.connection_pool is adapter.pool
+        assert adapter.pool.connection_kwargs["socket_timeout"] == 1.5
+        assert adapter.pool.connection_kwargs["socket_connect_timeout"] == 0.8
+    
+    def test_pool_stats_report_connections_in_use(self, settings):
+        """Test that pool utilization is read from the pool"""
+        # Arrange
+        adapter = RedisCacheAdapter(settings)
+        adapter.pool._in_use_connections.update({object(), object()})
+        adapter.pool._available_connections.append(object())
+        
+        # Act
+        stats = adapter.pool_stats()
+        
+        # Assert
+        assert stats == {"max_size": 7, "open": 3, "in_use": 2}
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_sends_single_del(self, adapter):
+        """Test that several keys are invalidated with one DEL command"""
+        # Arrange
+        adapter.client.delete.return_value = 2
+        
+        # Act
+        result = await adapter.delete_many("category_test-id", "all_categories")
+        
+        # Assert
+        adapter.client.delete.assert_awaited_once_with("category_test-id", "all_categories")
+        assert result == 2
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_without_keys_skips_round_trip(self, adapter):
+        """Test that an empty invalidation does not reach Redis"""
+        # Act
+        result = await adapter.delete_many()
+        
+        # Assert
+        adapter.client.delete.assert_not_called()
+        assert result == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self, adapter):
+        """Test that several keys are read with one MGET and missing keys are left out"""
+        # Arrange
+        adapter.client.mget.return_value = ['{"id": "a"}', None]
+        
+        # Act
+        result = await adapter.get_many("category_a", "category_b")
+        
+        # Assert
+        adapter.client.mget.assert_awaited_once_with(("category_a", "category_b"))
+        assert result == {"category_a": {"id": "a"}}
+    
+    @pytest.mark.asyncio
+    async def test_values_of_any_codec_are_readable(self, adapter):
+        """Test that entries written with another codec or before codecs existed still decode"""
+        # Arrange
+        adapter.client.mget.return_value = [
+            MsgpackCodec().encode({"id": "a"}),
+            OrjsonCodec().encode({"id": "b"}),
+            b'{"id": "c"}'
+        ]
+        
+        # Act
+        result = await adapter.get_many("category_a", "category_b", "category_c")
+        
+        # Assert
+        assert result == {"category_a": {"id": "a"}, "category_b": {"id": "b"}, "category_c": {"id": "c"}}
+    
+    @pytest.mark.asyncio
+    async def test_set_encodes_with_the_configured_codec(self):
+        """Test that the cache_codec setting selects the codec values are written with"""
+        # Arrange
+        adapter = RedisCacheAdapter(Settings(cache_codec="msgpack"))
+        adapter.client = AsyncMock()
+        
+        # Act
+        await adapter.set("category_a", {"id": "a"}, expire=60)
+        
+        # Assert
+        adapter.client.setex.assert_awaited_once_with("category_a", 60, MsgpackCodec().encode({"id": "a"}))
+    
+    @pytest.mark.asyncio
+    async def test_get_returns_none_on_redis_error(self, adapter):
+        """Test that cache failures degrade to a miss"""
+        # Arrange
+        adapter.client.pipeline = Mock(side_effect=ConnectionError("redis is down"))
+        
+        # Act
+        result = await adapter.get("category_test-id")
+        
+        # Assert
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_get_version_returns_none_on_redis_error(self, adapter):
+        """Test that an unreadable version is not reported as version 0"""
+        # Arrange
+        adapter.client.get = AsyncMock(side_effect=ConnectionError("redis is down"))
+        
+        # Act
+        version = await adapter.get_version("categories_version")
+        
+        # Assert
+        assert version is None
+    
+    @pytest.mark.asyncio
+    async def test_get_snapshot_decodes_entries_and_skips_marker(self, adapter):
+        """Test that a loaded snapshot is returned without its completeness marker"""
+        # Arrange
+        pipeline = FakePipeline([{
+            b"__snapshot__": b"1",
+            b"test-id": b'{"id": "test-id", "name": "Test", "description": null}'
+        }, 120500])
+        adapter.client.pipeline = Mock(return_value=pipeline)
+        
+        # Act
+        result, ttl = await adapter.get_snapshot_with_ttl("categories_snapshot")
+        
+        # Assert
+        assert pipeline.commands == [("hgetall", ("categories_snapshot",)), ("pttl", ("categories_snapshot",))]
+        assert ttl == 120.5
+        assert result == {"test-id": {"id": "test-id", "name": "Test", "description": None}}
+    
+    @pytest.mark.asyncio
+    async def test_get_snapshot_without_marker_is_a_miss(self, adapter):
+        """Test that a partially written hash is never served as the full list"""
+        # Arrange
+        adapter.client.pipeline = Mock(return_value=FakePipeline([{b"test-id": b'{"id": "test-id"}'}, 1000]))
+        
+        # Act
+        result = await adapter.get_snapshot("categories_snapshot")
+        
+        # Assert
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_write_through_runs_one_script(self, adapter):
+        """Test that a write updates the snapshot, the item key and the version in one call"""
+        # Arrange
+        adapter._write_through = AsyncMock(return_value=5)
+        
+        # Act
+        version = await adapter.write_through(
+            "categories_snapshot", "categories_version", "test-id", {"id": "test-id"}, "category_test-id", expire=300
+        )
+        
+        # Assert
+        adapter._write_through.assert_awaited_once_with(
+            keys=["categories_snapshot", "categories_version", "category_test-id"],
+            args=["test-id", b'\xffj\x01{"id":"test-id"}', 300]
+        )
+        assert version == 5
+    
+    @pytest.mark.asyncio
+    async def test_write_through_failure_drops_stale_entries_and_bumps_the_version(self, adapter):
+        """Test that a failed write-through falls back to invalidation, pages keyed by the old version included"""
+        # Arrange
+        adapter._write_through = AsyncMock(side_effect=ConnectionError("script failed"))
+        adapter.client.incr.return_value = 6
+        
+        # Act
+        version = await adapter.write_through(
+            "categories_snapshot", "categories_version", "test-id", {"id": "test-id"}, "category_test-id"
+        )
+        
+        # Assert
+        adapter.client.delete.assert_awaited_once_with("categories_snapshot", "category_test-id")
+        adapter.client.incr.assert_awaited_once_with("categories_version")
+        assert version == 6
+    
+    @pytest.mark.asyncio
+    async def test_write_through_failure_without_redis_reports_no_version(self, adapter):
+        """Test that a write-through that cannot reach Redis at all returns version 0"""
+        # Arrange
+        adapter._write_through = AsyncMock(side_effect=ConnectionError("redis is down"))
+        adapter.client.incr.side_effect = ConnectionError("redis is down")
+        
+        # Act
+        version = await adapter.write_through(
+            "categories_snapshot", "categories_version", "test-id", {"id": "test-id"}, "category_test-id"
+        )
+        
+        # Assert
+        assert version == 0
+    
+    @pytest.mark.asyncio
+    async def test_write_through_many_runs_one_script_for_the_batch(self, adapter):
+        """Test that a batch is written with a single script call and a single version bump"""
+        # Arrange
+        adapter._write_through = AsyncMock(return_value=6)
+        
+        # Act
+        version = await adapter.write_through_many("categories_snapshot", "categories_version", [
+            ("a", {"id": "a"}, "category_a"),
+            ("b", {"id": "b"}, "category_b")
+        ], expire=300)
+        
+        # Assert
+        adapter._write_through.assert_awaited_once_with(
+            keys=["categories_snapshot", "categories_version", "category_a", "category_b"],
+            args=["a", b'\xffj\x01{"id":"a"}', 300, "b", b'\xffj\x01{"id":"b"}', 300]
+        )
+        assert version == 6
+    
+    @pytest.mark.asyncio
+    async def test_remove_through_many_failure_drops_all_keys(self, adapter):
+        """Test that a failed batch removal falls back to deleting every affected key"""
+        # Arrange
+        adapter._remove_through = AsyncMock(side_effect=ConnectionError("redis is down"))
+        
+        # Act
+        await adapter.remove_through_many("categories_snapshot", "categories_version", [
+            ("a", "category_a"),
+            ("b", "category_b")
+        ])
+        
+        # Assert
+        adapter.client.delete.assert_awaited_once_with("categories_snapshot", "category_a", "category_b")
+        adapter.client.incr.assert_awaited_once_with("categories_version")
\ No newline at end of file
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import AsyncMock
+from domain.entities.category import Category
+from domain.value_objects.category_id import CategoryId
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.adapters.outbound.cache.redis_statistics_store import (
+    RedisCategoryStatisticsStore,
+    READY_KEY,
+    REVISION_KEY
+)
+
+
+class TestRedisCategoryStatisticsStore:
+    """Unit tests for RedisCategoryStatisticsStore"""
+    
+    @pytest.fixture
+    def store(self):
+        store = RedisCategoryStatisticsStore(RedisCacheAdapter(Settings()), rebuild_interval=60)
+        store.client = AsyncMock()
+        store._save = AsyncMock(return_value=1)
+        store._delete = AsyncMock(return_value=1)
+        store._read = AsyncMock()
+        store._rebuild = AsyncMock(return_value=1)
+        return store
+    
+    @pytest.mark.asyncio
+    async def test_get_statistics_is_one_script_call(self, store):
+        """Test that the statistics come from one read, without loading categories"""
+        # Arrange
+        store._read.return_value = [4, 26, "Книги".encode(), b"Electronics"]
+        
+        # Act
+        result = await store.get_statistics()
+        
+        # Assert
+        store._read.assert_awaited_once()
+        assert result == {
+            "total_count": 4,
+            "average_name_length": 6.5,
+            "longest_name": "Electronics",
+            "shortest_name": "Книги"
+        }
+    
+    @pytest.mark.asyncio
+    async def test_get_statistics_without_state_asks_for_a_rebuild(self, store):
+        """Test that a missing state is reported as None"""
+        # Arrange
+        store._read.return_value = None
+        
+        # Act & Assert
+        assert await store.get_statistics() is None
+    
+    @pytest.mark.asyncio
+    async def test_record_saved_sends_character_lengths(self, store):
+        """Test that name lengths are counted in characters, not UTF-8 bytes"""
+        # Act
+        await store.record_saved([Category(id=CategoryId("a"), name="Книги")])
+        
+        # Assert
+        assert store._save.await_args.kwargs["args"] == ["a", 5, "Книги"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_update_drops_the_state(self, store):
+        """Test that a lost update forces a rebuild instead of skewing the statistics"""
+        # Arrange
+        store._delete.side_effect = ConnectionError("redis is down")
+        
+        # Act
+        await store.record_deleted([CategoryId("a")])
+        
+        # Assert
+        store.client.delete.assert_awaited_once_with(READY_KEY)
+        store.client.incr.assert_awaited_once_with(REVISION_KEY)
+    
+    @pytest.mark.asyncio
+    async def test_rebuild_is_guarded_by_the_collection_version(self, store):
+        """Test that the rebuild commits only for the version read before loading"""
+        # Arrange
+        store.client.get.return_value = b"7"
+        categories = [Category(id=CategoryId("a"), name="Books")]
+        load = AsyncMock(return_value=categories)
+        
+        # Act
+        result = await store.rebuild(load)
+        
+        # Assert
+        assert result == categories
+        assert store._rebuild.await_args.kwargs["args"] == [7, 60, "a", 5, "Books"]
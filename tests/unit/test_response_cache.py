@@ -0,0 +1,188 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import HTTPException, Request, Response
+from domain.value_objects.category_id import CategoryId
+from application.use_cases.category_statistics_use_case import CategoryStatisticsUseCase
+from application.use_cases.category_write_use_case import CategoryWriteUseCase
+from infrastructure.adapters.inbound.rest.http_cache import ResponseCache
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache
+
+
+def make_request(path="/categories/", query="", headers=None):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    })
+
+
+class TestResponseCache:
+    """Unit tests for ResponseCache"""
+    
+    @pytest.fixture
+    def version(self):
+        return {"value": 1}
+    
+    @pytest.fixture
+    def response_cache(self, version):
+        async def version_source():
+            return version["value"]
+        return ResponseCache(LocalCache(), version_source, max_age=10)
+    
+    @pytest.fixture
+    def renders(self):
+        return []
+    
+    @pytest.fixture
+    def render(self, renders):
+        async def render():
+            renders.append(1)
+            return Response(content=b'[{"id":"a"}]', media_type="application/json", headers={"X-Next-Cursor": "a"})
+        return render
+    
+    @pytest.mark.asyncio
+    async def test_repeat_request_is_served_without_rendering(self, response_cache, render, renders):
+        """Test that the body is encoded once per collection version"""
+        # Act
+        first = await response_cache.respond(make_request(), render)
+        second = await response_cache.respond(make_request(), render)
+        
+        # Assert
+        assert len(renders) == 1
+        assert second.body == first.body == b'[{"id":"a"}]'
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["X-Next-Cursor"] == "a"
+        assert second.headers["Cache-Control"] == "public, max-age=10, must-revalidate"
+    
+    @pytest.mark.asyncio
+    async def test_matching_if_none_match_returns_304(self, response_cache, render):
+        """Test that a client holding the current ETag gets an empty 304"""
+        # Arrange
+        etag = (await response_cache.respond(make_request(), render)).headers["ETag"]
+        
+        # Act
+        response = await response_cache.respond(make_request(headers={"If-None-Match": f'"other", W/{etag}'}), render)
+        
+        # Assert
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+    
+    @pytest.mark.asyncio
+    async def test_unknown_version_is_not_cached(self, response_cache, render, renders, version):
+        """Test that responses are rendered every time while the version cannot be read"""
+        # Arrange
+        version["value"] = None
+        
+        # Act
+        first = await response_cache.respond(make_request(), render)
+        await response_cache.respond(make_request(), render)
+        
+        # Assert
+        assert len(renders) == 2
+        assert "ETag" not in first.headers
+    
+    @pytest.mark.asyncio
+    async def test_write_makes_cached_bodies_unreachable(self, response_cache, render, renders, version):
+        """Test that a new collection version renders the response again"""
+        # Arrange
+        await response_cache.respond(make_request(), render)
+        
+        # Act
+        version["value"] = 2
+        await response_cache.respond(make_request(), render)
+        
+        # Assert
+        assert len(renders) == 2
+    
+    @pytest.mark.asyncio
+    async def test_query_string_is_part_of_the_key(self, response_cache, render, renders):
+        """Test that different pages are cached separately"""
+        # Act
+        await response_cache.respond(make_request(query="limit=1"), render)
+        await response_cache.respond(make_request(query="limit=2"), render)
+        
+        # Assert
+        assert len(renders) == 2
+    
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, response_cache, renders):
+        """Test that a failed render is retried on the next request"""
+        # Arrange
+        async def render():
+            renders.append(1)
+            raise HTTPException(status_code=404, detail="Category not found")
+        
+        # Act
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await response_cache.respond(make_request("/categories/missing"), render)
+        
+        # Assert
+        assert len(renders) == 2
+    
+    @pytest.mark.asyncio
+    async def test_unknown_revision_is_not_cached(self, response_cache, render, renders):
+        """Test that responses are rendered every time while the revision cannot be read"""
+        # Arrange
+        async def revision_source():
+            return None
+        
+        # Act
+        await response_cache.respond(make_request(), render, revision_source)
+        await response_cache.respond(make_request(), render, revision_source)
+        
+        # Assert
+        assert len(renders) == 2
+    
+    @pytest.mark.asyncio
+    async def test_statistics_read_before_the_store_update_are_not_served_after_it(self):
+        """Test that statistics read between the repository write and the store update go stale with the update"""
+        # Arrange
+        state = {"version": 1, "revision": 1, "total_count": 1}
+        store = AsyncMock()
+        store.get_statistics.side_effect = lambda: {"total_count": state["total_count"]}
+        store.get_revision.side_effect = lambda: state["revision"]
+        
+        async def record_saved(categories):
+            state["total_count"] += len(categories)
+            state["revision"] += 1
+        
+        store.record_saved.side_effect = record_saved
+        statistics_use_case = CategoryStatisticsUseCase(AsyncMock(), statistics_store=store)
+        
+        async def version_source():
+            return state["version"]
+        
+        response_cache = ResponseCache(LocalCache(), version_source)
+        
+        async def read_statistics():
+            async def render():
+                statistics = await statistics_use_case.get_category_statistics()
+                return Response(content=str(statistics["total_count"]).encode())
+            return await response_cache.respond(
+                make_request("/categories/statistics"), render, statistics_use_case.get_statistics_revision
+            )
+        
+        between = []
+        
+        async def create(category):
+            # CachedCategoryRepository bumps the collection version together with the write
+            category.id = CategoryId("a")
+            state["version"] += 1
+            between.append(await read_statistics())
+            return category
+        
+        repository = AsyncMock()
+        repository.create.side_effect = create
+        write_use_case = CategoryWriteUseCase(repository, statistics_store=store)
+        
+        # Act
+        await write_use_case.create_category("Books")
+        after = await read_statistics()
+        
+        # Assert
+        assert between[0].body == b"1"
+        assert after.body == b"2"
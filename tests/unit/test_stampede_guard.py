@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from infrastructure.adapters.outbound.cache.stampede_guard import StampedeGuard
+
+
+class TestStampedeGuard:
+    """Unit tests for StampedeGuard"""
+    
+    @pytest.fixture
+    def cache_adapter(self):
+        cache_adapter = AsyncMock()
+        cache_adapter.acquire_lock.return_value = "lock-token"
+        return cache_adapter
+    
+    @pytest.fixture
+    def guard(self, cache_adapter):
+        return StampedeGuard(cache_adapter, lock_ttl=1.0, poll_interval=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_backend_call(self, guard, cache_adapter):
+        """Test that concurrent misses of one key are coalesced into a single computation"""
+        # Arrange
+        calls = 0
+        
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+        
+        # Act
+        results = await asyncio.gather(*(guard.load("key", compute) for _ in range(100)))
+        
+        # Assert
+        assert calls == 1
+        assert results == ["value"] * 100
+        cache_adapter.acquire_lock.assert_awaited_once_with("lock:key", 1.0)
+        cache_adapter.release_lock.assert_awaited_once_with("lock:key", "lock-token")
+        assert not guard.is_in_flight("key")
+    
+    @pytest.mark.asyncio
+    async def test_load_waits_for_other_worker_instead_of_computing(self, guard, cache_adapter):
+        """Test that a worker without the lock polls the cache for the lock holder's result"""
+        # Arrange
+        cache_adapter.acquire_lock.return_value = None
+        compute = AsyncMock(return_value="computed")
+        read_cached = AsyncMock(side_effect=[None, "from other worker"])
+        
+        # Act
+        result = await guard.load("key", compute, read_cached=read_cached)
+        
+        # Assert
+        assert result == "from other worker"
+        compute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_load_takes_over_when_lock_is_released_without_value(self, guard, cache_adapter):
+        """Test that waiters stop polling once the lock holder is gone"""
+        # Arrange
+        cache_adapter.acquire_lock.side_effect = [None, "lock-token"]
+        compute = AsyncMock(return_value=None)
+        read_cached = AsyncMock(return_value=None)
+        
+        # Act
+        result = await guard.load("key", compute, read_cached=read_cached)
+        
+        # Assert
+        assert result is None
+        compute.assert_awaited_once()
+        cache_adapter.release_lock.assert_awaited_once_with("lock:key", "lock-token")
+    
+    @pytest.mark.asyncio
+    async def test_failed_load_propagates_to_all_waiters(self, guard):
+        """Test that a backend error reaches every coalesced caller and is not cached"""
+        # Arrange
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("mongo is down")
+        
+        # Act
+        results = await asyncio.gather(*(guard.load("key", compute) for _ in range(3)), return_exceptions=True)
+        
+        # Assert
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert not guard.is_in_flight("key")
+    
+    def test_should_refresh_early_only_close_to_expiry(self, guard):
+        """Test the XFetch decision against the remaining TTL"""
+        # Arrange: -delta * beta * ln(1 - 0.5) = 0.05 * 0.693 ~= 0.035s
+        with patch("infrastructure.adapters.outbound.cache.stampede_guard.random.random", return_value=0.5):
+            # Act & Assert
+            assert guard.should_refresh_early("key", 0.01) is True
+            assert guard.should_refresh_early("key", 60.0) is False
+            assert guard.should_refresh_early("key", None) is False
+    
+    @pytest.mark.asyncio
+    async def test_refresh_early_serves_stale_when_lock_is_taken(self, guard, cache_adapter):
+        """Test that only the lock holder rebuilds an entry early"""
+        # Arrange
+        cache_adapter.acquire_lock.return_value = None
+        compute = AsyncMock(return_value="fresh")
+        
+        # Act
+        result = await guard.refresh_early("key", compute)
+        
+        # Assert
+        assert result is None
+        compute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_refresh_early_returns_fresh_value_for_lock_holder(self, guard, cache_adapter):
+        """Test that the elected caller recomputes and releases the lock"""
+        # Arrange
+        compute = AsyncMock(return_value="fresh")
+        
+        # Act
+        result = await guard.refresh_early("key", compute)
+        
+        # Assert
+        assert result == "fresh"
+        cache_adapter.release_lock.assert_awaited_once_with("lock:key", "lock-token")
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, Mock
+from infrastructure.adapters.outbound.cache.local_cache import LocalCache
+from infrastructure.adapters.outbound.cache.tiered_cache_adapter import TieredCacheAdapter
+
+
+class IdlePubSub:
+    """Pub/sub stand-in that subscribes successfully and never delivers a message"""
+    
+    async def subscribe(self, channel):
+        pass
+    
+    async def listen(self):
+        await asyncio.Event().wait()
+        yield
+    
+    async def aclose(self):
+        pass
+
+
+class TestTieredCacheAdapter:
+    """Unit tests for TieredCacheAdapter"""
+    
+    @pytest.fixture
+    def redis_adapter(self):
+        redis_adapter = AsyncMock()
+        redis_adapter.pubsub = Mock(side_effect=IdlePubSub)
+        return redis_adapter
+    
+    @pytest_asyncio.fixture
+    async def adapter(self, redis_adapter):
+        adapter = TieredCacheAdapter(redis_adapter, LocalCache(max_size=10, ttl=30.0), "invalidation")
+        yield adapter
+        await adapter.close()
+    
+    @pytest.mark.asyncio
+    async def test_get_serves_repeated_reads_from_local_cache(self, adapter, redis_adapter):
+        """Test that only the first read reaches Redis"""
+        # Arrange
+        redis_adapter.get_with_ttl.return_value = ({"id": "test-id"}, 120.0)
+        
+        # Act
+        first = await adapter.get("category_test-id")
+        second = await adapter.get("category_test-id")
+        
+        # Assert
+        assert first == second == {"id": "test-id"}
+        redis_adapter.get_with_ttl.assert_awaited_once_with("category_test-id")
+        assert adapter.stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_delete_many_evicts_locally_and_broadcasts(self, adapter, redis_adapter):
+        """Test that invalidation drops L1 entries, deletes from Redis and notifies other workers"""
+        # Arrange
+        await adapter.set("category_test-id", {"id": "test-id"}, expire=300)
+        
+        # Act
+        await adapter.delete_many("category_test-id", "all_categories")
+        
+        # Assert
+        assert adapter.local_cache.get("category_test-id") is None
+        redis_adapter.delete_many.assert_awaited_once_with("category_test-id", "all_categories")
+        channel, message = redis_adapter.publish.await_args.args
+        assert channel == "invalidation"
+        assert json.loads(message) == {
+            "origin": adapter.instance_id,
+            "keys": ["category_test-id", "all_categories"],
+            "version": None
+        }
+    
+    def test_handle_invalidation_from_other_worker_evicts_keys(self, adapter):
+        """Test that a message from another worker evicts the listed keys"""
+        # Arrange
+        adapter.local_cache.set("category_test-id", {"id": "test-id"})
+        
+        # Act
+        adapter.handle_invalidation(json.dumps({"origin": "other-worker", "keys": ["category_test-id"]}))
+        
+        # Assert
+        assert adapter.local_cache.get("category_test-id") is None
+    
+    def test_handle_invalidation_ignores_own_messages(self, adapter):
+        """Test that a worker does not react to its own broadcast"""
+        # Arrange
+        adapter.local_cache.set("category_test-id", {"id": "test-id"})
+        
+        # Act
+        adapter.handle_invalidation(json.dumps({"origin": adapter.instance_id, "keys": ["category_test-id"]}))
+        
+        # Assert
+        assert adapter.local_cache.get("category_test-id") == {"id": "test-id"}
+    
+    @pytest.mark.asyncio
+    async def test_write_through_evicts_local_snapshot(self, adapter, redis_adapter):
+        """Test that a local write drops the L1 copies so the next read sees the new state"""
+        # Arrange
+        adapter.local_cache.set("categories_snapshot", {"test-id": {"id": "test-id", "name": "Old"}})
+        redis_adapter.write_through.return_value = 3
+        
+        # Act
+        version = await adapter.write_through(
+            "categories_snapshot", "categories_version", "test-id", {"id": "test-id", "name": "New"}, "category_test-id"
+        )
+        
+        # Assert
+        assert version == 3
+        assert adapter.local_cache.get("categories_snapshot") is None
+        redis_adapter.publish.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_write_through_many_broadcasts_the_changed_fields(self, adapter, redis_adapter):
+        """Test that a snapshot write tells the other workers which fields it wrote"""
+        # Arrange
+        redis_adapter.write_through_many.return_value = 4
+        
+        # Act
+        await adapter.write_through_many(
+            "categories_snapshot", "categories_version", [("a", {"id": "a", "name": "A"}, "category_a")]
+        )
+        
+        # Assert
+        _, message = redis_adapter.publish.await_args.args
+        assert json.loads(message)["changes"] == {
+            "key": "categories_snapshot", "written": {"a": {"id": "a", "name": "A"}}, "removed": []
+        }
+    
+    def test_handle_invalidation_passes_other_workers_changes_to_listeners(self, adapter):
+        """Test that change listeners receive the snapshot fields another worker changed, with its version"""
+        # Arrange
+        listener = Mock()
+        adapter.on_change(listener)
+        
+        # Act
+        adapter.handle_invalidation(json.dumps({
+            "origin": "other-worker",
+            "keys": ["categories_snapshot", "category_a"],
+            "version": 7,
+            "changes": {"key": "categories_snapshot", "written": {}, "removed": ["a"]}
+        }))
+        
+        # Assert
+        listener.assert_called_once_with("categories_snapshot", 7, {}, ["a"])
+    
+    @pytest.mark.asyncio
+    async def test_get_many_sends_only_local_misses_to_redis(self, adapter, redis_adapter):
+        """Test that L1 hits are served locally and the rest are fetched with one MGET"""
+        # Arrange
+        adapter.local_cache.set("category_a", {"id": "a"})
+        redis_adapter.get_many.return_value = {"category_b": {"id": "b"}}
+        
+        # Act
+        result = await adapter.get_many("category_a", "category_b", "category_c")
+        
+        # Assert
+        redis_adapter.get_many.assert_awaited_once_with("category_b", "category_c")
+        assert result == {"category_a": {"id": "a"}, "category_b": {"id": "b"}}
+        assert adapter.local_cache.get("category_b") == {"id": "b"}    
+    @pytest.mark.asyncio
+    async def test_read_in_flight_during_eviction_does_not_refill_local_cache(self, adapter, redis_adapter):
+        """Test that a Redis read completing after an eviction of its key is not stored in L1"""
+        # Arrange
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+        
+        async def slow_get_with_ttl(key):
+            read_started.set()
+            await release_read.wait()
+            return {"id": "test-id", "name": "Old"}, 120.0
+        
+        redis_adapter.get_with_ttl.side_effect = slow_get_with_ttl
+        read = asyncio.create_task(adapter.get_with_ttl("category_test-id"))
+        await read_started.wait()
+        
+        # Act
+        adapter.handle_invalidation(json.dumps({"origin": "other-worker", "keys": ["category_test-id"]}))
+        release_read.set()
+        value, _ = await read
+        
+        # Assert
+        assert value == {"id": "test-id", "name": "Old"}
+        assert adapter.local_cache.get("category_test-id") is None
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_read_in_flight_during_clear_does_not_refill_local_cache(self, adapter, redis_adapter):
+        """Test that a snapshot read completing after a full invalidation is not stored in L1"""
+        # Arrange
+        release_read = asyncio.Event()
+        
+        async def slow_get_snapshot_with_ttl(key):
+            await release_read.wait()
+            return {"test-id": {"id": "test-id"}}, 120.0
+        
+        redis_adapter.get_snapshot_with_ttl.side_effect = slow_get_snapshot_with_ttl
+        read = asyncio.create_task(adapter.get_snapshot_with_ttl("categories_snapshot"))
+        await asyncio.sleep(0)
+        
+        # Act
+        await adapter.flush()
+        release_read.set()
+        await read
+        
+        # Assert
+        assert adapter.local_cache.get("categories_snapshot") is None
+    
+    @pytest.mark.asyncio
+    async def test_read_without_concurrent_eviction_is_stored(self, adapter, redis_adapter):
+        """Test that an eviction of another key does not stop a read from filling L1"""
+        # Arrange
+        redis_adapter.get_with_ttl.return_value = ({"id": "a"}, 120.0)
+        adapter.handle_invalidation(json.dumps({"origin": "other-worker", "keys": ["category_b"]}))
+        
+        # Act
+        await adapter.get_with_ttl("category_a")
+        
+        # Assert
+        assert adapter.local_cache.get("category_a") == {"id": "a"}
+    
+    @pytest.mark.asyncio
+    async def test_version_ahead_of_received_invalidations_clears_local_cache(self, adapter, redis_adapter):
+        """Test that L1 is dropped when Redis reports a write whose invalidation has not arrived yet"""
+        # Arrange
+        redis_adapter.get_version.return_value = 4
+        await adapter.get_version("categories_version")
+        adapter.local_cache.set("categories_snapshot", {"test-id": {"id": "test-id", "name": "Old"}})
+        redis_adapter.get_version.return_value = 5
+        
+        # Act
+        version = await adapter.get_version("categories_version")
+        
+        # Assert
+        assert version == 5
+        assert adapter.local_cache.get("categories_snapshot") is None
+    
+    @pytest.mark.asyncio
+    async def test_version_covered_by_received_invalidations_keeps_local_cache(self, adapter, redis_adapter):
+        """Test that L1 survives a version read once the matching invalidations have been applied"""
+        # Arrange
+        redis_adapter.get_version.return_value = 4
+        await adapter.get_version("categories_version")
+        adapter.handle_invalidation(json.dumps({"origin": "other-worker", "keys": ["category_a"], "version": 6}))
+        adapter.handle_invalidation(json.dumps({"origin": "other-worker", "keys": ["category_b"], "version": 5}))
+        adapter.local_cache.set("category_c", {"id": "c"})
+        redis_adapter.get_version.return_value = 6
+        
+        # Act
+        await adapter.get_version("categories_version")
+        
+        # Assert
+        assert adapter.local_cache.get("category_c") == {"id": "c"}
+    
+    @pytest.mark.asyncio
+    async def test_unreadable_version_is_reported_as_none(self, adapter, redis_adapter):
+        """Test that a Redis failure is not mistaken for version 0"""
+        # Arrange
+        redis_adapter.get_version.return_value = None
+        adapter.local_cache.set("category_c", {"id": "c"})
+        
+        # Act
+        version = await adapter.get_version("categories_version")
+        
+        # Assert
+        assert version is None
+        assert adapter.local_cache.get("category_c") == {"id": "c"}
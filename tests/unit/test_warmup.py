@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import AsyncMock
+from infrastructure.config.settings import Settings
+from infrastructure.adapters.outbound.database.mongodb.category_repository_impl import MongoCategoryRepository
+from infrastructure.adapters.outbound.cache.redis_adapter import RedisCacheAdapter
+from infrastructure.adapters.outbound.cache.cached_category_repository import CachedCategoryRepository
+from infrastructure.adapters.outbound.message_bus.rabbitmq_publisher import RabbitMQCategoryEventPublisher
+from infrastructure.lifecycle.readiness import ReadinessProbe
+from infrastructure.lifecycle.warmup import warm_up
+
+
+class StubContainer:
+    """Dishka container stand-in: get(type) returns a fixed instance"""
+    
+    def __init__(self, instances):
+        self.instances = instances
+        self.resolved = []
+    
+    async def get(self, dependency_type):
+        self.resolved.append(dependency_type)
+        return self.instances.get(dependency_type, AsyncMock())
+
+
+class TestWarmUp:
+    """Unit tests for the startup warm-up"""
+    
+    @pytest.fixture
+    def instances(self):
+        return {
+            MongoCategoryRepository: AsyncMock(),
+            RedisCacheAdapter: AsyncMock(),
+            CachedCategoryRepository: AsyncMock(),
+            RabbitMQCategoryEventPublisher: AsyncMock(),
+            ReadinessProbe: ReadinessProbe({})
+        }
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_and_marks_ready(self, instances):
+        """Test that every backend is connected, indexes created and the worker marked ready"""
+        # Arrange
+        settings = Settings(mongodb_min_pool_size=5, redis_min_connections=3)
+        
+        # Act
+        await warm_up(StubContainer(instances), settings)
+        
+        # Assert
+        instances[MongoCategoryRepository].ensure_indexes.assert_awaited_once()
+        instances[MongoCategoryRepository].warm_up.assert_awaited_once_with(5)
+        instances[RedisCacheAdapter].warm_up.assert_awaited_once_with(3)
+        instances[RabbitMQCategoryEventPublisher].connect.assert_awaited_once()
+        instances[CachedCategoryRepository].warm_up.assert_not_called()
+        assert instances[ReadinessProbe].accepting
+    
+    @pytest.mark.asyncio
+    async def test_failed_step_is_skipped(self, instances):
+        """Test that an unreachable backend does not stop the warm-up"""
+        # Arrange
+        instances[RedisCacheAdapter].warm_up.side_effect = ConnectionError("Redis is down")
+        settings = Settings(warmup_preload_cache=True)
+        
+        # Act
+        await warm_up(StubContainer(instances), settings)
+        
+        # Assert
+        instances[RabbitMQCategoryEventPublisher].connect.assert_awaited_once()
+        instances[CachedCategoryRepository].warm_up.assert_awaited_once()
+        assert instances[ReadinessProbe].accepting